@@ -0,0 +1,50 @@
+"""Compression and pickle backend helpers shared by the datasets pickling
+objects, ``pickle.PickleDataset`` and ``redis.PickleDataset``.
+"""
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+
+COMPRESSION_MODULES = {"lz4": "lz4.frame", "zstd": "zstandard"}
+
+# imported backend modules, kept out of the datasets so they can be deepcopied
+BACKENDS: dict[str, ModuleType] = {}
+
+
+def import_backend(backend: str) -> ModuleType:
+    """Return the backend module ``backend``, importing it on first use,
+    e.g. in a process the dataset was copied to."""
+    if backend not in BACKENDS:
+        BACKENDS[backend] = importlib.import_module(backend)
+    return BACKENDS[backend]
+
+
+def compression_module(compression: str) -> ModuleType:
+    """Return the module implementing ``compression``."""
+    return importlib.import_module(COMPRESSION_MODULES[compression])
+
+
+def validate_compression(compression: str | None) -> None:
+    """Check that ``compression`` is supported and its package installed.
+
+    Raises:
+        ValueError: If ``compression`` is not supported.
+        ImportError: If the package implementing ``compression`` could not
+            be imported.
+    """
+    if compression is None:
+        return
+    if compression not in COMPRESSION_MODULES:
+        raise ValueError(
+            f"Unsupported compression '{compression}', "
+            f"use one of {sorted(COMPRESSION_MODULES)}."
+        )
+    try:
+        compression_module(compression)
+    except ImportError as exc:
+        raise ImportError(
+            f"Selected compression '{compression}' requires the "
+            f"'{COMPRESSION_MODULES[compression].split('.')[0]}' package. "
+            "Make sure it is installed and importable."
+        ) from exc
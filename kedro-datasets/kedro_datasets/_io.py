@@ -0,0 +1,79 @@
+"""Helpers for reading and writing files on ``fsspec`` filesystems, shared by
+the file-based datasets.
+"""
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import PurePosixPath
+from typing import IO, Any
+
+from fsspec import AbstractFileSystem
+
+
+@contextmanager
+def atomic_save(
+    fs: AbstractFileSystem, save_path: str, mode: str = "wb", **open_args: Any
+) -> Iterator[IO]:
+    """Open a file to save data to ``save_path`` without clobbering the file
+    already there if the save fails.
+
+    On the local filesystem, the data is written to a temporary file next to
+    ``save_path``, which is renamed into place once it has been written and
+    closed, or removed if writing fails. Other filesystems, such as object
+    stores, only upload the file once it is closed, so the data is written to
+    ``save_path`` directly and the file is discarded instead of closed if
+    writing fails.
+
+    Args:
+        fs: Filesystem to save the file to.
+        save_path: Path of the file to save, without protocol.
+        mode: Mode to open the file with.
+        **open_args: Extra arguments passed to ``fs.open``.
+
+    Yields:
+        The file to write the data to.
+    """
+    protocols = (fs.protocol,) if isinstance(fs.protocol, str) else fs.protocol
+    if "file" not in protocols:
+        fs_file = fs.open(save_path, mode=mode, **open_args)
+        try:
+            yield fs_file
+        except Exception:
+            fs_file.discard()
+            raise
+        fs_file.close()
+        return
+
+    path = PurePosixPath(save_path)
+    tmp_path = str(path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp"))
+    try:
+        with fs.open(tmp_path, mode=mode, **open_args) as fs_file:
+            yield fs_file
+    except Exception:
+        if fs.exists(tmp_path):
+            fs.rm_file(tmp_path)
+        raise
+    # a single file operation, as ``mv`` expands glob characters in paths
+    fs.mv_file(tmp_path, save_path)
+
+
+def supports_glob(protocol: str) -> bool:
+    """Whether paths on the filesystem of ``protocol`` can be globbed. Paths of
+    http(s) URLs cannot, as their query strings may contain glob characters.
+    """
+    return protocol not in ("http", "https")
+
+
+def is_glob(protocol: str, path: str) -> bool:
+    """Whether ``path`` is a glob pattern on the filesystem of ``protocol``.
+
+    Args:
+        protocol: Protocol of the filesystem of the path.
+        path: Path without protocol.
+
+    Returns:
+        True if ``path`` contains glob characters and can be globbed.
+    """
+    return supports_glob(protocol) and any(char in path for char in "*?[")
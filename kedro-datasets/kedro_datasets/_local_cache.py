@@ -0,0 +1,218 @@
+"""A local read-through cache for files on remote ``fsspec`` filesystems,
+shared by the file-based datasets through the ``cache`` key of ``fs_args``.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Iterable
+from pathlib import Path, PurePosixPath
+from typing import IO, Any
+
+from fsspec import AbstractFileSystem
+from fsspec.implementations.local import LocalFileSystem
+from kedro.io.core import DatasetError
+
+
+def user_cache_dir(name: str) -> Path:
+    """Return the directory ``name`` in the cache directory of the current
+    user, e.g. ``~/.cache/kedro-datasets/<name>`` on Linux.
+    """
+    if sys.platform == "win32":  # pragma: no cover
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":  # pragma: no cover
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "kedro-datasets" / name
+
+
+def ensure_private_dir(path: Path) -> None:
+    """Create the directory ``path`` accessible only to the current user if it
+    doesn't exist, and check that it is owned by the current user.
+
+    Files read from a cache directory are trusted, e.g. unpickled, so a
+    directory which another user could have planted files in is refused.
+
+    Raises:
+        DatasetError: If ``path`` is owned by another user.
+    """
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if hasattr(os, "getuid") and path.stat().st_uid != os.getuid():
+        raise DatasetError(
+            f"Refusing to use cache directory '{path}', as it is not owned by "
+            f"the current user."
+        )
+
+
+def mark_used(entry: Path) -> None:
+    """Record that the cache entry ``entry`` was just used, keeping its
+    modification time.
+
+    The access time is set explicitly for ``evict_lru``, as file systems
+    mounted with ``noatime`` do not update it on reads.
+    """
+    os.utime(entry, (time.time(), entry.stat().st_mtime))
+
+
+def evict_lru(entries: Iterable[Path], max_size: int, keep: Path | None = None) -> None:
+    """Remove the least recently used of the cache entries ``entries`` until
+    their total size is at most ``max_size`` bytes.
+
+    Entries removed by another process sharing the cache in the meantime are
+    skipped.
+
+    Args:
+        entries: Files in the cache directory.
+        max_size: Size in bytes beyond which entries are evicted.
+        keep: Entry which is counted in the total size, but never evicted.
+    """
+    stats = []
+    for entry in entries:
+        if entry == keep:
+            continue
+        try:
+            stats.append((entry.stat(), entry))
+        except FileNotFoundError:
+            continue
+    total = sum(stat.st_size for stat, _ in stats)
+    if keep is not None:
+        total += keep.stat().st_size
+    for stat, entry in sorted(stats, key=lambda item: item[0].st_atime):
+        if total <= max_size:
+            break
+        try:
+            entry.unlink()
+        except FileNotFoundError:  # pragma: no cover
+            pass
+        except OSError:  # pragma: no cover
+            # still open by another process on Windows
+            continue
+        total -= stat.st_size
+
+
+DEFAULT_CACHE_DIR = user_cache_dir("fs")
+
+# fields of ``AbstractFileSystem.info`` which change when an object is modified
+_VERSION_FIELDS = (
+    "ETag",
+    "etag",
+    "md5Hash",
+    "LastModified",
+    "last_modified",
+    "updated",
+    "mtime",
+    "created",
+)
+
+
+class CachedFileSystem:
+    """Filesystem proxy which serves reads from copies of the remote files
+    kept in a local directory, and forwards everything else to the wrapped
+    filesystem.
+
+    Cached copies are content-addressed: they are named after a hash of the
+    path and the object's etag, modification time and size, so a modified
+    object is downloaded again on its next read. Copies are downloaded to a
+    temporary file and renamed, so the cache can be shared by several
+    processes, and the least recently used copies are evicted once the cache
+    grows beyond ``max_size`` bytes.
+    """
+
+    def __init__(
+        self,
+        fs: AbstractFileSystem,
+        path: str | os.PathLike | None = None,
+        max_size: int | None = None,
+    ) -> None:
+        """Creates a new ``CachedFileSystem``.
+
+        Args:
+            fs: The filesystem to cache the files of.
+            path: Local directory in which to keep the cached copies, which
+                must be owned by the current user. Defaults to a directory in
+                the user's cache directory, e.g. ``~/.cache/kedro-datasets/fs``.
+            max_size: Size of the cache in bytes beyond which the least
+                recently used copies are evicted. Unbounded by default.
+        """
+        self.fs = fs
+        self._path = Path(path or DEFAULT_CACHE_DIR)
+        self._max_size = max_size
+        self._checked_path = False
+
+    def __getattr__(self, name: str) -> Any:
+        # ``fs`` and special attributes are not forwarded, as copying and
+        # unpickling look them up before ``fs`` is set, which would recurse
+        if name == "fs" or (name.startswith("__") and name.endswith("__")):
+            raise AttributeError(name)
+        return getattr(self.fs, name)
+
+    def open(self, path: str, mode: str = "rb", **kwargs) -> IO:
+        """Open a file, reading it from the local cache if opened for reading."""
+        if "r" not in mode or "+" in mode:
+            return self.fs.open(path, mode=mode, **kwargs)
+        return LocalFileSystem().open(self.fetch(path), mode=mode, **kwargs)
+
+    def fetch(self, path: str) -> str:
+        """Return the path of the local copy of ``path``, downloading it
+        first if it is not cached or has changed since it was cached."""
+        if not self._checked_path:
+            ensure_private_dir(self._path)
+            self._checked_path = True
+
+        info = self.fs.info(path)
+        version = [info.get(field) for field in _VERSION_FIELDS] + [info.get("size")]
+        key = hashlib.sha256(
+            json.dumps([self.fs.protocol, path, version], default=str).encode("utf-8")
+        ).hexdigest()
+        # keep the suffixes, so that readers can infer the format and compression
+        entry = self._path / f"{key}{''.join(PurePosixPath(path).suffixes)}"
+
+        try:
+            entry.stat()
+        except FileNotFoundError:
+            self._download(path, entry)
+        else:
+            mark_used(entry)
+        return str(entry)
+
+    def _download(self, path: str, entry: Path) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self._path, suffix=".tmp")
+        os.close(fd)
+        try:
+            self.fs.get_file(path, tmp_path)
+            os.replace(tmp_path, entry)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self._evict(keep=entry)
+
+    def _evict(self, keep: Path) -> None:
+        if self._max_size is None:
+            return
+        entries = (entry for entry in self._path.iterdir() if entry.suffix != ".tmp")
+        evict_lru(entries, self._max_size, keep=keep)
+
+
+def cached_filesystem(
+    fs: AbstractFileSystem, cache: bool | dict[str, Any] | None
+) -> AbstractFileSystem | CachedFileSystem:
+    """Wrap ``fs`` in a ``CachedFileSystem`` configured by ``cache``, unless
+    caching is disabled or ``fs`` is the local filesystem.
+
+    Args:
+        fs: The filesystem to cache the files of.
+        cache: True to cache files with the default settings, or the
+            arguments of ``CachedFileSystem``.
+
+    Returns:
+        The filesystem to read the dataset's files with.
+    """
+    protocols = (fs.protocol,) if isinstance(fs.protocol, str) else fs.protocol
+    if not cache or "file" in protocols:
+        return fs
+    return CachedFileSystem(fs, **(cache if isinstance(cache, dict) else {}))
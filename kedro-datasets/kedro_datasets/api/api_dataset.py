@@ -2,13 +2,33 @@
 It uses the python requests library: https://requests.readthedocs.io/en/latest/
 """
 import json as json_  # make pylint happy
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from typing import Any, Union
+from itertools import chain, count, islice
+from typing import Any, Callable, Optional, Union
+from urllib.parse import urljoin
 
 import requests
 from kedro.io.core import AbstractDataset, DatasetError
 from requests import Session, sessions
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from requests.auth import AuthBase
+from urllib3.util.retry import Retry
+
+PAGINATION_TYPES = ("cursor", "offset", "link")
+
+
+def _get_path(body: Any, path: Optional[str]) -> Any:
+    """Get the value at a dot-separated ``path`` of keys in a JSON body."""
+    if path is None:
+        return body
+    for key in path.split("."):
+        if not isinstance(body, dict):
+            return None
+        body = body.get(key)
+    return body
 
 
 class APIDataset(AbstractDataset[None, requests.Response]):
@@ -31,6 +51,51 @@ class APIDataset(AbstractDataset[None, requests.Response]):
             agg_level_desc: STATE,
             year: 2000
 
+        articles: # follows the cursor in each page until there is none
+          type: api.APIDataset
+          url: https://internal.example.com/api/articles
+          load_args:
+            params:
+              topic: spaceflight
+            pagination:
+              type: cursor
+              records_path: data
+              cursor_path: meta.next_cursor
+              cursor_param: cursor
+
+        orders: # pages fetched concurrently once the total is known
+          type: api.APIDataset
+          url: https://internal.example.com/api/orders
+          load_args:
+            max_workers: 8
+            pagination:
+              type: offset
+              limit: 500
+              records_path: results
+              total_path: count
+
+        logs: # records parsed as they are streamed
+          type: api.APIDataset
+          url: https://internal.example.com/api/logs.ndjson
+          load_args:
+            ndjson: True
+
+        events:
+          type: api.APIDataset
+          url: https://internal.example.com/api/events
+          method: POST
+          save_args:
+            chunk_size: 1000
+            max_workers: 8
+            retry:
+              total: 5
+              backoff_factor: 0.5
+              allowed_methods: [POST]
+
+    Paginated datasets load a list of the records of all pages, or an iterator
+    over them that fetches pages as they are consumed if ``iterate`` is set.
+    NDJSON datasets load an iterator over the records of the streamed response.
+
     Example usage for the
     `Python API <https://kedro.readthedocs.io/en/stable/data/\
     advanced_data_catalog_usage.html>`_:
@@ -71,7 +136,8 @@ class APIDataset(AbstractDataset[None, requests.Response]):
     how long  our program waits for a response after a request. `chunk_size`, is only
     used if the input of save method is a list. It will divide the request into chunks
     of size `chunk_size`. For example, here we will send two requests each containing
-    one row of our example DataFrame.
+    one row of our example DataFrame. Chunks are sent concurrently by up to
+    `max_workers` threads, one at a time by default.
     If the data passed to the save method is not a list, ``APIDataset`` will check if it
     can be loaded as JSON. If true, it will send the data unchanged in a single request.
     Otherwise, the ``_save`` method will try to dump the data in JSON format and execute
@@ -86,6 +152,12 @@ class APIDataset(AbstractDataset[None, requests.Response]):
         "timeout": 60,
         "chunk_size": 100,
     }
+    DEFAULT_RETRY_ARGS = {
+        "backoff_factor": 0.5,
+        "status_forcelist": (429, 500, 502, 503, 504),
+        # return the last response, so its status is reported as an HTTP error
+        "raise_on_status": False,
+    }
 
     def __init__(  # noqa: PLR0913
         self,
@@ -105,9 +177,34 @@ class APIDataset(AbstractDataset[None, requests.Response]):
                 methods
             load_args: Additional parameters to be fed to requests.request.
                 https://requests.readthedocs.io/en/latest/api.html#requests.request
+                Adds an optional parameter, ``retry``, which is either the
+                number of times to retry failed requests or the arguments of
+                ``urllib3.util.Retry``. Requests answered with a 429, 500, 502,
+                503 or 504 status are retried with an exponential backoff,
+                unless overridden in ``retry``.
+                https://urllib3.readthedocs.io/en/stable/reference/urllib3.util.html#urllib3.util.Retry
+                ``pagination`` loads the records of all pages of the response.
+                Its ``type`` is either ``cursor``, which sets the ``cursor_param``
+                request parameter (default ``cursor``) to the value at
+                ``cursor_path`` in the previous page; ``offset``, which sets
+                the ``offset_param`` and ``limit_param`` request parameters
+                (default ``offset`` and ``limit``) to pages of ``limit`` records
+                (default 100) until a page is not full, or fetches them with
+                ``max_workers`` threads, at most twice as many pages ahead of
+                the records consumed, if the total number of records is at
+                ``total_path`` in the first page; or ``link``, which follows the
+                URL at ``next_url_path`` in the previous page, or its ``Link``
+                header. Records are at ``records_path`` in each page, or are the
+                page itself. ``max_pages`` limits the number of pages and
+                ``iterate`` loads an iterator over the records.
+                ``ndjson`` streams the response and loads an iterator over its
+                records, one JSON document per line.
             save_args: Options for saving data on server. Includes all parameters used
                 during load method. Adds an optional parameter, ``chunk_size`` which
-                determines the size of the package sent at each request.
+                determines the size of the package sent at each request, and
+                ``max_workers``, the number of chunks sent concurrently. Note that
+                ``urllib3`` does not retry POST requests unless ``allowed_methods``
+                is set in ``retry``.
             credentials: Allows specifying secrets in credentials.yml.
                 Expected format is ``('login', 'password')`` if given as a tuple or
                 list. An ``AuthBase`` instance can be provided for more complex cases.
@@ -116,13 +213,17 @@ class APIDataset(AbstractDataset[None, requests.Response]):
 
         Raises:
             ValueError: if both ``auth`` and ``credentials`` are specified or used
-                unsupported RESTful API method.
+                unsupported RESTful API method, or if ``pagination`` is invalid.
         """
         super().__init__()
 
         # GET method means load
         if method == "GET":
-            self._params = load_args or {}
+            self._params = dict(load_args or {})
+            self._max_workers = self._params.pop("max_workers", 1)
+            self._pagination = self._params.pop("pagination", None)
+            self._ndjson = self._params.pop("ndjson", False)
+            self._validate_load_options()
 
         # PUT, POST means save
         elif method in ["PUT", "POST"]:
@@ -130,9 +231,15 @@ class APIDataset(AbstractDataset[None, requests.Response]):
             if save_args is not None:
                 self._params.update(save_args)
             self._chunk_size = self._params.pop("chunk_size", 1)
+            self._max_workers = self._params.pop("max_workers", 1)
+            self._pagination = None
+            self._ndjson = False
         else:
             raise ValueError("Only GET, POST and PUT methods are supported")
 
+        self._retry = self._params.pop("retry", None)
+        self._session: Optional[Session] = None
+
         self._param_auth = self._params.pop("auth", None)
 
         if credentials is not None and self._param_auth is not None:
@@ -155,6 +262,21 @@ class APIDataset(AbstractDataset[None, requests.Response]):
 
         self.metadata = metadata
 
+    def _validate_load_options(self) -> None:
+        if self._pagination is None:
+            return
+        if self._ndjson:
+            raise ValueError("Cannot combine 'pagination' and 'ndjson'.")
+        if self._pagination.get("type") not in PAGINATION_TYPES:
+            raise ValueError(
+                f"Pagination 'type' must be one of {list(PAGINATION_TYPES)}, "
+                f"got '{self._pagination.get('type')}'."
+            )
+        if self._pagination["type"] == "cursor" and not self._pagination.get(
+            "cursor_path"
+        ):
+            raise ValueError("Cursor pagination requires a 'cursor_path'.")
+
     @staticmethod
     def _convert_type(value: Any):
         """
@@ -170,11 +292,35 @@ class APIDataset(AbstractDataset[None, requests.Response]):
         # prevent auth from logging
         request_args_cp = self._request_args.copy()
         request_args_cp.pop("auth", None)
+        if self._pagination:
+            request_args_cp["pagination"] = self._pagination
+        if self._ndjson:
+            request_args_cp["ndjson"] = self._ndjson
         return request_args_cp
 
-    def _execute_request(self, session: Session) -> requests.Response:
+    def _get_session(self) -> Session:
+        """Return the session shared by the requests of this dataset, so that
+        their connections are kept alive and reused."""
+        if self._session is None:
+            adapter = HTTPAdapter(
+                pool_maxsize=max(self._max_workers, DEFAULT_POOLSIZE),
+                max_retries=self._build_retry(),
+            )
+            session = sessions.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def _build_retry(self) -> Union[Retry, int]:
+        if not self._retry:
+            return 0
+        retry = {"total": self._retry} if isinstance(self._retry, int) else self._retry
+        return Retry(**{**self.DEFAULT_RETRY_ARGS, **retry})
+
+    def _execute_request(self, session: Session, **request_args) -> requests.Response:
         try:
-            response = session.request(**self._request_args)
+            response = session.request(**{**self._request_args, **request_args})
             response.raise_for_status()
         except requests.exceptions.HTTPError as exc:
             raise DatasetError("Failed to fetch data", exc) from exc
@@ -183,33 +329,173 @@ class APIDataset(AbstractDataset[None, requests.Response]):
 
         return response
 
-    def _load(self) -> requests.Response:
-        if self._request_args["method"] == "GET":
-            with sessions.Session() as session:
-                return self._execute_request(session)
+    def _load(self) -> Union[requests.Response, list[Any], Iterator[Any]]:
+        if self._request_args["method"] != "GET":
+            raise DatasetError("Only GET method is supported for load")
+
+        if self._pagination:
+            pages = self._iter_pages()
+            # fetch the first page now, so request errors are raised on load
+            first_page = next(pages)
+            records = chain(first_page, chain.from_iterable(pages))
+            return records if self._pagination.get("iterate") else list(records)
+
+        if self._ndjson:
+            response = self._execute_request(self._get_session(), stream=True)
+            return self._iter_ndjson(response)
 
-        raise DatasetError("Only GET method is supported for load")
+        return self._execute_request(self._get_session())
+
+    @staticmethod
+    def _iter_ndjson(response: requests.Response) -> Iterator[Any]:
+        with response:
+            for line in response.iter_lines(chunk_size=2**16):
+                if line.strip():
+                    yield json_.loads(line)
+
+    def _iter_pages(self) -> Iterator[list[Any]]:
+        """Fetch the pages of a paginated response and yield their records."""
+        session = self._get_session()
+        pagination = self._pagination
+        params = dict(self._request_args.get("params") or {})
+
+        if pagination["type"] == "offset":
+            yield from self._iter_offset_pages(session, params)
+            return
+
+        request_args: dict[str, Any] = {"params": params}
+        for page in count(1):
+            response = self._execute_request(session, **request_args)
+            body = response.json()
+            yield self._get_records(body)
+            if page == pagination.get("max_pages"):
+                return
+
+            if pagination["type"] == "cursor":
+                cursor = _get_path(body, pagination["cursor_path"])
+                if cursor in (None, ""):
+                    return
+                cursor_param = pagination.get("cursor_param", "cursor")
+                request_args = {"params": {**params, cursor_param: cursor}}
+            else:
+                if "next_url_path" in pagination:
+                    next_url = _get_path(body, pagination["next_url_path"])
+                else:
+                    next_url = response.links.get("next", {}).get("url")
+                if not next_url:
+                    return
+                # the next URL already contains the query parameters
+                request_args = {"url": urljoin(response.url, next_url), "params": None}
+
+    def _get_records(self, body: Any) -> list[Any]:
+        records_path = self._pagination.get("records_path")
+        records = _get_path(body, records_path)
+        if records is None:
+            location = f" at '{records_path}'" if records_path else ""
+            raise DatasetError(
+                f"Found no records{location} in a page of "
+                f"'{self._request_args['url']}'."
+            )
+        return records
+
+    def _iter_offset_pages(
+        self, session: Session, params: dict[str, Any]
+    ) -> Iterator[list[Any]]:
+        pagination = self._pagination
+        limit = pagination.get("limit", 100)
+        max_pages = pagination.get("max_pages")
+
+        def fetch(offset: int) -> Any:
+            page_params = {
+                **params,
+                pagination.get("offset_param", "offset"): offset,
+                pagination.get("limit_param", "limit"): limit,
+            }
+            return self._execute_request(session, params=page_params).json()
+
+        start = pagination.get("start", 0)
+        body = fetch(start)
+        records = self._get_records(body)
+        yield records
+
+        if "total_path" in pagination:
+            total = _get_path(body, pagination["total_path"])
+            if not isinstance(total, int):
+                raise DatasetError(
+                    f"Expected the total number of records at "
+                    f"'{pagination['total_path']}' in the first page of "
+                    f"'{self._request_args['url']}', got {total!r}."
+                )
+            # all offsets are known, so the remaining pages are fetched concurrently
+            offsets = range(start + limit, total, limit)
+            if max_pages is not None:
+                offsets = offsets[: max_pages - 1]
+            yield from self._fetch_bounded(fetch, iter(offsets))
+            return
+
+        for offset in count(start + limit, limit):
+            if len(records) < limit or (
+                max_pages is not None and (offset - start) // limit >= max_pages
+            ):
+                return
+            records = self._get_records(fetch(offset))
+            yield records
+
+    def _fetch_bounded(
+        self, fetch: Callable[[int], Any], offsets: Iterator[int]
+    ) -> Iterator[list[Any]]:
+        """Fetch pages in a thread pool and yield their records in order. At
+        most ``2 * max_workers`` pages are fetched ahead of the consumer, so
+        memory stays bounded when records are iterated over."""
+        window = 2 * self._max_workers
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            pending = deque(
+                executor.submit(fetch, offset) for offset in islice(offsets, window)
+            )
+            try:
+                while pending:
+                    body = pending.popleft().result()
+                    pending.extend(
+                        executor.submit(fetch, offset)
+                        for offset in islice(offsets, window - len(pending))
+                    )
+                    yield self._get_records(body)
+            finally:
+                for future in pending:
+                    future.cancel()
 
     def _execute_save_with_chunks(
         self,
         json_data: list[dict[str, Any]],
     ) -> requests.Response:
         chunk_size = self._chunk_size
-        n_chunks = len(json_data) // chunk_size + 1
-
-        for i in range(n_chunks):
-            send_data = json_data[i * chunk_size : (i + 1) * chunk_size]
-            response = self._execute_save_request(json_data=send_data)
-
-        return response
+        # an empty list is still sent, in a single request
+        chunks = [
+            json_data[start : start + chunk_size]
+            for start in range(0, len(json_data) or 1, chunk_size)
+        ]
+        if self._max_workers == 1 or len(chunks) == 1:
+            responses = [self._execute_save_request(chunk) for chunk in chunks]
+            return responses[-1]
+
+        self._get_session()
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            responses = list(executor.map(self._execute_save_request, chunks))
+        finally:
+            # do not send the remaining chunks once one of them failed
+            executor.shutdown(cancel_futures=True)
+        return responses[-1]
 
     def _execute_save_request(self, json_data: Any) -> requests.Response:
         try:
-            self._request_args["json"] = json_.loads(json_data)
+            json_data = json_.loads(json_data)
         except TypeError:
-            self._request_args["json"] = json_data
+            pass
         try:
-            response = requests.request(**self._request_args)
+            response = self._get_session().request(
+                **{**self._request_args, "json": json_data}
+            )
             response.raise_for_status()
         except requests.exceptions.HTTPError as exc:
             raise DatasetError("Failed to send data", exc) from exc
@@ -228,6 +514,11 @@ class APIDataset(AbstractDataset[None, requests.Response]):
         raise DatasetError("Use PUT or POST methods for save")
 
     def _exists(self) -> bool:
-        with sessions.Session() as session:
-            response = self._execute_request(session)
+        response = self._execute_request(self._get_session())
         return response.ok
+
+    def _release(self) -> None:
+        super()._release()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
@@ -0,0 +1,82 @@
+"""Loading of the files matching a glob pattern into one ``pandas.DataFrame``,
+shared by the pandas datasets which support globbing.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import pandas as pd
+from fsspec import AbstractFileSystem
+from kedro.io.core import DatasetError
+
+from kedro_datasets._io import supports_glob
+
+DEFAULT_SOURCE_COLUMN = "source"
+
+
+def pop_glob_args(
+    load_args: dict[str, Any], protocol: str
+) -> tuple[bool, int | None, str | None]:
+    """Remove the ``glob``, ``max_workers`` and ``include_source_column``
+    options from ``load_args``, so the rest can be passed to the reader.
+
+    Args:
+        load_args: Load arguments of the dataset.
+        protocol: Protocol of the dataset's filesystem.
+
+    Raises:
+        DatasetError: If ``glob`` is set, but paths on the filesystem of
+            ``protocol`` cannot be globbed.
+
+    Returns:
+        Whether the file path is a glob pattern, the number of threads reading
+        the matched files, and the name of the column to add the path of the
+        file each row was read from to, or None.
+    """
+    glob = load_args.pop("glob", False)
+    if glob and not supports_glob(protocol):
+        raise DatasetError(
+            f"Glob patterns are not supported for protocol '{protocol}'."
+        )
+    max_workers = load_args.pop("max_workers", None)
+    source_column = load_args.pop("include_source_column", False)
+    if source_column is True:
+        source_column = DEFAULT_SOURCE_COLUMN
+    return glob, max_workers, source_column or None
+
+
+def load_glob(
+    fs: AbstractFileSystem,
+    pattern: str,
+    read: Callable[[str], pd.DataFrame],
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    """Read the files matching ``pattern`` in a thread pool and concatenate
+    them in path order.
+
+    Args:
+        fs: Filesystem to glob the files on.
+        pattern: Glob pattern without protocol.
+        read: Function reading the file at a path into a dataframe.
+        max_workers: Number of threads reading the files.
+
+    Raises:
+        DatasetError: If no files match ``pattern``.
+
+    Returns:
+        The concatenated dataframes, with a new ``RangeIndex`` unless the
+        dataframes were read with another index.
+    """
+    paths = sorted(fs.glob(pattern))
+    if not paths:
+        raise DatasetError(f"No files found matching '{pattern}'.")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = list(executor.map(read, paths))
+
+    return pd.concat(
+        frames,
+        ignore_index=all(isinstance(frame.index, pd.RangeIndex) for frame in frames),
+        copy=False,
+    )
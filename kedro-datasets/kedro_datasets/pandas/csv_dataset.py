@@ -3,7 +3,6 @@ filesystem (e.g.: local, S3, GCS). It uses pandas to handle the CSV file.
 """
 import logging
 from copy import deepcopy
-from io import BytesIO
 from pathlib import PurePosixPath
 from typing import Any
 
@@ -18,6 +17,10 @@ from kedro.io.core import (
     get_protocol_and_path,
 )
 
+from kedro_datasets._io import atomic_save
+from kedro_datasets._local_cache import CachedFileSystem, cached_filesystem
+from kedro_datasets.pandas._glob import load_glob, pop_glob_args
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +50,15 @@ class CSVDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
           filepath: s3://your_bucket/data/02_intermediate/company/motorbikes.csv
           credentials: dev_s3
 
+        daily_exports:
+          type: pandas.CSVDataset
+          filepath: s3://your_bucket/data/01_raw/exports/export_*.csv.gz
+          credentials: dev_s3
+          load_args:
+            glob: True
+            max_workers: 16
+            include_source_column: shard
+
     Example usage for the
     `Python API <https://kedro.readthedocs.io/en/stable/data/\
     advanced_data_catalog_usage.html>`_:
@@ -90,7 +102,14 @@ class CSVDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
             load_args: Pandas options for loading CSV files.
                 Here you can find all available arguments:
                 https://pandas.pydata.org/pandas-docs/stable/generated/pandas.read_csv.html
-                All defaults are preserved.
+                All defaults are preserved. Additionally, ``glob`` set to True
+                treats ``filepath`` as a glob pattern such as
+                `exports/export_*.csv.gz` and loads all matching files, concatenated
+                in path order. Such datasets cannot be saved, and http(s) paths
+                cannot be globbed. ``max_workers`` sets the number of threads
+                reading the matched files, and ``include_source_column`` adds a
+                column with the path of the file each row was read from, named
+                ``source`` or the given column name.
             save_args: Pandas options for saving CSV files.
                 Here you can find all available arguments:
                 https://pandas.pydata.org/pandas-docs/stable/generated/pandas.DataFrame.to_csv.html
@@ -103,10 +122,14 @@ class CSVDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
                 E.g. for ``GCSFileSystem`` it should look like `{"token": None}`.
             fs_args: Extra arguments to pass into underlying filesystem class constructor
                 (e.g. `{"project": "my-project"}` for ``GCSFileSystem``).
+                Files on remote filesystems are cached on local disk if ``cache``
+                is set to True or to a dictionary with the cache directory
+                ``path`` and its ``max_size`` in bytes.
             metadata: Any Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
         """
         _fs_args = deepcopy(fs_args) or {}
+        _cache = _fs_args.pop("cache", None)
         _credentials = deepcopy(credentials) or {}
 
         protocol, path = get_protocol_and_path(filepath, version)
@@ -115,7 +138,9 @@ class CSVDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
 
         self._protocol = protocol
         self._storage_options = {**_credentials, **_fs_args}
-        self._fs = fsspec.filesystem(self._protocol, **self._storage_options)
+        self._fs = cached_filesystem(
+            fsspec.filesystem(self._protocol, **self._storage_options), _cache
+        )
 
         self.metadata = metadata
 
@@ -134,6 +159,10 @@ class CSVDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
         if save_args is not None:
             self._save_args.update(save_args)
 
+        self._glob, self._max_workers, self._source_column = pop_glob_args(
+            self._load_args, protocol
+        )
+
         if "storage_options" in self._save_args or "storage_options" in self._load_args:
             logger.warning(
                 "Dropping 'storage_options' for %s, "
@@ -154,26 +183,41 @@ class CSVDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
 
     def _load(self) -> pd.DataFrame:
         load_path = str(self._get_load_path())
+        if not self._glob:
+            return self._read(load_path)
+        return load_glob(self._fs, load_path, self._read, self._max_workers)
+
+    def _read(self, load_path: str) -> pd.DataFrame:
         if self._protocol == "file":
             # file:// protocol seems to misbehave on Windows
             # (<urlopen error file not on local host>),
             # so we don't join that back to the filepath;
             # storage_options also don't work with local paths
-            return pd.read_csv(load_path, **self._load_args)
+            data = pd.read_csv(load_path, **self._load_args)
+        elif isinstance(self._fs, CachedFileSystem):
+            data = pd.read_csv(self._fs.fetch(load_path), **self._load_args)
+        else:
+            data = pd.read_csv(
+                f"{self._protocol}{PROTOCOL_DELIMITER}{load_path}",
+                storage_options=self._storage_options,
+                **self._load_args,
+            )
 
-        load_path = f"{self._protocol}{PROTOCOL_DELIMITER}{load_path}"
-        return pd.read_csv(
-            load_path, storage_options=self._storage_options, **self._load_args
-        )
+        if self._source_column:
+            data[self._source_column] = load_path
+        return data
 
     def _save(self, data: pd.DataFrame) -> None:
-        save_path = get_filepath_str(self._get_save_path(), self._protocol)
+        if self._glob:
+            raise DatasetError(
+                f"Saving {self.__class__.__name__} to a glob pattern "
+                f"'{self._filepath}' is not supported."
+            )
 
-        buf = BytesIO()
-        data.to_csv(path_or_buf=buf, **self._save_args)
+        save_path = get_filepath_str(self._get_save_path(), self._protocol)
 
-        with self._fs.open(save_path, mode="wb") as fs_file:
-            fs_file.write(buf.getvalue())
+        with atomic_save(self._fs, save_path) as fs_file:
+            data.to_csv(path_or_buf=fs_file, **self._save_args)
 
         self._invalidate_cache()
 
@@ -183,6 +227,8 @@ class CSVDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
         except DatasetError:
             return False
 
+        if self._glob:
+            return bool(self._fs.glob(load_path))
         return self._fs.exists(load_path)
 
     def _release(self) -> None:
@@ -3,7 +3,6 @@ filesystem (e.g.: local, S3, GCS). It uses pandas to handle the Excel file.
 """
 import logging
 from copy import deepcopy
-from io import BytesIO
 from pathlib import PurePosixPath
 from typing import Any, Union
 
@@ -18,6 +17,8 @@ from kedro.io.core import (
     get_protocol_and_path,
 )
 
+from kedro_datasets._io import atomic_save
+
 logger = logging.getLogger(__name__)
 
 
@@ -228,20 +229,17 @@ class ExcelDataset(
         )
 
     def _save(self, data: Union[pd.DataFrame, dict[str, pd.DataFrame]]) -> None:
-        output = BytesIO()
         save_path = get_filepath_str(self._get_save_path(), self._protocol)
 
-        with pd.ExcelWriter(output, **self._writer_args) as writer:
-            if isinstance(data, dict):
-                for sheet_name, sheet_data in data.items():
-                    sheet_data.to_excel(
-                        writer, sheet_name=sheet_name, **self._save_args
-                    )
-            else:
-                data.to_excel(writer, **self._save_args)
-
-        with self._fs.open(save_path, mode="wb") as fs_file:
-            fs_file.write(output.getvalue())
+        with atomic_save(self._fs, save_path) as fs_file:
+            with pd.ExcelWriter(fs_file, **self._writer_args) as writer:
+                if isinstance(data, dict):
+                    for sheet_name, sheet_data in data.items():
+                        sheet_data.to_excel(
+                            writer, sheet_name=sheet_name, **self._save_args
+                        )
+                else:
+                    data.to_excel(writer, **self._save_args)
 
         self._invalidate_cache()
 
@@ -2,6 +2,8 @@
 using an underlying filesystem (e.g.: local, S3, GCS). The underlying functionality
 is supported by pandas, so it supports all operations the pandas supports.
 """
+from __future__ import annotations
+
 import logging
 from copy import deepcopy
 from io import BytesIO
@@ -10,6 +12,7 @@ from typing import Any
 
 import fsspec
 import pandas as pd
+import pyarrow as pa
 from kedro.io.core import (
     PROTOCOL_DELIMITER,
     AbstractVersionedDataset,
@@ -17,6 +20,7 @@ from kedro.io.core import (
     get_filepath_str,
     get_protocol_and_path,
 )
+from pyarrow import feather
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +49,25 @@ class FeatherDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
           filepath: s3://your_bucket/data/02_intermediate/company/motorbikes.feather
           credentials: dev_s3
 
+    Local files can be memory-mapped with ``memory_map``, so that nodes loading
+    the same file share the operating system's page cache instead of each
+    reading their own copy. Numeric columns without nulls are then converted
+    to read-only pandas columns without copying, provided the file was saved
+    uncompressed and in a single chunk. With ``as_table``, a
+    ``pyarrow.Table`` is returned instead of a DataFrame, without copying:
+
+    .. code-block:: yaml
+
+        features:
+          type: pandas.FeatherDataset
+          filepath: data/04_feature/features.feather
+          load_args:
+            memory_map: True
+            as_table: True
+          save_args:
+            compression: uncompressed
+            chunksize: 1000000000
+
     Example usage for the
     `Python API <https://kedro.readthedocs.io/en/stable/data/\
     advanced_data_catalog_usage.html>`_:
@@ -90,7 +113,11 @@ class FeatherDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
             load_args: Pandas options for loading feather files.
                 Here you can find all available arguments:
                 https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.read_feather.html
-                All defaults are preserved.
+                All defaults are preserved. Additionally, ``memory_map``
+                memory-maps local files and ``as_table`` returns a
+                ``pyarrow.Table``, in which case the file is read with
+                ``pyarrow.feather.read_table`` and only ``columns`` and
+                ``use_threads`` are supported.
             save_args: Pandas options for saving feather files.
                 Here you can find all available arguments:
                 https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.DataFrame.to_feather.html
@@ -143,6 +170,9 @@ class FeatherDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
             self._save_args.pop("storage_options", None)
             self._load_args.pop("storage_options", None)
 
+        self._memory_map = self._load_args.pop("memory_map", False)
+        self._as_table = self._load_args.pop("as_table", False)
+
     def _describe(self) -> dict[str, Any]:
         return {
             "filepath": self._filepath,
@@ -151,8 +181,11 @@ class FeatherDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
             "version": self._version,
         }
 
-    def _load(self) -> pd.DataFrame:
+    def _load(self) -> pd.DataFrame | pa.Table:
         load_path = str(self._get_load_path())
+        if self._as_table or (self._memory_map and self._protocol == "file"):
+            return self._load_table(load_path)
+
         if self._protocol == "file":
             # file:// protocol seems to misbehave on Windows
             # (<urlopen error file not on local host>),
@@ -165,11 +198,28 @@ class FeatherDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
             load_path, storage_options=self._storage_options, **self._load_args
         )
 
-    def _save(self, data: pd.DataFrame) -> None:
+    def _load_table(self, load_path: str) -> pd.DataFrame | pa.Table:
+        if self._protocol == "file":
+            table = feather.read_table(
+                load_path, memory_map=self._memory_map, **self._load_args
+            )
+        else:
+            with self._fs.open(load_path, mode="rb") as fs_file:
+                table = feather.read_table(fs_file, **self._load_args)
+
+        if self._as_table:
+            return table
+        # one block per column, so that columns can be views over the mapped file
+        return table.to_pandas(split_blocks=True)
+
+    def _save(self, data: pd.DataFrame | pa.Table) -> None:
         save_path = get_filepath_str(self._get_save_path(), self._protocol)
 
         buf = BytesIO()
-        data.to_feather(buf, **self._save_args)
+        if isinstance(data, pa.Table):
+            feather.write_feather(data, buf, **self._save_args)
+        else:
+            data.to_feather(buf, **self._save_args)
 
         with self._fs.open(save_path, mode="wb") as fs_file:
             fs_file.write(buf.getvalue())
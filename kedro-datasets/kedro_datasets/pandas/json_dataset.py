@@ -18,6 +18,9 @@ from kedro.io.core import (
     get_protocol_and_path,
 )
 
+from kedro_datasets._local_cache import CachedFileSystem, cached_filesystem
+from kedro_datasets.pandas._glob import load_glob, pop_glob_args
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +45,15 @@ class JSONDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
           load_args:
             lines: True
 
+        click_stream_shards:
+          type: pandas.JSONDataset
+          filepath: abfs://landing_area/primary/click_stream_*.jsonl
+          credentials: abfs_creds
+          load_args:
+            glob: True
+            lines: True
+            include_source_column: True
+
     Example usage for the
     `Python API <https://kedro.readthedocs.io/en/stable/data/\
     advanced_data_catalog_usage.html>`_:
@@ -85,7 +97,14 @@ class JSONDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
             load_args: Pandas options for loading JSON files.
                 Here you can find all available arguments:
                 https://pandas.pydata.org/pandas-docs/stable/generated/pandas.read_json.html
-                All defaults are preserved.
+                All defaults are preserved. Additionally, ``glob`` set to True
+                treats ``filepath`` as a glob pattern such as
+                `events/events_*.jsonl` and loads all matching files, concatenated
+                in path order. Such datasets cannot be saved, and http(s) paths
+                cannot be globbed. ``max_workers`` sets the number of threads
+                reading the matched files, and ``include_source_column`` adds a
+                column with the path of the file each row was read from, named
+                ``source`` or the given column name.
             save_args: Pandas options for saving JSON files.
                 Here you can find all available arguments:
                 https://pandas.pydata.org/pandas-docs/stable/generated/pandas.DataFrame.to_json.html
@@ -98,10 +117,14 @@ class JSONDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
                 E.g. for ``GCSFileSystem`` it should look like `{'token': None}`.
             fs_args: Extra arguments to pass into underlying filesystem class constructor
                 (e.g. `{"project": "my-project"}` for ``GCSFileSystem``).
+                Files on remote filesystems are cached on local disk if ``cache``
+                is set to True or to a dictionary with the cache directory
+                ``path`` and its ``max_size`` in bytes.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
         """
         _fs_args = deepcopy(fs_args) or {}
+        _cache = _fs_args.pop("cache", None)
         _credentials = deepcopy(credentials) or {}
         protocol, path = get_protocol_and_path(filepath, version)
         if protocol == "file":
@@ -109,7 +132,9 @@ class JSONDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
 
         self._protocol = protocol
         self._storage_options = {**_credentials, **_fs_args}
-        self._fs = fsspec.filesystem(self._protocol, **self._storage_options)
+        self._fs = cached_filesystem(
+            fsspec.filesystem(self._protocol, **self._storage_options), _cache
+        )
 
         self.metadata = metadata
 
@@ -128,6 +153,10 @@ class JSONDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
         if save_args is not None:
             self._save_args.update(save_args)
 
+        self._glob, self._max_workers, self._source_column = pop_glob_args(
+            self._load_args, protocol
+        )
+
         if "storage_options" in self._save_args or "storage_options" in self._load_args:
             logger.warning(
                 "Dropping 'storage_options' for %s, "
@@ -148,19 +177,37 @@ class JSONDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
 
     def _load(self) -> pd.DataFrame:
         load_path = str(self._get_load_path())
+        if not self._glob:
+            return self._read(load_path)
+        return load_glob(self._fs, load_path, self._read, self._max_workers)
+
+    def _read(self, load_path: str) -> pd.DataFrame:
         if self._protocol == "file":
             # file:// protocol seems to misbehave on Windows
             # (<urlopen error file not on local host>),
             # so we don't join that back to the filepath;
             # storage_options also don't work with local paths
-            return pd.read_json(load_path, **self._load_args)
+            data = pd.read_json(load_path, **self._load_args)
+        elif isinstance(self._fs, CachedFileSystem):
+            data = pd.read_json(self._fs.fetch(load_path), **self._load_args)
+        else:
+            data = pd.read_json(
+                f"{self._protocol}{PROTOCOL_DELIMITER}{load_path}",
+                storage_options=self._storage_options,
+                **self._load_args,
+            )
 
-        load_path = f"{self._protocol}{PROTOCOL_DELIMITER}{load_path}"
-        return pd.read_json(
-            load_path, storage_options=self._storage_options, **self._load_args
-        )
+        if self._source_column:
+            data[self._source_column] = load_path
+        return data
 
     def _save(self, data: pd.DataFrame) -> None:
+        if self._glob:
+            raise DatasetError(
+                f"Saving {self.__class__.__name__} to a glob pattern "
+                f"'{self._filepath}' is not supported."
+            )
+
         save_path = get_filepath_str(self._get_save_path(), self._protocol)
 
         buf = BytesIO()
@@ -177,6 +224,8 @@ class JSONDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
         except DatasetError:
             return False
 
+        if self._glob:
+            return bool(self._fs.glob(load_path))
         return self._fs.exists(load_path)
 
     def _release(self) -> None:
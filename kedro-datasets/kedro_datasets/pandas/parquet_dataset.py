@@ -1,14 +1,17 @@
 """``ParquetDataset`` loads/saves data from/to a Parquet file using an underlying
 filesystem (e.g.: local, S3, GCS). It uses pandas to handle the Parquet file.
 """
+from __future__ import annotations
+
 import logging
 from copy import deepcopy
-from io import BytesIO
 from pathlib import Path, PurePosixPath
 from typing import Any
 
 import fsspec
 import pandas as pd
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from kedro.io.core import (
     PROTOCOL_DELIMITER,
     AbstractVersionedDataset,
@@ -17,9 +20,18 @@ from kedro.io.core import (
     get_filepath_str,
     get_protocol_and_path,
 )
+from pyarrow.fs import FSSpecHandler, PyFileSystem
+
+from kedro_datasets._io import atomic_save
+from kedro_datasets._local_cache import CachedFileSystem, cached_filesystem
 
 logger = logging.getLogger(__name__)
 
+# ``filters_to_expression`` is only public from pyarrow 10.0
+_filters_to_expression = getattr(
+    pq, "filters_to_expression", getattr(pq, "_filters_to_expression", None)
+)
+
 
 class ParquetDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
     """``ParquetDataset`` loads/saves data from/to a Parquet file using an underlying
@@ -53,6 +65,21 @@ class ParquetDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
             compression: GZIP
             partition_on: [name]
 
+    ``columns`` and ``filters`` only read the needed column chunks and the row
+    groups whose statistics may match the filters, using byte-range reads on
+    remote filesystems. ``scan_metrics`` reports how many row groups and bytes
+    the last load skipped:
+
+    .. code-block:: yaml
+
+        flights:
+          type: pandas.ParquetDataset
+          filepath: s3://your_bucket/data/01_raw/flights.parquet
+          columns: [carrier, origin, dep_delay]
+          filters:
+            - [year, "=", 2023]
+            - [dep_delay, ">", 60]
+
     Example usage for the
     `Python API <https://kedro.readthedocs.io/en/stable/data/\
     advanced_data_catalog_usage.html>`_:
@@ -83,6 +110,8 @@ class ParquetDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
         version: Version = None,
         credentials: dict[str, Any] = None,
         fs_args: dict[str, Any] = None,
+        columns: list[str] | None = None,
+        filters: list | None = None,
         metadata: dict[str, Any] = None,
     ) -> None:
         """Creates a new instance of ``ParquetDataset`` pointing to a concrete Parquet file
@@ -100,7 +129,9 @@ class ParquetDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
                 https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.read_parquet.html
                 Here you can find all available arguments when reading partitioned datasets:
                 https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetDataset.html#pyarrow.parquet.ParquetDataset.read
-                All defaults are preserved.
+                All defaults are preserved. If ``columns`` or ``filters`` are set,
+                they are passed to ``pyarrow.Table.to_pandas`` instead:
+                https://arrow.apache.org/docs/python/generated/pyarrow.Table.html#pyarrow.Table.to_pandas
             save_args: Additional saving options for saving Parquet file(s).
                 Here you can find all available arguments:
                 https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.DataFrame.to_parquet.html
@@ -112,10 +143,21 @@ class ParquetDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
                 E.g. for ``GCSFileSystem`` it should look like `{"token": None}`.
             fs_args: Extra arguments to pass into underlying filesystem class constructor
                 (e.g. `{"project": "my-project"}` for ``GCSFileSystem``).
+                Files on remote filesystems are cached on local disk if ``cache``
+                is set to True or to a dictionary with the cache directory
+                ``path`` and its ``max_size`` in bytes.
+            columns: Columns to load. Only the column chunks of these columns
+                are read from the file(s).
+            filters: Row filters in disjunctive normal form, as a list of
+                ``(column, operator, value)`` tuples which must all match, or
+                a list of such lists of which any must match, as accepted by
+                ``pyarrow.parquet.read_table``. Row groups and hive partitions
+                whose statistics cannot match are not read.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
         """
         _fs_args = deepcopy(fs_args) or {}
+        _cache = _fs_args.pop("cache", None)
         _credentials = deepcopy(credentials) or {}
 
         protocol, path = get_protocol_and_path(filepath, version)
@@ -124,7 +166,9 @@ class ParquetDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
 
         self._protocol = protocol
         self._storage_options = {**_credentials, **_fs_args}
-        self._fs = fsspec.filesystem(self._protocol, **self._storage_options)
+        self._fs = cached_filesystem(
+            fsspec.filesystem(self._protocol, **self._storage_options), _cache
+        )
 
         self.metadata = metadata
 
@@ -152,17 +196,32 @@ class ParquetDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
             self._save_args.pop("storage_options", None)
             self._load_args.pop("storage_options", None)
 
+        self._columns = columns
+        self._filters = filters
+        self._scan_metrics: dict[str, int] = {}
+
     def _describe(self) -> dict[str, Any]:
         return {
             "filepath": self._filepath,
             "protocol": self._protocol,
             "load_args": self._load_args,
             "save_args": self._save_args,
+            "columns": self._columns,
+            "filters": self._filters,
             "version": self._version,
         }
 
+    @property
+    def scan_metrics(self) -> dict[str, int]:
+        """Number of row groups and compressed bytes in the file(s) and how many
+        of them were skipped by ``columns`` and ``filters`` in the last load."""
+        return dict(self._scan_metrics)
+
     def _load(self) -> pd.DataFrame:
         load_path = str(self._get_load_path())
+        if self._columns is not None or self._filters is not None:
+            return self._load_pruned(load_path)
+
         if self._protocol == "file":
             # file:// protocol seems to misbehave on Windows
             # (<urlopen error file not on local host>),
@@ -170,11 +229,74 @@ class ParquetDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
             # storage_options also don't work with local paths
             return pd.read_parquet(load_path, **self._load_args)
 
+        if isinstance(self._fs, CachedFileSystem) and self._fs.isfile(load_path):
+            return pd.read_parquet(self._fs.fetch(load_path), **self._load_args)
+
         load_path = f"{self._protocol}{PROTOCOL_DELIMITER}{load_path}"
         return pd.read_parquet(
             load_path, storage_options=self._storage_options, **self._load_args
         )
 
+    def _load_pruned(self, load_path: str) -> pd.DataFrame:
+        """Load the selected columns and the row groups which may match the
+        filters, with ``pyarrow`` reading byte ranges through the dataset's
+        filesystem rather than whole files."""
+        dataset = ds.dataset(
+            load_path,
+            format="parquet",
+            filesystem=PyFileSystem(FSSpecHandler(self._fs)),
+            partitioning="hive",
+        )
+        expression = _filters_to_expression(self._filters) if self._filters else None
+        self._scan_metrics = self._scan(dataset, expression)
+
+        columns = self._columns
+        if columns is not None:
+            # keep the index saved by pandas, as ``pandas.read_parquet`` does
+            pandas_metadata = dataset.schema.pandas_metadata or {}
+            columns = columns + [
+                column
+                for column in pandas_metadata.get("index_columns", [])
+                if isinstance(column, str) and column not in columns
+            ]
+        table = dataset.to_table(columns=columns, filter=expression)
+        return table.to_pandas(**self._load_args)
+
+    def _scan(self, dataset: ds.Dataset, expression: Any) -> dict[str, int]:
+        """Count the row groups and bytes which ``columns`` and ``filters``
+        prune, using only the Parquet footers, which the fragments keep for
+        the following read."""
+        metrics = dict.fromkeys(
+            ["row_groups", "row_groups_skipped", "bytes", "bytes_skipped"], 0
+        )
+        for fragment in dataset.get_fragments():
+            metadata = fragment.metadata
+            if expression is None:
+                kept = set(range(metadata.num_row_groups))
+            else:
+                kept = {
+                    row_group.id
+                    for piece in fragment.split_by_row_group(
+                        expression, schema=dataset.schema
+                    )
+                    for row_group in piece.row_groups
+                }
+
+            for index in range(metadata.num_row_groups):
+                row_group = metadata.row_group(index)
+                metrics["row_groups"] += 1
+                metrics["row_groups_skipped"] += index not in kept
+                for column_index in range(row_group.num_columns):
+                    column = row_group.column(column_index)
+                    metrics["bytes"] += column.total_compressed_size
+                    if index not in kept or (
+                        self._columns is not None
+                        and column.path_in_schema.split(".")[0] not in self._columns
+                    ):
+                        metrics["bytes_skipped"] += column.total_compressed_size
+
+        return metrics
+
     def _save(self, data: pd.DataFrame) -> None:
         save_path = get_filepath_str(self._get_save_path(), self._protocol)
 
@@ -189,11 +311,8 @@ class ParquetDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
                 f"'partition_cols'. Please use 'kedro.io.PartitionedDataset' instead."
             )
 
-        bytes_buffer = BytesIO()
-        data.to_parquet(bytes_buffer, **self._save_args)
-
-        with self._fs.open(save_path, mode="wb") as fs_file:
-            fs_file.write(bytes_buffer.getvalue())
+        with atomic_save(self._fs, save_path) as fs_file:
+            data.to_parquet(fs_file, **self._save_args)
 
         self._invalidate_cache()
 
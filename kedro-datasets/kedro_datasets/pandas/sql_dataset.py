@@ -3,9 +3,19 @@ from __future__ import annotations
 
 import copy
 import datetime as dt
+import hashlib
+import io
+import json
+import logging
+import os
 import re
-from pathlib import PurePosixPath
-from typing import Any, NoReturn
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from functools import partial
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, NoReturn
 
 import fsspec
 import pandas as pd
@@ -18,6 +28,15 @@ from kedro.io.core import (
 from sqlalchemy import create_engine, inspect
 from sqlalchemy.exc import NoSuchModuleError
 
+from kedro_datasets._local_cache import (
+    ensure_private_dir,
+    evict_lru,
+    mark_used,
+    user_cache_dir,
+)
+
+logger = logging.getLogger(__name__)
+
 __all__ = ["SQLTableDataset", "SQLQueryDataset"]
 
 KNOWN_PIP_INSTALL = {
@@ -89,6 +108,198 @@ def _get_sql_alchemy_missing_error() -> DatasetError:
     )
 
 
+def _read_chunks(
+    read_func: Callable[..., Iterable[pd.DataFrame]],
+    engine: Any,
+    execution_options: dict[str, Any],
+    metrics: dict[str, int],
+) -> Iterator[pd.DataFrame]:
+    """Yield the chunks returned by ``read_func`` over a dedicated connection
+    using a server-side cursor, so that only one chunk is held in memory at a
+    time. The connection is closed once the iterator is exhausted or closed.
+
+    Args:
+        read_func: ``pandas`` reader called with the connection as ``con``.
+        engine: Engine to open the connection from.
+        execution_options: Execution options applied to the connection.
+        metrics: Dictionary updated in place with the number of chunks, rows
+            and in-memory bytes read so far.
+
+    Yields:
+        The chunks of the query result.
+    """
+    metrics.update(chunks=0, rows=0, bytes=0)
+    with engine.connect() as connection:
+        streaming_connection = connection.execution_options(
+            **{"stream_results": True, **execution_options}
+        )
+        for chunk in read_func(con=streaming_connection):
+            metrics["chunks"] += 1
+            metrics["rows"] += len(chunk)
+            metrics["bytes"] += int(chunk.memory_usage(deep=True).sum())
+            yield chunk
+
+
+_COPY_NULL = r"\N"
+
+
+def _copy_csv_field(value: Any) -> str:
+    # every value is quoted, so that only unquoted ``_COPY_NULL`` markers are
+    # loaded as NULL and empty strings are kept
+    if value is None:
+        return _COPY_NULL
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _insert_copy(table: Any, conn: Any, keys: list[str], data_iter: Iterable) -> int:
+    """``to_sql`` insertion method using PostgreSQL ``COPY FROM STDIN``.
+
+    Rows are serialised to an in-memory CSV buffer and streamed to the
+    server in a single ``COPY`` statement, which is considerably faster
+    than ``INSERT`` statements for large frames. Missing values are written
+    as an explicit NULL marker, so empty strings are not loaded as NULL.
+    Requires ``psycopg2``.
+    """
+    buffer = io.StringIO()
+    buffer.writelines(
+        ",".join(_copy_csv_field(value) for value in row) + "\n" for row in data_iter
+    )
+    buffer.seek(0)
+
+    preparer = conn.dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(key) for key in keys)
+    table_name = preparer.format_table(table.table)
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table_name} ({columns}) FROM STDIN "
+            f"WITH (FORMAT CSV, NULL '{_COPY_NULL}')",
+            buffer,
+        )
+        return cursor.rowcount
+
+
+def _insert_fast_executemany(
+    table: Any, conn: Any, keys: list[str], data_iter: Iterable
+) -> int:
+    """``to_sql`` insertion method using ``pyodbc``'s ``fast_executemany``,
+    which sends all parameters of a chunk in a single round-trip.
+    """
+    preparer = conn.dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(key) for key in keys)
+    placeholders = ", ".join("?" for _ in keys)
+    table_name = preparer.format_table(table.table)
+
+    cursor = conn.connection.cursor()
+    try:
+        cursor.fast_executemany = True
+        cursor.executemany(
+            f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})",
+            list(data_iter),
+        )
+        return cursor.rowcount
+    finally:
+        cursor.close()
+
+
+BULK_INSERT_METHODS: dict[str, Callable[..., int]] = {
+    "copy": _insert_copy,
+    "fast_executemany": _insert_fast_executemany,
+}
+
+
+class _QueryResultCache:
+    """Local cache of query results stored as Parquet files, one per key.
+
+    Entries older than ``ttl`` seconds are ignored and removed, and the least
+    recently used entries are evicted once the cache grows beyond
+    ``max_size`` bytes. Files are written to a temporary path and renamed, so
+    the cache can be shared by several processes of the same user.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+        ttl: float | None = None,
+        max_size: int | None = None,
+    ) -> None:
+        self._path = Path(path or user_cache_dir("sql"))
+        self._ttl = ttl
+        self._max_size = max_size
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Hash the given parts into a cache key."""
+        serialised = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(serialised.encode("utf-8")).hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self._path / f"{key}.parquet"
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """Return the cached result for ``key``, or None if it is missing or expired."""
+        ensure_private_dir(self._path)
+        entry = self._entry(key)
+        try:
+            modified = entry.stat().st_mtime
+            if self._ttl is not None and time.time() - modified > self._ttl:
+                entry.unlink()
+                return None
+            data = pd.read_parquet(entry)
+            mark_used(entry)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def put(self, key: str, data: pd.DataFrame) -> None:
+        """Store ``data`` under ``key`` and evict entries beyond ``max_size``.
+        Data which can't be written as Parquet is not cached."""
+        ensure_private_dir(self._path)
+        fd, tmp_path = tempfile.mkstemp(dir=self._path, suffix=".tmp")
+        os.close(fd)
+        try:
+            data.to_parquet(tmp_path)
+            os.replace(tmp_path, self._entry(key))
+        except Exception as exc:
+            logger.warning("Failed to cache the query result: %s", exc)
+            return
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self._evict()
+
+    def _evict(self) -> None:
+        if self._max_size is None:
+            return
+        evict_lru(self._path.glob("*.parquet"), self._max_size)
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Remove the entry for ``key``, or every entry if no key is given."""
+        entries = [self._entry(key)] if key else self._path.glob("*.parquet")
+        for entry in entries:
+            entry.unlink(missing_ok=True)
+
+
+# Engines are shared by ``SQLTableDataset`` and ``SQLQueryDataset`` so that
+# datasets pointing at the same database reuse a single connection pool.
+# using Any because of Sphinx but it should be
+# sqlalchemy.engine.Engine or sqlalchemy.engine.base.Engine
+_ENGINES: dict[str, Any] = {}
+# ``engine_args`` which the engines were created with, by connection string
+_ENGINE_ARGS: dict[str, dict[str, Any]] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def _warn_ignored_engine_args(connection_str: str, engine_args: dict[str, Any]) -> None:
+    created_with = _ENGINE_ARGS.get(connection_str, {})
+    if engine_args and engine_args != created_with:
+        logger.warning(
+            "Ignoring 'engine_args' %s, as the engine shared by the datasets "
+            "using the same connection string was created with %s.",
+            engine_args,
+            created_with,
+        )
+
+
 class SQLTableDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
     """``SQLTableDataset`` loads data from a SQL table and saves a pandas
     dataframe to a table. It uses ``pandas.DataFrame`` internally,
@@ -104,6 +315,47 @@ class SQLTableDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
     the data with no index. This is designed to make load and save methods
     symmetric.
 
+    If ``chunksize`` is set in ``load_args``, ``load`` returns an iterator of
+    dataframes read with a server-side cursor, and ``stream_metrics`` reports
+    the chunks, rows and bytes read so far. ``save`` accepts such an iterator
+    and writes it chunk by chunk, appending after the first one, so tables
+    can be copied with bounded memory.
+
+    Large frames can be written with a bulk insertion ``method``: ``copy``
+    uses PostgreSQL ``COPY FROM STDIN`` (requires ``psycopg2``),
+    ``fast_executemany`` uses ``pyodbc``'s batched parameters, and ``multi``
+    sends multi-row ``INSERT`` statements on other backends. With
+    ``transaction_per_chunk``, every ``chunksize`` rows are committed in their
+    own transaction:
+
+    .. code-block:: yaml
+
+        shuttles_table_dataset:
+          type: pandas.SQLTableDataset
+          credentials: db_credentials
+          table_name: shuttles
+          save_args:
+            if_exists: replace
+            method: copy
+            chunksize: 100000
+            transaction_per_chunk: true
+
+    Engines are created once per connection string, under a lock, and shared
+    with ``SQLQueryDataset``. Their connection pool can be tuned through
+    ``engine_args``:
+
+    .. code-block:: yaml
+
+        shuttles_table_dataset:
+          type: pandas.SQLTableDataset
+          credentials: db_credentials
+          table_name: shuttles
+          engine_args:
+            pool_size: 5
+            max_overflow: 10
+            pool_pre_ping: true
+            pool_recycle: 3600
+
     Example usage for the
     `YAML API <https://kedro.readthedocs.io/en/stable/data/\
     data_catalog_yaml_examples.html>`_:
@@ -150,9 +402,7 @@ class SQLTableDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
 
     DEFAULT_LOAD_ARGS: dict[str, Any] = {}
     DEFAULT_SAVE_ARGS: dict[str, Any] = {"index": False}
-    # using Any because of Sphinx but it should be
-    # sqlalchemy.engine.Engine or sqlalchemy.engine.base.Engine
-    engines: dict[str, Any] = {}
+    engines: dict[str, Any] = _ENGINES
 
     def __init__(  # noqa: PLR0913
         self,
@@ -161,6 +411,7 @@ class SQLTableDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
         credentials: dict[str, Any],
         load_args: dict[str, Any] = None,
         save_args: dict[str, Any] = None,
+        engine_args: dict[str, Any] | None = None,
         metadata: dict[str, Any] = None,
     ) -> None:
         """Creates a new ``SQLTableDataset``.
@@ -187,11 +438,28 @@ class SQLTableDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
                 To find all supported connection string formats, see here:
                 https://docs.sqlalchemy.org/core/engines.html#database-urls
                 It has ``index=False`` in the default parameters.
+                In addition to the pandas values, ``method`` accepts ``copy``
+                and ``fast_executemany`` for bulk writes to PostgreSQL and
+                through ``pyodbc`` respectively. If ``transaction_per_chunk``
+                is True, each ``chunksize`` rows are written and committed
+                separately instead of in a single transaction, which requires
+                ``chunksize`` to be set.
+            engine_args: Provided to ``sqlalchemy.create_engine`` when the
+                engine for the connection string is first created, e.g.
+                ``pool_size``, ``max_overflow``, ``pool_pre_ping`` or
+                ``pool_recycle``. The engine is shared with every other
+                ``SQLTableDataset`` and ``SQLQueryDataset`` using the same
+                connection string, so the first dataset to connect sets them,
+                and differing ``engine_args`` of other datasets are ignored
+                with a warning.
+                To find all supported arguments, see here:
+                https://docs.sqlalchemy.org/core/engines.html#sqlalchemy.create_engine
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
 
         Raises:
-            DatasetError: When either ``table_name`` or ``con`` is empty.
+            DatasetError: When either ``table_name`` or ``con`` is empty, or
+                ``transaction_per_chunk`` is set without ``chunksize``.
         """
 
         if not table_name:
@@ -211,27 +479,40 @@ class SQLTableDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
         if save_args is not None:
             self._save_args.update(save_args)
 
+        if self._save_args.get("transaction_per_chunk") and not self._save_args.get(
+            "chunksize"
+        ):
+            raise DatasetError(
+                "'transaction_per_chunk' requires 'chunksize' in 'save_args'."
+            )
+
         self._load_args["table_name"] = table_name
         self._save_args["name"] = table_name
 
         self._connection_str = credentials["con"]
+        self._engine_args = engine_args or {}
+        self._engine_args_checked = False
+        self._stream_metrics: dict[str, int] = {}
 
         self.metadata = metadata
 
     @classmethod
-    def create_connection(cls, connection_str: str) -> None:
+    def create_connection(
+        cls, connection_str: str, engine_args: dict[str, Any] | None = None
+    ) -> None:
         """Given a connection string, create singleton connection
         to be used across all instances of ``SQLTableDataset`` that
         need to connect to the same source.
         """
         try:
-            engine = create_engine(connection_str)
+            engine = create_engine(connection_str, **(engine_args or {}))
         except ImportError as import_error:
             raise _get_missing_module_error(import_error) from import_error
         except NoSuchModuleError as exc:
             raise _get_sql_alchemy_missing_error() from exc
 
         cls.engines[connection_str] = engine
+        _ENGINE_ARGS[connection_str] = dict(engine_args or {})
 
     @property
     def engine(self):
@@ -239,7 +520,13 @@ class SQLTableDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
         cls = type(self)
 
         if self._connection_str not in cls.engines:
-            self.create_connection(self._connection_str)
+            with _ENGINES_LOCK:
+                if self._connection_str not in cls.engines:
+                    self.create_connection(self._connection_str, self._engine_args)
+
+        if not self._engine_args_checked:
+            _warn_ignored_engine_args(self._connection_str, self._engine_args)
+            self._engine_args_checked = True
 
         return cls.engines[self._connection_str]
 
@@ -254,11 +541,42 @@ class SQLTableDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
             "save_args": save_args,
         }
 
-    def _load(self) -> pd.DataFrame:
+    @property
+    def stream_metrics(self) -> dict[str, int]:
+        """Number of chunks, rows and in-memory bytes read by the last chunked load."""
+        return dict(self._stream_metrics)
+
+    def _load(self) -> pd.DataFrame | Iterator[pd.DataFrame]:
+        if self._load_args.get("chunksize"):
+            return _read_chunks(
+                partial(pd.read_sql_table, **self._load_args),
+                self.engine,
+                {},
+                self._stream_metrics,
+            )
         return pd.read_sql_table(con=self.engine, **self._load_args)
 
-    def _save(self, data: pd.DataFrame) -> None:
-        data.to_sql(con=self.engine, **self._save_args)
+    def _save(self, data: pd.DataFrame | Iterable[pd.DataFrame]) -> None:
+        save_args = copy.copy(self._save_args)
+        method = save_args.get("method")
+        if isinstance(method, str) and method in BULK_INSERT_METHODS:
+            save_args["method"] = BULK_INSERT_METHODS[method]
+        transaction_per_chunk = save_args.pop("transaction_per_chunk", False)
+        chunksize = save_args.get("chunksize")
+
+        if isinstance(data, pd.DataFrame):
+            if not (transaction_per_chunk and len(data) > chunksize):
+                data.to_sql(con=self.engine, **save_args)
+                return
+            frame = data
+            data = (
+                frame.iloc[start : start + chunksize]
+                for start in range(0, len(frame), chunksize)
+            )
+
+        for chunk in data:
+            chunk.to_sql(con=self.engine, **save_args)
+            save_args["if_exists"] = "append"
 
     def _exists(self) -> bool:
         insp = inspect(self.engine)
@@ -290,7 +608,10 @@ class SQLQueryDataset(AbstractDataset[None, pd.DataFrame]):
           sql: "select shuttle, shuttle_id from spaceflights.shuttles;"
           credentials: db_credentials
 
-    Advanced example using the ``stream_results`` and ``chunksize`` options to reduce memory usage:
+    Advanced example using the ``chunksize`` option to reduce memory usage.
+    ``load`` then returns an iterator of dataframes read with a server-side
+    cursor (``stream_results``), and ``stream_metrics`` reports the chunks,
+    rows and bytes read so far:
 
     .. code-block:: yaml
 
@@ -298,11 +619,25 @@ class SQLQueryDataset(AbstractDataset[None, pd.DataFrame]):
           type: pandas.SQLQueryDataset
           sql: "select shuttle, shuttle_id from spaceflights.shuttles;"
           credentials: db_credentials
-          execution_options:
-            stream_results: true
           load_args:
             chunksize: 1000
 
+    Results of expensive queries can be cached on local disk with ``cache``.
+    Cached results expire after ``ttl`` seconds, the least recently used ones
+    are evicted beyond ``max_size`` bytes, and ``invalidate_cache`` removes the
+    dataset's cached result:
+
+    .. code-block:: yaml
+
+        shuttle_id_dataset:
+          type: pandas.SQLQueryDataset
+          sql: "select shuttle, shuttle_id from spaceflights.shuttles;"
+          credentials: db_credentials
+          cache:
+            path: data/01_raw/.sql_cache
+            ttl: 3600
+            max_size: 1000000000
+
     Sample database credentials entry in ``credentials.yml``:
 
     .. code-block:: yaml
@@ -388,9 +723,7 @@ class SQLQueryDataset(AbstractDataset[None, pd.DataFrame]):
               date: "%Y-%m-%d %H:%M:%S.%f0 %z"
     """
 
-    # using Any because of Sphinx but it should be
-    # sqlalchemy.engine.Engine or sqlalchemy.engine.base.Engine
-    engines: dict[str, Any] = {}
+    engines: dict[str, Any] = _ENGINES
 
     def __init__(  # noqa: PLR0913
         self,
@@ -400,6 +733,8 @@ class SQLQueryDataset(AbstractDataset[None, pd.DataFrame]):
         fs_args: dict[str, Any] = None,
         filepath: str = None,
         execution_options: dict[str, Any] | None = None,
+        engine_args: dict[str, Any] | None = None,
+        cache: dict[str, Any] | None = None,
         metadata: dict[str, Any] = None,
     ) -> None:
         """Creates a new ``SQLQueryDataset``.
@@ -432,6 +767,26 @@ class SQLQueryDataset(AbstractDataset[None, pd.DataFrame]):
                 https://docs.sqlalchemy.org/core/connections.html#sqlalchemy.engine.Connection.execution_options
                 Note that this is not a standard argument supported by pandas API, but could be
                 useful for handling large datasets.
+            engine_args: Provided to ``sqlalchemy.create_engine`` when the
+                engine for the connection string is first created, e.g.
+                ``pool_size``, ``max_overflow``, ``pool_pre_ping`` or
+                ``pool_recycle``. The engine is shared with every other
+                ``SQLTableDataset`` and ``SQLQueryDataset`` using the same
+                connection string, so the first dataset to connect sets them,
+                and differing ``engine_args`` of other datasets are ignored
+                with a warning.
+                To find all supported arguments, see here:
+                https://docs.sqlalchemy.org/core/engines.html#sqlalchemy.create_engine
+            cache: Enables a local cache of query results, keyed by a hash
+                of the query, ``load_args`` and connection string, and stored
+                as Parquet files (requires ``pyarrow``). Accepts ``path``, the
+                cache directory, which must be owned by the current user (a
+                directory in the user's cache directory, e.g.
+                ``~/.cache/kedro-datasets/sql``, by default), ``ttl``, the number
+                of seconds after which results are queried again, and
+                ``max_size``, the size in bytes beyond which the least
+                recently used results are evicted. Chunked loads are not
+                cached.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
 
@@ -481,23 +836,31 @@ class SQLQueryDataset(AbstractDataset[None, pd.DataFrame]):
             self._filepath = path
         self._connection_str = credentials["con"]
         self._execution_options = execution_options or {}
+        self._engine_args = engine_args or {}
+        self._engine_args_checked = False
+        self._cache_args = cache
+        self._cache = _QueryResultCache(**cache) if cache is not None else None
+        self._stream_metrics: dict[str, int] = {}
         if "mssql" in self._connection_str:
             self.adapt_mssql_date_params()
 
     @classmethod
-    def create_connection(cls, connection_str: str) -> None:
+    def create_connection(
+        cls, connection_str: str, engine_args: dict[str, Any] | None = None
+    ) -> None:
         """Given a connection string, create singleton connection
         to be used across all instances of `SQLQueryDataset` that
         need to connect to the same source.
         """
         try:
-            engine = create_engine(connection_str)
+            engine = create_engine(connection_str, **(engine_args or {}))
         except ImportError as import_error:
             raise _get_missing_module_error(import_error) from import_error
         except NoSuchModuleError as exc:
             raise _get_sql_alchemy_missing_error() from exc
 
         cls.engines[connection_str] = engine
+        _ENGINE_ARGS[connection_str] = dict(engine_args or {})
 
     @property
     def engine(self):
@@ -505,7 +868,13 @@ class SQLQueryDataset(AbstractDataset[None, pd.DataFrame]):
         cls = type(self)
 
         if self._connection_str not in cls.engines:
-            self.create_connection(self._connection_str)
+            with _ENGINES_LOCK:
+                if self._connection_str not in cls.engines:
+                    self.create_connection(self._connection_str, self._engine_args)
+
+        if not self._engine_args_checked:
+            _warn_ignored_engine_args(self._connection_str, self._engine_args)
+            self._engine_args_checked = True
 
         return cls.engines[self._connection_str]
 
@@ -516,9 +885,16 @@ class SQLQueryDataset(AbstractDataset[None, pd.DataFrame]):
             "filepath": str(self._filepath),
             "load_args": str(load_args),
             "execution_options": str(self._execution_options),
+            # left out of the representation when the cache is not enabled
+            "cache": str(self._cache_args) if self._cache_args is not None else None,
         }
 
-    def _load(self) -> pd.DataFrame:
+    @property
+    def stream_metrics(self) -> dict[str, int]:
+        """Number of chunks, rows and in-memory bytes read by the last chunked load."""
+        return dict(self._stream_metrics)
+
+    def _get_load_args(self) -> dict[str, Any]:
         load_args = copy.deepcopy(self._load_args)
 
         if self._filepath:
@@ -526,6 +902,40 @@ class SQLQueryDataset(AbstractDataset[None, pd.DataFrame]):
             with self._fs.open(load_path, mode="r") as fs_file:
                 load_args["sql"] = fs_file.read()
 
+        return load_args
+
+    def _cache_key(self, load_args: dict[str, Any]) -> str:
+        return _QueryResultCache.key(load_args, str(self._connection_str))
+
+    def invalidate_cache(self) -> None:
+        """Remove the cached result of the dataset's query, so that the next
+        load runs the query again. Does nothing if the cache is not enabled.
+        """
+        if self._cache is not None:
+            self._cache.invalidate(self._cache_key(self._get_load_args()))
+
+    def _load(self) -> pd.DataFrame | Iterator[pd.DataFrame]:
+        load_args = self._get_load_args()
+
+        if load_args.get("chunksize"):
+            return _read_chunks(
+                partial(pd.read_sql_query, **load_args),
+                self.engine,
+                self._execution_options,
+                self._stream_metrics,
+            )
+
+        if self._cache is None:
+            return self._read_query(load_args)
+
+        key = self._cache_key(load_args)
+        data = self._cache.get(key)
+        if data is None:
+            data = self._read_query(load_args)
+            self._cache.put(key, data)
+        return data
+
+    def _read_query(self, load_args: dict[str, Any]) -> pd.DataFrame:
         return pd.read_sql_query(
             con=self.engine.execution_options(**self._execution_options), **load_args
         )
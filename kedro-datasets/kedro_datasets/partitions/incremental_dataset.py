@@ -8,6 +8,7 @@ new partitions past the checkpoint.It also uses `fsspec` for filesystem level op
 from __future__ import annotations
 
 import operator
+from collections.abc import Iterator
 from copy import deepcopy
 from typing import Any, Callable
 
@@ -26,6 +27,7 @@ from .partitioned_dataset import (
     KEY_PROPAGATION_WARNING,
     PartitionedDataset,
     _grandparent,
+    _run_bounded,
 )
 
 
@@ -37,6 +39,8 @@ class IncrementalDataset(PartitionedDataset):
     the information about the last processed partition in so-called `checkpoint`
     that is persisted to the location of the data partitions by default, so that
     subsequent pipeline run loads only new partitions past the checkpoint.
+    With the default comparison, directories holding only partitions before the
+    checkpoint are skipped while listing.
 
     Example:
 
@@ -54,6 +58,23 @@ class IncrementalDataset(PartitionedDataset):
         >>> dataset.release()  # clears load cache
         >>> # returns an empty dictionary as no new partitions were added
         >>> assert dataset.load() == {}
+
+    A large backlog of new partitions can be loaded concurrently and drained
+    in batches of bounded size. With ``batch_size`` set, ``load`` returns a
+    generator of dictionaries and the checkpoint is advanced to the last
+    partition of a batch as soon as the next batch is requested:
+
+    .. code-block:: pycon
+
+        >>> dataset = IncrementalDataset(
+        ...     path=str(tmp_path / "test_data"),
+        ...     dataset="pandas.CSVDataset",
+        ...     max_workers=8,
+        ...     batch_size=100,
+        ... )
+        >>> for batch in dataset.load():
+        ...     pass  # process up to 100 partitions at a time
+        ...
     """
 
     DEFAULT_CHECKPOINT_TYPE = "kedro_datasets.text.TextDataset"
@@ -69,7 +90,13 @@ class IncrementalDataset(PartitionedDataset):
         filename_suffix: str = "",
         credentials: dict[str, Any] = None,
         load_args: dict[str, Any] = None,
+        save_args: dict[str, Any] = None,
         fs_args: dict[str, Any] = None,
+        manifest: bool | dict[str, Any] | None = None,
+        filters: list | None = None,
+        add_partition_columns: bool = False,
+        max_workers: int | None = None,
+        batch_size: int | None = None,
         metadata: dict[str, Any] = None,
     ) -> None:
         """Creates a new instance of ``IncrementalDataset``.
@@ -114,8 +141,25 @@ class IncrementalDataset(PartitionedDataset):
                 https://kedro.readthedocs.io/en/stable/data/kedro_io.html#partitioned-dataset-credentials
             load_args: Keyword arguments to be passed into ``find()`` method of
                 the filesystem implementation.
+            save_args: Options controlling how partitions are saved, e.g.
+                ``max_workers`` to write partitions concurrently. See
+                ``PartitionedDataset`` for details.
             fs_args: Extra arguments to pass into underlying filesystem class constructor
                 (e.g. `{"project": "my-project"}` for ``GCSFileSystem``).
+            manifest: Optional partition manifest configuration read instead of
+                listing the filesystem. See ``PartitionedDataset`` for details.
+            filters: Predicates on Hive-style ``key=value`` path segments used
+                to prune partitions while listing. See ``PartitionedDataset``
+                for the supported syntax.
+            add_partition_columns: If True, the Hive-style partition keys of
+                each partition are added as columns to the loaded data.
+            max_workers: If specified, new partitions are loaded concurrently
+                by a thread pool of this size.
+            batch_size: If specified, ``load`` returns a generator yielding
+                dictionaries of at most ``batch_size`` new partitions, so that
+                only one batch is held in memory at a time. The checkpoint is
+                saved after each batch has been consumed, i.e. when the next
+                batch is requested or the generator is exhausted.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
 
@@ -130,9 +174,16 @@ class IncrementalDataset(PartitionedDataset):
             filename_suffix=filename_suffix,
             credentials=credentials,
             load_args=load_args,
+            save_args=save_args,
             fs_args=fs_args,
+            manifest=manifest,
+            filters=filters,
+            add_partition_columns=add_partition_columns,
         )
 
+        self._max_workers = max_workers
+        self._batch_size = batch_size
+
         self._checkpoint_config = self._parse_checkpoint_config(checkpoint)
         self._force_checkpoint = self._checkpoint_config.pop("force_checkpoint", None)
         self.metadata = metadata
@@ -185,7 +236,7 @@ class IncrementalDataset(PartitionedDataset):
         def _is_valid_partition(partition) -> bool:
             if not partition.endswith(self._filename_suffix):
                 return False
-            if partition == checkpoint_path:
+            if partition == checkpoint_path or partition in self._manifest_paths:
                 return False
             if checkpoint is None:
                 # nothing was processed yet
@@ -195,10 +246,55 @@ class IncrementalDataset(PartitionedDataset):
 
         return sorted(
             _grandparent(path) if dataset_is_versioned else path
-            for path in self._filesystem.find(self._normalized_path, **self._load_args)
+            for path in self._list_new_paths(checkpoint)
             if _is_valid_partition(path)
         )
 
+    def _list_new_paths(self, checkpoint: str | None) -> list[str]:
+        """List files that may hold partitions past the checkpoint.
+
+        With the default lexicographic comparison, subdirectories whose
+        partition ids all sort before the checkpoint are not listed at all,
+        so that each run costs in proportion to the new partitions rather
+        than the whole history. The bound cannot be derived for custom
+        comparison functions, versioned datasets, manifests or filters, in
+        which case all partitions are listed.
+        """
+        if (
+            checkpoint is None
+            or self._comparison_func is not operator.gt
+            or VERSION_KEY in self._dataset_config
+            or self._sep in self._filename_suffix
+            or self._manifest_config is not None
+            or self._filters
+        ):
+            return self._list_paths()
+
+        find_args = dict(self._load_args)
+        maxdepth = find_args.pop("maxdepth", None)
+        paths = []
+        # directories to list, with the depth of their entries below the path
+        pending = [(self._normalized_path, 1)]
+        while pending:
+            path, depth = pending.pop()
+            for info in self._filesystem.ls(path, detail=True):
+                name = info["name"].rstrip(self._sep)
+                if info["type"] != "directory":
+                    paths.append(name)
+                    continue
+                if maxdepth is not None and depth >= maxdepth:
+                    continue
+                relative_path = name.split(self._stripped_path, 1).pop()
+                prefix = relative_path.lstrip(self._sep) + self._sep
+                if prefix > checkpoint[: len(prefix)]:
+                    # every partition below sorts after the checkpoint
+                    if maxdepth is not None:
+                        find_args["maxdepth"] = maxdepth - depth
+                    paths.extend(self._filesystem.find(name, **find_args))
+                elif checkpoint.startswith(prefix):
+                    pending.append((name, depth + 1))
+        return paths
+
     @property
     def _checkpoint(self) -> AbstractDataset:
         type_, kwargs = parse_dataset_definition(self._checkpoint_config)
@@ -212,19 +308,38 @@ class IncrementalDataset(PartitionedDataset):
         except DatasetError:
             return None
 
-    def _load(self) -> dict[str, Callable[[], Any]]:
-        partitions: dict[str, Any] = {}
+    def _load(self) -> dict[str, Any] | Iterator[dict[str, Any]]:
+        loaders = self._partition_loaders()
+        if self._batch_size:
+            return self._iter_batches(loaders)
+        return self._load_partitions(loaders)
 
-        for partition in self._list_partitions():
-            partition_id = self._path_to_partition(partition)
-            kwargs = deepcopy(self._dataset_config)
-            # join the protocol back since PySpark may rely on it
-            kwargs[self._filepath_arg] = self._join_protocol(partition)
-            partitions[partition_id] = self._dataset_type(  # type: ignore
-                **kwargs
-            ).load()
-
-        return partitions
+    def _load_partitions(self, loaders: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+        if not self._max_workers:
+            return {
+                partition_id: load_func() for partition_id, load_func in loaders.items()
+            }
+
+        loaded = {
+            partition_id: future.result()
+            for partition_id, future in _run_bounded(
+                loaders.items(), max_workers=self._max_workers
+            )
+        }
+        # preserve the order of the partitions regardless of completion order
+        return {partition_id: loaded[partition_id] for partition_id in loaders}
+
+    def _iter_batches(
+        self, loaders: dict[str, Callable[[], Any]]
+    ) -> Iterator[dict[str, Any]]:
+        partition_ids = list(loaders)
+        for start in range(0, len(partition_ids), self._batch_size):
+            batch_ids = partition_ids[start : start + self._batch_size]
+            yield self._load_partitions(
+                {partition_id: loaders[partition_id] for partition_id in batch_ids}
+            )
+            # the consumer asked for the next batch, so this one was processed
+            self._checkpoint.save(batch_ids[-1])
 
     def confirm(self) -> None:
         """Confirm the dataset by updating the checkpoint value to the latest
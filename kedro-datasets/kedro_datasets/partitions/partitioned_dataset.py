@@ -4,16 +4,29 @@ underlying dataset definition. It also uses `fsspec` for filesystem level operat
 from __future__ import annotations
 
 import operator
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from copy import deepcopy
+from functools import cached_property, partial
+from itertools import islice
 from pathlib import PurePosixPath
 from typing import Any, Callable
-from urllib.parse import urlparse
+from urllib.parse import unquote, urlparse
 from warnings import warn
 
 import fsspec
 from cachetools import Cache, cachedmethod
 from kedro.io.core import (
     VERSION_KEY,
+    VERSIONED_FLAG_KEY,
     AbstractDataset,
     DatasetError,
     parse_dataset_definition,
@@ -27,6 +40,23 @@ KEY_PROPAGATION_WARNING = (
 
 S3_PROTOCOLS = ("s3", "s3a", "s3n")
 
+FILTER_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda value, values: value in values,
+    "not in": lambda value, values: value not in values,
+}
+
+EXECUTOR_TYPES: dict[str, type[Executor]] = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
 
 def _grandparent(path: str) -> str:
     """Check and return the logical parent of the parent of the path."""
@@ -41,6 +71,187 @@ def _grandparent(path: str) -> str:
     return str(grandparent)
 
 
+def _parse_filters(filters: list | None) -> list[list[tuple[str, str, Any]]]:
+    """Normalise ``filters`` given either as a single conjunction of
+    ``(key, op, value)`` predicates or as a disjunction of such conjunctions."""
+    if not filters:
+        return []
+    # an empty first item is taken for an empty conjunction, which is rejected
+    is_dnf = isinstance(filters[0], (list, tuple)) and (
+        not filters[0] or isinstance(filters[0][0], (list, tuple))
+    )
+    disjunction = filters if is_dnf else [filters]
+
+    parsed = []
+    for conjunction in disjunction:
+        if not conjunction:
+            raise DatasetError(
+                f"Malformed filter {conjunction}. Conjunctions of filters must "
+                f"contain at least one '(key, op, value)' predicate."
+            )
+        predicates = []
+        for predicate in conjunction:
+            try:
+                key, op, value = predicate
+            except ValueError:
+                op = None
+            if op not in FILTER_OPERATORS:
+                raise DatasetError(
+                    f"Malformed filter {predicate}. Filters must be "
+                    f"'(key, op, value)' where op is one of "
+                    f"{list(FILTER_OPERATORS)}."
+                )
+            if op in ("in", "not in") and (
+                not isinstance(value, Iterable) or isinstance(value, (str, bytes))
+            ):
+                raise DatasetError(
+                    f"Malformed filter {predicate}. The value of '{op}' filters "
+                    f"must be a collection of values, such as a list."
+                )
+            predicates.append((key, op, value))
+        parsed.append(predicates)
+    return parsed
+
+
+def _parse_partition_value(value: str) -> Any:
+    """Cast a Hive-style partition value to ``int`` or ``float`` when possible."""
+    value = unquote(value)
+    if any(char.isdigit() for char in value):
+        for cast in (int, float):
+            try:
+                return cast(value)
+            except ValueError:
+                pass
+    return value
+
+
+def _matches_filters(
+    keys: dict[str, Any],
+    filters: list[list[tuple[str, str, Any]]],
+    partial: bool = False,
+) -> bool:
+    """Evaluate ``filters`` in disjunctive normal form against partition keys.
+    With ``partial=True`` predicates on keys that are not known yet are
+    treated as satisfied, which allows pruning directories while walking.
+    """
+
+    def _evaluate(key: str, op: str, value: Any) -> bool:
+        if key not in keys:
+            return partial
+        try:
+            return FILTER_OPERATORS[op](keys[key], value)
+        except TypeError:
+            return False
+
+    return any(
+        all(_evaluate(*predicate) for predicate in conjunction)
+        for conjunction in filters
+    )
+
+
+class _LazyPartition:
+    """Callable handle loading a single partition. The underlying dataset is
+    only instantiated on access, from a deep copy of the configuration shared
+    by all partitions of the parent dataset, so that listing many partitions
+    does not pay the construction cost of datasets that are never loaded.
+    """
+
+    __slots__ = ("_dataset_type", "_dataset_config", "_filepath_arg", "_filepath")
+
+    def __init__(
+        self,
+        dataset_type: type[AbstractDataset],
+        dataset_config: dict[str, Any],
+        filepath_arg: str,
+        filepath: str,
+    ) -> None:
+        self._dataset_type = dataset_type
+        self._dataset_config = dataset_config
+        self._filepath_arg = filepath_arg
+        self._filepath = filepath
+
+    @property
+    def dataset(self) -> AbstractDataset:
+        # nested arguments are copied, so datasets cannot modify the shared ones
+        kwargs = deepcopy(self._dataset_config)
+        kwargs[self._filepath_arg] = self._filepath
+        return self._dataset_type(**kwargs)  # type: ignore
+
+    def __call__(self) -> Any:
+        return self.dataset.load()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._filepath_arg}={self._filepath!r})"
+
+
+def _add_partition_columns(
+    load_func: Callable[[], Any], partition_keys: dict[str, Any]
+) -> Any:
+    data = load_func()
+    if not hasattr(data, "assign"):
+        raise DatasetError(
+            f"Cannot add partition columns to data of type "
+            f"'{type(data).__name__}'. Only data supporting "
+            f"'assign', such as 'pandas.DataFrame', is supported."
+        )
+    return data.assign(**partition_keys)
+
+
+def _manifest_entry(path: str, info: dict[str, Any]) -> dict[str, Any]:
+    """Build a JSON-serialisable manifest record from ``fsspec`` file info."""
+    mtime = info.get("mtime", info.get("LastModified"))
+    if hasattr(mtime, "isoformat"):
+        mtime = mtime.isoformat()
+    return {
+        "path": path,
+        "size": info.get("size"),
+        "mtime": mtime,
+        "etag": info.get("ETag", info.get("etag")),
+    }
+
+
+def _default_max_workers() -> int:
+    """Mirror the ``ThreadPoolExecutor`` default pool size."""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def _run_bounded(
+    tasks: Iterable[tuple[str, Callable[[], Any]]],
+    max_workers: int | None = None,
+    executor: str = "thread",
+) -> Iterator[tuple[str, Future]]:
+    """Run keyed callables in a worker pool and yield ``(key, future)`` pairs
+    in completion order. At most ``2 * max_workers`` tasks are submitted at
+    any time, so ``tasks`` is only consumed as fast as the pool drains it.
+    """
+    if executor not in EXECUTOR_TYPES:
+        raise DatasetError(
+            f"Unknown executor '{executor}'. "
+            f"Supported executors are: {sorted(EXECUTOR_TYPES)}."
+        )
+    max_workers = max_workers or _default_max_workers()
+    window = 2 * max_workers
+    tasks = iter(tasks)
+    in_flight: dict[Future, str] = {}
+
+    with EXECUTOR_TYPES[executor](max_workers=max_workers) as pool:
+
+        def _submit() -> None:
+            for key, func in islice(tasks, window - len(in_flight)):
+                in_flight[pool.submit(func)] = key
+
+        try:
+            _submit()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield in_flight.pop(future), future
+                _submit()
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
 class PartitionedDataset(AbstractDataset[dict[str, Any], dict[str, Callable[[], Any]]]):
     """``PartitionedDataset`` loads and saves partitioned file-like data using the
     underlying dataset definition. For filesystem level operations it uses `fsspec`:
@@ -137,8 +348,51 @@ class PartitionedDataset(AbstractDataset[dict[str, Any], dict[str, Callable[[],
         >>> # creates "s3://bucket-name/path/to/folder/new/partition.csv"
         >>> dataset.save({"new/partition.csv": new_data})
 
+    Partitions can also be fetched concurrently, which helps when load time is
+    dominated by per-request latency (e.g. many small objects in S3):
+
+    .. code-block:: pycon
+
+        >>> # yields partitions as soon as they are loaded, 16 at a time
+        >>> for partition_id, partition_data in dataset.iter_loaded(max_workers=16):
+        ...     pass
+        ...
+        >>> # or load everything into a dictionary keyed by partition id
+        >>> all_partitions = dataset.load_all(max_workers=16)
+
+    Hive-style partitions such as ``year=2024/month=05/data.csv`` can be pruned
+    while listing with ``filters``, so that only matching prefixes are walked.
+    The partition keys can also be added as columns to the loaded data:
+
+    .. code-block:: yaml
+
+        sales:
+          type: partitions.PartitionedDataset
+          path: s3://bucket-name/sales
+          dataset: pandas.ParquetDataset
+          filters:
+            - [year, "=", 2024]
+            - [month, in, [5, 6]]
+          add_partition_columns: true
+
+    Listing very large prefixes can be avoided by keeping a manifest of the
+    partitions next to the data. Saves write it and keep it up to date, and
+    later instances read it instead of walking the filesystem:
+
+    .. code-block:: yaml
+
+        station_data:
+          type: partitions.PartitionedDataset
+          path: s3://bucket-name/station_data
+          dataset: pandas.CSVDataset
+          manifest:
+            reconcile: true
+
     """
 
+    DEFAULT_MANIFEST_TYPE = "kedro_datasets.json.JSONDataset"
+    DEFAULT_MANIFEST_FILENAME = "_partitions.json"
+
     def __init__(  # noqa: PLR0913
         self,
         *,
@@ -148,8 +402,12 @@ class PartitionedDataset(AbstractDataset[dict[str, Any], dict[str, Callable[[],
         filename_suffix: str = "",
         credentials: dict[str, Any] = None,
         load_args: dict[str, Any] = None,
+        save_args: dict[str, Any] = None,
         fs_args: dict[str, Any] = None,
         overwrite: bool = False,
+        manifest: bool | dict[str, Any] | None = None,
+        filters: list | None = None,
+        add_partition_columns: bool = False,
         metadata: dict[str, Any] = None,
     ) -> None:
         """Creates a new instance of ``PartitionedDataset``.
@@ -185,15 +443,46 @@ class PartitionedDataset(AbstractDataset[dict[str, Any], dict[str, Callable[[],
                 All possible credentials management scenarios are documented here:
                 https://kedro.readthedocs.io/en/stable/data/kedro_io.html#partitioned-dataset-credentials
             load_args: Keyword arguments to be passed into ``find()`` method of
-                the filesystem implementation.
+                the filesystem implementation. ``maxdepth`` also limits the
+                directories walked when listing with ``filters``.
+            save_args: Options controlling how partitions are saved. If
+                ``max_workers`` is set, partitions (including lazy ones) are
+                materialised and written concurrently by a pool of that size,
+                with at most ``2 * max_workers`` partitions in flight at once.
+                ``executor`` selects a ``"thread"`` (default) or ``"process"``
+                pool. Failures are collected and reported together once all
+                partitions have been attempted.
             fs_args: Extra arguments to pass into underlying filesystem class constructor
                 (e.g. `{"project": "my-project"}` for ``GCSFileSystem``).
             overwrite: If True, any existing partitions will be removed.
+            manifest: Optional partition manifest configuration. If ``True``,
+                the path, size, modification time, ETag and partition id of
+                every partition are kept in ``_partitions.json`` inside
+                ``path`` and read instead of listing the filesystem. The
+                manifest is only written by successful saves; until then the
+                filesystem is listed. ``_partitions.json`` is never listed as a
+                partition. Accepts a dictionary with the corresponding dataset
+                definition including ``filepath`` to store the manifest
+                elsewhere. Setting ``reconcile: True`` in the dictionary re-lists
+                only the newest known top-level prefix and prefixes missing
+                from the manifest, and drops the top-level prefixes which no
+                longer exist.
+            filters: Predicates on Hive-style ``key=value`` path segments,
+                given as ``(key, op, value)`` tuples where op is one of
+                ``=``, ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in`` and
+                ``not in``. A list of tuples is a conjunction; a list of lists
+                of tuples is a disjunction of conjunctions, as in ``pyarrow``.
+                Partition values are cast to ``int`` or ``float`` when possible.
+                Directories that cannot match are not listed.
+            add_partition_columns: If True, the Hive-style partition keys of
+                each partition are added as columns to the loaded data, which
+                must support ``assign`` like ``pandas.DataFrame``.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
 
         Raises:
-            DatasetError: If versioning is enabled for the underlying dataset.
+            DatasetError: If versioning is enabled for the underlying dataset
+                or for the manifest, or if ``filters`` are malformed.
         """
         from fsspec.utils import infer_storage_options  # for performance reasons
 
@@ -238,10 +527,44 @@ class PartitionedDataset(AbstractDataset[dict[str, Any], dict[str, Callable[[],
             )
 
         self._load_args = deepcopy(load_args) or {}
+        self._save_args = deepcopy(save_args) or {}
+        self._filters = _parse_filters(filters)
+        self._add_partition_columns = add_partition_columns
         self._sep = self._filesystem.sep
+
+        self._manifest_config = self._parse_manifest_config(manifest)
+        self._reconcile = bool(
+            self._manifest_config and self._manifest_config.pop("reconcile", False)
+        )
+
         # since some filesystem implementations may implement a global cache
         self._invalidate_caches()
 
+    def _parse_manifest_config(
+        self, manifest_config: bool | dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        if not manifest_config:
+            return None
+        manifest_config = {} if manifest_config is True else deepcopy(manifest_config)
+
+        for key in {VERSION_KEY, VERSIONED_FLAG_KEY} & manifest_config.keys():
+            raise DatasetError(
+                f"'{self.__class__.__name__}' does not support versioning of the "
+                f"manifest. Please remove '{key}' key from the manifest definition."
+            )
+
+        default_manifest_path = self._sep.join(
+            [self._normalized_path.rstrip(self._sep), self.DEFAULT_MANIFEST_FILENAME]
+        )
+        default_config = {
+            "type": self.DEFAULT_MANIFEST_TYPE,
+            "filepath": default_manifest_path,
+        }
+        if self._credentials:
+            default_config[CREDENTIALS_KEY] = deepcopy(self._credentials)
+
+        return {**default_config, **manifest_config}
+
     @property
     def _filesystem(self):
         protocol = "s3" if self._protocol in S3_PROTOCOLS else self._protocol
@@ -253,15 +576,163 @@ class PartitionedDataset(AbstractDataset[dict[str, Any], dict[str, Callable[[],
             return urlparse(self._path)._replace(scheme="s3").geturl()
         return self._path
 
+    @cached_property
+    def _stripped_path(self) -> str:
+        return self._filesystem._strip_protocol(self._normalized_path)
+
+    @cached_property
+    def _manifest_paths(self) -> set[str]:
+        """Paths of the default and the configured manifest, which are not
+        partitions even when they are stored inside ``path``."""
+        paths = {
+            self._sep.join(
+                [self._stripped_path.rstrip(self._sep), self.DEFAULT_MANIFEST_FILENAME]
+            )
+        }
+        if self._manifest_config is not None:
+            paths.add(self._manifest_path)
+        return paths
+
     @cachedmethod(cache=operator.attrgetter("_partition_cache"))
     def _list_partitions(self) -> list[str]:
         dataset_is_versioned = VERSION_KEY in self._dataset_config
         return [
             _grandparent(path) if dataset_is_versioned else path
-            for path in self._filesystem.find(self._normalized_path, **self._load_args)
-            if path.endswith(self._filename_suffix)
+            for path in self._list_paths()
+            if path.endswith(self._filename_suffix) and path not in self._manifest_paths
+        ]
+
+    def _list_paths(self) -> list[str]:
+        if self._manifest_config is not None:
+            paths = self._list_manifest_paths()
+        elif self._filters:
+            paths = self._walk(self._normalized_path, {})
+        else:
+            return self._filesystem.find(self._normalized_path, **self._load_args)
+
+        if not self._filters:
+            return paths
+        return [
+            path
+            for path in paths
+            if _matches_filters(self._partition_keys(path), self._filters)
         ]
 
+    def _partition_keys(self, path: str) -> dict[str, Any]:
+        keys = {}
+        for segment in self._path_to_partition(path).split(self._sep):
+            key, is_hive_segment, value = segment.partition("=")
+            if is_hive_segment:
+                keys[key] = _parse_partition_value(value)
+        return keys
+
+    def _walk(self, path: str, keys: dict[str, Any], depth: int = 1) -> list[str]:
+        """List files below ``path``, descending only into Hive-style
+        directories that can still match the filters. ``depth`` is the depth
+        of the entries of ``path`` below the dataset path, which is limited by
+        ``maxdepth`` in ``load_args`` as for ``find``."""
+        find_args = dict(self._load_args)
+        maxdepth = find_args.pop("maxdepth", None)
+        paths = []
+        for info in self._filesystem.ls(path, detail=True):
+            name = info["name"].rstrip(self._sep)
+            if info["type"] != "directory":
+                paths.append(name)
+                continue
+            if maxdepth is not None and depth >= maxdepth:
+                continue
+            key, is_hive_segment, value = name.rsplit(self._sep, 1)[-1].partition("=")
+            if not is_hive_segment:
+                if maxdepth is not None:
+                    find_args["maxdepth"] = maxdepth - depth
+                paths.extend(self._filesystem.find(name, **find_args))
+                continue
+            subkeys = {**keys, key: _parse_partition_value(value)}
+            if _matches_filters(subkeys, self._filters, partial=True):
+                paths.extend(self._walk(name, subkeys, depth + 1))
+        return paths
+
+    def _list_manifest_paths(self) -> list[str]:
+        # the manifest is only written by saves, so that loading never writes
+        entries = self._read_manifest()
+        if entries is None:
+            entries = self._scan(self._normalized_path)
+        elif self._reconcile:
+            entries = self._reconcile_manifest(entries)
+        return [entry["path"] for entry in entries]
+
+    @property
+    def _manifest(self) -> AbstractDataset:
+        type_, kwargs = parse_dataset_definition(self._manifest_config)
+        return type_(**kwargs)  # type: ignore
+
+    @property
+    def _manifest_path(self) -> str:
+        return self._filesystem._strip_protocol(self._manifest_config["filepath"])
+
+    def _read_manifest(self) -> list[dict[str, Any]] | None:
+        manifest = self._manifest
+        if not manifest.exists():
+            return None
+        return manifest.load()["partitions"]
+
+    def _write_manifest(self, entries: list[dict[str, Any]]) -> None:
+        entries = sorted(entries, key=operator.itemgetter("path"))
+        self._manifest.save({"partitions": entries})
+
+    def _scan(self, path: str) -> list[dict[str, Any]]:
+        found = self._filesystem.find(path, detail=True, **self._load_args)
+        return [
+            {
+                **_manifest_entry(file_path, info or self._filesystem.info(file_path)),
+                "partition_id": self._path_to_partition(file_path),
+            }
+            for file_path, info in found.items()
+            if file_path not in self._manifest_paths
+        ]
+
+    def _top_level_prefix(self, path: str) -> str:
+        dir_path = self._stripped_path
+        relative_path = path.split(dir_path, 1).pop().lstrip(self._sep)
+        return relative_path.split(self._sep, 1)[0]
+
+    def _reconcile_manifest(
+        self, entries: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Re-list only the top-level prefixes that may have changed since the
+        manifest was written: the ones it does not know about and the newest
+        one it does, which may still be receiving partitions. Entries of the
+        top-level prefixes which no longer exist are dropped.
+        """
+        known_prefixes = {self._top_level_prefix(entry["path"]) for entry in entries}
+        latest_prefix = max(known_prefixes, default="")
+
+        kept_prefixes = set()
+        rescanned = []
+        for path in self._filesystem.ls(self._normalized_path, detail=False):
+            prefix = self._top_level_prefix(path)
+            if prefix in known_prefixes and prefix < latest_prefix:
+                kept_prefixes.add(prefix)
+                continue
+            rescanned.extend(self._scan(path))
+
+        return [
+            entry
+            for entry in entries
+            if self._top_level_prefix(entry["path"]) in kept_prefixes
+        ] + rescanned
+
+    def _update_manifest(self, partitions: list[str], overwritten: bool) -> None:
+        entries = [] if overwritten else self._read_manifest()
+        if entries is None:
+            entries = self._scan(self._normalized_path)
+        else:
+            merged = {entry["path"]: entry for entry in entries}
+            for partition in partitions:
+                merged.update((entry["path"], entry) for entry in self._scan(partition))
+            entries = list(merged.values())
+        self._write_manifest(entries)
+
     def _join_protocol(self, path: str) -> str:
         protocol_prefix = f"{self._protocol}://"
         if self._path.startswith(protocol_prefix) and not path.startswith(
@@ -277,42 +748,133 @@ class PartitionedDataset(AbstractDataset[dict[str, Any], dict[str, Callable[[],
         return full_path
 
     def _path_to_partition(self, path: str) -> str:
-        dir_path = self._filesystem._strip_protocol(self._normalized_path)
+        dir_path = self._stripped_path
         path = path.split(dir_path, 1).pop().lstrip(self._sep)
         if self._filename_suffix and path.endswith(self._filename_suffix):
             path = path[: -len(self._filename_suffix)]
         return path
 
-    def _load(self) -> dict[str, Callable[[], Any]]:
-        partitions = {}
+    def _lazy_partition(self, partition: str) -> _LazyPartition:
+        return _LazyPartition(
+            self._dataset_type,
+            self._dataset_config,
+            self._filepath_arg,
+            # join the protocol back since tools like PySpark may rely on it
+            self._join_protocol(partition),
+        )
+
+    def _partition_loaders(self) -> dict[str, Callable[[], Any]]:
+        partitions: dict[str, Callable[[], Any]] = {}
 
         for partition in self._list_partitions():
-            kwargs = deepcopy(self._dataset_config)
-            # join the protocol back since PySpark may rely on it
-            kwargs[self._filepath_arg] = self._join_protocol(partition)
-            dataset = self._dataset_type(**kwargs)  # type: ignore
             partition_id = self._path_to_partition(partition)
-            partitions[partition_id] = dataset.load
+            partitions[partition_id] = self._lazy_partition(partition)
+            if self._add_partition_columns:
+                partitions[partition_id] = partial(
+                    _add_partition_columns,
+                    partitions[partition_id],
+                    self._partition_keys(partition),
+                )
+
+        return partitions
+
+    def _load(self) -> dict[str, Callable[[], Any]]:
+        partitions = self._partition_loaders()
 
         if not partitions:
             raise DatasetError(f"No partitions found in '{self._path}'")
 
         return partitions
 
+    def iter_loaded(
+        self, max_workers: int | None = None, executor: str = "thread"
+    ) -> Iterator[tuple[str, Any]]:
+        """Load partitions concurrently and yield them as they complete.
+
+        Args:
+            max_workers: Maximum number of partitions loaded at the same time.
+                At most twice as many loads are queued in the pool, so memory
+                stays bounded when results are consumed as they arrive.
+                Defaults to the ``ThreadPoolExecutor`` default pool size.
+            executor: Either ``"thread"`` or ``"process"``. Process pools
+                require the underlying dataset to be picklable.
+
+        Yields:
+            ``(partition_id, data)`` tuples in completion order.
+
+        Raises:
+            DatasetError: If ``executor`` is not supported or a partition
+                fails to load.
+        """
+        loaders = self._partition_loaders().items()
+        for partition_id, future in _run_bounded(loaders, max_workers, executor):
+            yield partition_id, future.result()
+
+    def load_all(
+        self, max_workers: int | None = None, executor: str = "thread"
+    ) -> dict[str, Any]:
+        """Load all partitions concurrently into memory.
+
+        Args:
+            max_workers: Maximum number of partitions loaded at the same time.
+            executor: Either ``"thread"`` or ``"process"``.
+
+        Returns:
+            Dictionary of loaded data keyed by partition id, sorted by id.
+        """
+        return dict(sorted(self.iter_loaded(max_workers, executor)))
+
     def _save(self, data: dict[str, Any]) -> None:
-        if self._overwrite and self._filesystem.exists(self._normalized_path):
+        overwritten = self._overwrite and self._filesystem.exists(self._normalized_path)
+        if overwritten:
             self._filesystem.rm(self._normalized_path, recursive=True)
 
-        for partition_id, partition_data in sorted(data.items()):
-            kwargs = deepcopy(self._dataset_config)
-            partition = self._partition_to_path(partition_id)
-            # join the protocol back since tools like PySpark may rely on it
-            kwargs[self._filepath_arg] = self._join_protocol(partition)
-            dataset = self._dataset_type(**kwargs)  # type: ignore
-            if callable(partition_data):
-                partition_data = partition_data()  # noqa: PLW2901
-            dataset.save(partition_data)
-        self._invalidate_caches()
+        try:
+            if self._save_args.get("max_workers"):
+                self._save_concurrently(data)
+            else:
+                for partition_id, partition_data in sorted(data.items()):
+                    self._save_partition(partition_id, partition_data)
+        finally:
+            self._invalidate_caches()
+
+        if self._manifest_config is not None:
+            self._update_manifest(
+                [self._partition_to_path(partition_id) for partition_id in data],
+                overwritten,
+            )
+
+    def _save_partition(self, partition_id: str, partition_data: Any) -> None:
+        partition = self._partition_to_path(partition_id)
+        dataset = self._lazy_partition(partition).dataset
+        if callable(partition_data):
+            partition_data = partition_data()
+        dataset.save(partition_data)
+
+    def _save_concurrently(self, data: dict[str, Any]) -> None:
+        tasks = (
+            (partition_id, partial(self._save_partition, partition_id, partition_data))
+            for partition_id, partition_data in sorted(data.items())
+        )
+        errors = {}
+        for partition_id, future in _run_bounded(
+            tasks,
+            max_workers=self._save_args["max_workers"],
+            executor=self._save_args.get("executor", "thread"),
+        ):
+            exc = future.exception()
+            if exc is not None:
+                errors[partition_id] = exc
+
+        if errors:
+            details = "\n".join(
+                f"  {partition_id}: {exc}"
+                for partition_id, exc in sorted(errors.items())
+            )
+            raise DatasetError(
+                f"Failed to save {len(errors)} of {len(data)} partition(s) "
+                f"to '{self._path}':\n{details}"
+            )
 
     def _describe(self) -> dict[str, Any]:
         clean_dataset_config = (
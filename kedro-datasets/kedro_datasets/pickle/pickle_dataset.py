@@ -3,10 +3,18 @@ filesystem (e.g.: local, S3, GCS). The underlying functionality is supported by
 the specified backend library passed in (defaults to the ``pickle`` library), so it
 supports all allowed options for loading and saving pickle files.
 """
+from __future__ import annotations
+
 import importlib
+import io
+import mmap
+import os
+import struct
+from contextlib import nullcontext
 from copy import deepcopy
 from pathlib import PurePosixPath
-from typing import Any
+from types import ModuleType
+from typing import IO, Any, Callable
 
 import fsspec
 from kedro.io.core import (
@@ -17,6 +25,77 @@ from kedro.io.core import (
     get_protocol_and_path,
 )
 
+from kedro_datasets._compression import (
+    BACKENDS,
+    compression_module,
+    import_backend,
+    validate_compression,
+)
+from kedro_datasets._local_cache import CachedFileSystem, cached_filesystem
+
+# files saved with out-of-band buffers start with a header made of this magic
+# number, the size of the pickle stream, the number of buffers and their sizes
+_OUT_OF_BAND_MAGIC = b"KEDROOB5"
+_HEADER = struct.Struct("<8sQQ")
+# buffers are aligned like in Arrow IPC files, so memory-mapped arrays are too
+_ALIGNMENT = 64
+
+
+def _compressed_stream(fs_file: IO, compression: str | None, mode: str) -> IO:
+    if compression is None:
+        return nullcontext(fs_file)
+    module = compression_module(compression)
+    if compression == "lz4":
+        return module.open(fs_file, mode=mode)
+    if mode == "wb":
+        return module.ZstdCompressor().stream_writer(fs_file, closefd=False)
+    return module.ZstdDecompressor().stream_reader(fs_file, closefd=False)
+
+
+def _stream_reader(stream: IO) -> Callable[[int], bytearray]:
+    """Return a function reading the given number of bytes from ``stream``
+    into a new buffer."""
+
+    def read(size: int) -> bytearray:
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        offset = 0
+        while offset < size:
+            count = stream.readinto(view[offset:])
+            if not count:
+                raise DatasetError("Unexpected end of out-of-band pickle file.")
+            offset += count
+        return buffer
+
+    return read
+
+
+def _mmap_reader(local_path: str) -> Callable[[int], memoryview]:
+    """Return a function slicing consecutive sections of a memory-mapped file.
+
+    The file is mapped copy-on-write, so the loaded arrays are writable
+    without modifying the file.
+    """
+    with open(local_path, "rb") as local_file:
+        if os.fstat(local_file.fileno()).st_size:
+            view = memoryview(
+                mmap.mmap(local_file.fileno(), 0, access=mmap.ACCESS_COPY)
+            )
+        else:
+            # empty files cannot be memory-mapped
+            view = memoryview(b"")
+    offset = 0
+
+    def read(size: int) -> memoryview:
+        nonlocal offset
+        if offset + size > len(view):
+            raise DatasetError("Unexpected end of out-of-band pickle file.")
+        section = view[offset : offset + size]
+        offset += size
+        return section
+
+    return read
+
 
 class PickleDataset(AbstractVersionedDataset[Any, Any]):
     """``PickleDataset`` loads/saves data from/to a Pickle file using an underlying
@@ -43,6 +122,18 @@ class PickleDataset(AbstractVersionedDataset[Any, Any]):
           save_args:
             compress: lz4
 
+        embeddings: # NumPy arrays written outside of the pickle stream
+          type: pickle.PickleDataset
+          filepath: data/06_models/embeddings.pkl
+          out_of_band: True
+
+        large_model: # streamed through zstd compression
+          type: pickle.PickleDataset
+          filepath: s3://your_bucket/large_model.pkl.zst
+          credentials: s3_credentials
+          compression: zstd
+          out_of_band: True
+
     Example usage for the
     `Python API <https://kedro.readthedocs.io/en/stable/data/\
     advanced_data_catalog_usage.html>`_:
@@ -68,6 +159,13 @@ class PickleDataset(AbstractVersionedDataset[Any, Any]):
         >>> dataset.save(data)
         >>> reloaded = dataset.load()
         >>> assert data.equals(reloaded)
+        >>>
+        >>> dataset = PickleDataset(
+        ...     filepath=tmp_path / "test.pkl.lz4", compression="lz4", out_of_band=True
+        ... )
+        >>> dataset.save(data)
+        >>> reloaded = dataset.load()
+        >>> assert data.equals(reloaded)
     """
 
     DEFAULT_LOAD_ARGS: dict[str, Any] = {}
@@ -78,6 +176,8 @@ class PickleDataset(AbstractVersionedDataset[Any, Any]):
         *,
         filepath: str,
         backend: str = "pickle",
+        compression: str | None = None,
+        out_of_band: bool = False,
         load_args: dict[str, Any] = None,
         save_args: dict[str, Any] = None,
         version: Version = None,
@@ -106,6 +206,16 @@ class PickleDataset(AbstractVersionedDataset[Any, Any]):
             backend: Backend to use, must be an import path to a module which satisfies the
                 ``pickle`` interface. That is, contains a `load` and `dump` function.
                 Defaults to 'pickle'.
+            compression: Compress the file while it is streamed to and from
+                the filesystem, with either ``lz4`` (``lz4`` package) or
+                ``zstd`` (``zstandard`` package). Defaults to no compression.
+            out_of_band: Whether to save with pickle protocol 5 and write
+                buffers, such as the data of NumPy arrays and Arrow tables,
+                after the pickle stream instead of copying them into it.
+                Uncompressed local files are then memory-mapped on load, so
+                these buffers are not copied either. The backend must support
+                the ``buffer_callback`` and ``buffers`` arguments of ``pickle``.
+                Defaults to False.
             load_args: Pickle options for loading pickle files.
                 You can pass in arguments that the backend load function specified accepts, e.g:
                 pickle.load: https://docs.python.org/3/library/pickle.html#pickle.load
@@ -139,18 +249,22 @@ class PickleDataset(AbstractVersionedDataset[Any, Any]):
                 Here you can find all available arguments for `open`:
                 https://filesystem-spec.readthedocs.io/en/latest/api.html#fsspec.spec.AbstractFileSystem.open
                 All defaults are preserved, except `mode`, which is set to `wb` when saving.
+                Files on remote filesystems are cached on local disk if ``cache``
+                is set to True or to a dictionary with the cache directory
+                ``path`` and its ``max_size`` in bytes.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
 
         Raises:
-            ValueError: If ``backend`` does not satisfy the `pickle` interface.
-            ImportError: If the ``backend`` module could not be imported.
+            ValueError: If ``backend`` does not satisfy the `pickle` interface,
+                or ``compression`` is not supported.
+            ImportError: If the ``backend`` or ``compression`` module could not
+                be imported.
         """
         # We do not store `imported_backend` as an attribute to be used in `load`/`save`
         # as this would mean the dataset cannot be deepcopied (module objects cannot be
-        # pickled). The import here is purely to raise any errors as early as possible.
-        # Repeated imports in the `load` and `save` methods should not be a significant
-        # performance hit as Python caches imports.
+        # pickled). The import here is purely to raise any errors as early as possible,
+        # `load` and `save` look the backend up in a module-level cache.
         try:
             imported_backend = importlib.import_module(backend)
         except ImportError as exc:
@@ -166,10 +280,14 @@ class PickleDataset(AbstractVersionedDataset[Any, Any]):
                 f"Selected backend '{backend}' should satisfy the pickle interface. "
                 "Missing one of 'load' and 'dump' on the backend."
             )
+        BACKENDS.setdefault(backend, imported_backend)
+
+        validate_compression(compression)
 
         _fs_args = deepcopy(fs_args) or {}
         _fs_open_args_load = _fs_args.pop("open_args_load", {})
         _fs_open_args_save = _fs_args.pop("open_args_save", {})
+        _cache = _fs_args.pop("cache", None)
         _credentials = deepcopy(credentials) or {}
 
         protocol, path = get_protocol_and_path(filepath, version)
@@ -177,7 +295,9 @@ class PickleDataset(AbstractVersionedDataset[Any, Any]):
             _fs_args.setdefault("auto_mkdir", True)
 
         self._protocol = protocol
-        self._fs = fsspec.filesystem(self._protocol, **_credentials, **_fs_args)
+        self._fs = cached_filesystem(
+            fsspec.filesystem(self._protocol, **_credentials, **_fs_args), _cache
+        )
 
         self.metadata = metadata
 
@@ -189,6 +309,8 @@ class PickleDataset(AbstractVersionedDataset[Any, Any]):
         )
 
         self._backend = backend
+        self._compression = compression
+        self._out_of_band = out_of_band
 
         # Handle default load and save arguments
         self._load_args = deepcopy(self.DEFAULT_LOAD_ARGS)
@@ -206,6 +328,8 @@ class PickleDataset(AbstractVersionedDataset[Any, Any]):
         return {
             "filepath": self._filepath,
             "backend": self._backend,
+            "compression": self._compression,
+            "out_of_band": self._out_of_band,
             "protocol": self._protocol,
             "load_args": self._load_args,
             "save_args": self._save_args,
@@ -214,18 +338,60 @@ class PickleDataset(AbstractVersionedDataset[Any, Any]):
 
     def _load(self) -> Any:
         load_path = get_filepath_str(self._get_load_path(), self._protocol)
-
-        with self._fs.open(load_path, **self._fs_open_args_load) as fs_file:
-            imported_backend = importlib.import_module(self._backend)
-            return imported_backend.load(fs_file, **self._load_args)  # type: ignore
+        imported_backend = import_backend(self._backend)
+
+        if self._out_of_band and not self._compression:
+            local_path = None
+            if self._protocol == "file":
+                local_path = load_path
+            elif isinstance(self._fs, CachedFileSystem):
+                local_path = self._fs.fetch(load_path)
+            if local_path is not None:
+                return self._load_out_of_band(
+                    imported_backend, _mmap_reader(local_path)
+                )
+
+        with self._fs.open(
+            load_path, **self._fs_open_args_load
+        ) as fs_file, _compressed_stream(fs_file, self._compression, "rb") as stream:
+            if self._out_of_band:
+                return self._load_out_of_band(imported_backend, _stream_reader(stream))
+            return imported_backend.load(stream, **self._load_args)  # type: ignore
+
+    def _load_out_of_band(
+        self, imported_backend: ModuleType, read: Callable[[int], Any]
+    ) -> Any:
+        magic, stream_size, buffer_count = _HEADER.unpack(read(_HEADER.size))
+        if magic != _OUT_OF_BAND_MAGIC:
+            raise DatasetError(
+                f"'{self._get_load_path()}' was not saved with out-of-band buffers."
+            )
+        sizes = struct.unpack(f"<{buffer_count}Q", read(8 * buffer_count))
+
+        position = _HEADER.size + 8 * buffer_count
+        sections = []
+        for size in (stream_size, *sizes):
+            padding = -position % _ALIGNMENT
+            read(padding)
+            sections.append(read(size))
+            position += padding + size
+
+        return imported_backend.load(  # type: ignore
+            io.BytesIO(sections[0]), buffers=sections[1:], **self._load_args
+        )
 
     def _save(self, data: Any) -> None:
         save_path = get_filepath_str(self._get_save_path(), self._protocol)
+        imported_backend = import_backend(self._backend)
 
-        with self._fs.open(save_path, **self._fs_open_args_save) as fs_file:
+        with self._fs.open(
+            save_path, **self._fs_open_args_save
+        ) as fs_file, _compressed_stream(fs_file, self._compression, "wb") as stream:
             try:
-                imported_backend = importlib.import_module(self._backend)
-                imported_backend.dump(data, fs_file, **self._save_args)  # type: ignore
+                if self._out_of_band:
+                    self._save_out_of_band(imported_backend, data, stream)
+                else:
+                    imported_backend.dump(data, stream, **self._save_args)  # type: ignore
             except Exception as exc:
                 raise DatasetError(
                     f"{data.__class__} was not serialised due to: {exc}"
@@ -233,6 +399,31 @@ class PickleDataset(AbstractVersionedDataset[Any, Any]):
 
         self._invalidate_cache()
 
+    def _save_out_of_band(
+        self, imported_backend: ModuleType, data: Any, fs_file: IO
+    ) -> None:
+        buffers = []
+        stream = io.BytesIO()
+        imported_backend.dump(  # type: ignore
+            data,
+            stream,
+            **{"protocol": 5, **self._save_args},
+            buffer_callback=buffers.append,
+        )
+        # views of the buffers' memory, written without copying them
+        raw_buffers = [buffer.raw() for buffer in buffers]
+
+        fs_file.write(
+            _HEADER.pack(_OUT_OF_BAND_MAGIC, stream.tell(), len(raw_buffers))
+            + struct.pack(f"<{len(raw_buffers)}Q", *(raw.nbytes for raw in raw_buffers))
+        )
+        position = _HEADER.size + 8 * len(raw_buffers)
+        for section in (stream.getbuffer(), *raw_buffers):
+            padding = -position % _ALIGNMENT
+            fs_file.write(b"\0" * padding)
+            fs_file.write(section)
+            position += padding + section.nbytes
+
     def _exists(self) -> bool:
         try:
             load_path = get_filepath_str(self._get_load_path(), self._protocol)
@@ -0,0 +1,221 @@
+"""``ImageBatchDataset`` loads the images of a directory or glob pattern from an
+underlying filesystem (e.g.: local, S3, GCS) as one `numpy` array. It uses
+Pillow to decode the images in a thread pool.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from pathlib import PurePosixPath
+from typing import Any, NoReturn
+
+import fsspec
+import numpy as np
+from kedro.io.core import (
+    AbstractDataset,
+    DatasetError,
+    get_filepath_str,
+    get_protocol_and_path,
+)
+from PIL import Image
+
+from kedro_datasets._io import is_glob
+from kedro_datasets._local_cache import cached_filesystem
+from kedro_datasets.pillow.image_dataset import _resampling_filter
+
+
+class ImageBatchDataset(AbstractDataset[np.ndarray, NoReturn]):
+    """``ImageBatchDataset`` loads the images of a directory or glob pattern from an
+    underlying filesystem (e.g.: local, S3, GCS) as one `numpy` array of shape
+    (N, height, width, channels), or (N, height, width) for single band images,
+    with the images in the order of their paths.
+
+    Images are read and decoded in a thread pool, as Pillow releases the GIL
+    while decoding and resizing, and can be converted to another ``mode`` and
+    resized to a common ``size`` in the pool. When both are set, each image is
+    copied straight into its slot of the batch instead of being stacked
+    afterwards.
+
+    Example usage for the
+    `YAML API <https://kedro.readthedocs.io/en/stable/data/\
+    data_catalog_yaml_examples.html>`_:
+
+    .. code-block:: yaml
+
+        thumbnails:
+          type: pillow.ImageBatchDataset
+          filepath: s3://your_bucket/data/01_raw/thumbnails/*.jpg
+          credentials: dev_s3
+          load_args:
+            max_workers: 16
+            mode: RGB
+            size: [224, 224]
+            resample: bilinear
+
+    Example usage for the
+    `Python API <https://kedro.readthedocs.io/en/stable/data/\
+    advanced_data_catalog_usage.html>`_:
+
+    .. code-block:: pycon
+
+        >>> from kedro_datasets.pillow import ImageBatchDataset
+        >>> from PIL import Image
+        >>>
+        >>> for i, color in enumerate(["red", "green", "blue"]):
+        ...     Image.new("RGB", (64, 48), color).save(tmp_path / f"{i}.png")
+        ...
+        >>> dataset = ImageBatchDataset(
+        ...     filepath=str(tmp_path), load_args={"mode": "RGB", "size": (32, 24)}
+        ... )
+        >>> batch = dataset.load()
+        >>> assert batch.shape == (3, 24, 32, 3)
+
+    """
+
+    DEFAULT_LOAD_ARGS: dict[str, Any] = {}
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        filepath: str,
+        load_args: dict[str, Any] = None,
+        credentials: dict[str, Any] = None,
+        fs_args: dict[str, Any] = None,
+        metadata: dict[str, Any] = None,
+    ) -> None:
+        """Creates a new instance of ``ImageBatchDataset`` pointing to a directory
+        of images or a glob pattern on a specific filesystem.
+
+        Args:
+            filepath: Filepath in POSIX format to a directory of images or a glob
+                pattern such as `thumbnails/*.jpg`, prefixed with a protocol like
+                `s3://`. If prefix is not provided, `file` protocol (local
+                filesystem) will be used. The prefix should be any protocol
+                supported by ``fsspec``. The files of a directory whose extension
+                is not one of an image format known to Pillow are skipped. A
+                directory whose name contains glob characters is not globbed,
+                and http(s) paths are never globbed.
+            load_args: Options for loading the images: ``max_workers``, the number
+                of threads reading and decoding images, ``mode``, the Pillow mode
+                to convert the images to (e.g. `RGB` or `L`), ``size``, the
+                (width, height) to resize the images to, and ``resample``, the name
+                of the resampling filter used to resize them (e.g. `bilinear`),
+                which defaults to Pillow's default. Images must have the same size
+                and mode to be stacked, unless ``size`` and ``mode`` are set.
+            credentials: Credentials required to get access to the underlying filesystem.
+                E.g. for ``GCSFileSystem`` it should look like `{"token": None}`.
+            fs_args: Extra arguments to pass into underlying filesystem class constructor
+                (e.g. `{"project": "my-project"}` for ``GCSFileSystem``).
+                Files on remote filesystems are cached on local disk if ``cache``
+                is set to True or to a dictionary with the cache directory
+                ``path`` and its ``max_size`` in bytes.
+            metadata: Any arbitrary metadata.
+                This is ignored by Kedro, but may be consumed by users or external plugins.
+
+        Raises:
+            DatasetError: If ``resample`` is not the name of a resampling filter.
+        """
+        _fs_args = deepcopy(fs_args) or {}
+        _cache = _fs_args.pop("cache", None)
+        _credentials = deepcopy(credentials) or {}
+
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._filepath = PurePosixPath(path)
+        self._fs = cached_filesystem(
+            fsspec.filesystem(self._protocol, **_credentials, **_fs_args), _cache
+        )
+
+        self.metadata = metadata
+
+        # Handle default load arguments
+        self._load_args = deepcopy(self.DEFAULT_LOAD_ARGS)
+        if load_args is not None:
+            self._load_args.update(load_args)
+
+        self._max_workers = self._load_args.get("max_workers")
+        self._mode = self._load_args.get("mode")
+        size = self._load_args.get("size")
+        self._size = tuple(size) if size is not None else None
+        self._resample = _resampling_filter(self._load_args.get("resample"))
+
+    def _describe(self) -> dict[str, Any]:
+        return {
+            "filepath": self._filepath,
+            "protocol": self._protocol,
+            "load_args": self._load_args,
+        }
+
+    def _list_images(self) -> list[str]:
+        load_path = get_filepath_str(self._filepath, self._protocol)
+        if is_glob(self._protocol, load_path) and not self._fs.isdir(load_path):
+            return sorted(self._fs.glob(load_path))
+
+        Image.init()
+        return sorted(
+            path
+            for path in self._fs.find(load_path)
+            if PurePosixPath(path).suffix.lower() in Image.EXTENSION
+        )
+
+    def _decode(self, path: str) -> Image.Image:
+        with self._fs.open(path, mode="rb") as fs_file:
+            image = Image.open(fs_file)
+            if self._size is not None:
+                # Decode JPEG images at the smallest scale at least the size
+                image.draft(self._mode, self._size)
+            if self._mode is not None and image.mode != self._mode:
+                image = image.convert(self._mode)
+            if self._size is not None and image.size != self._size:
+                image = image.resize(self._size, resample=self._resample)
+            image.load()
+        return image
+
+    def _load(self) -> np.ndarray:
+        paths = self._list_images()
+        if not paths:
+            raise DatasetError(f"No images found in '{self._filepath}'.")
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            if self._size is None or self._mode is None:
+                return self._stack(list(executor.map(self._decode, paths)))
+
+            # The shape of the batch is known in advance, so each image is copied
+            # into the batch by the thread which decoded it
+            width, height = self._size
+            pixel = np.asarray(Image.new(self._mode, (1, 1)))
+            batch = np.empty(
+                (len(paths), height, width, *pixel.shape[2:]), dtype=pixel.dtype
+            )
+
+            def read_into(index: int, path: str) -> None:
+                batch[index] = np.asarray(self._decode(path))
+
+            list(executor.map(read_into, range(len(paths)), paths))
+            return batch
+
+    @staticmethod
+    def _stack(images: list[Image.Image]) -> np.ndarray:
+        shapes = {(image.size, image.mode) for image in images}
+        if len(shapes) > 1:
+            raise DatasetError(
+                f"Images of different sizes or modes can't be stacked, found "
+                f"{len(shapes)} combinations of them. Set 'size' and 'mode' in "
+                f"'load_args' to convert them all to the same size and mode."
+            )
+        return np.stack([np.asarray(image) for image in images])
+
+    def _save(self, data: np.ndarray) -> NoReturn:
+        raise DatasetError("'save' is not supported on ImageBatchDataset")
+
+    def _exists(self) -> bool:
+        return bool(self._list_images())
+
+    def _release(self) -> None:
+        super()._release()
+        self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        """Invalidate underlying filesystem caches."""
+        filepath = get_filepath_str(self._filepath, self._protocol)
+        self._fs.invalidate_cache(filepath)
@@ -1,6 +1,9 @@
 """``ImageDataset`` loads/saves image data as `numpy` from an underlying
 filesystem (e.g.: local, S3, GCS). It uses Pillow to handle image file.
 """
+from __future__ import annotations
+
+import weakref
 from copy import deepcopy
 from pathlib import PurePosixPath
 from typing import Any
@@ -15,11 +18,44 @@ from kedro.io.core import (
 )
 from PIL import Image
 
+from kedro_datasets._local_cache import cached_filesystem
+
+
+def _resampling_filter(name: str | None) -> Image.Resampling | None:
+    """Get the Pillow resampling filter with the given case insensitive name."""
+    if name is None:
+        return None
+    try:
+        return Image.Resampling[name.upper()]
+    except KeyError as exc:
+        raise DatasetError(
+            f"Invalid resampling filter '{name}', expected one of "
+            f"{', '.join(method.name.lower() for method in Image.Resampling)}."
+        ) from exc
+
 
 class ImageDataset(AbstractVersionedDataset[Image.Image, Image.Image]):
     """``ImageDataset`` loads/saves image data as `numpy` from an underlying
     filesystem (e.g.: local, S3, GCS). It uses Pillow to handle image file.
 
+    Example usage for the
+    `YAML API <https://kedro.readthedocs.io/en/stable/data/\
+    data_catalog_yaml_examples.html>`_:
+
+    .. code-block:: yaml
+
+        photo_preview:
+          type: pillow.ImageDataset
+          filepath: data/01_raw/photo.jpg
+          load_args:
+            size: [512, 512]
+
+        photo_metadata:
+          type: pillow.ImageDataset
+          filepath: data/01_raw/photo.jpg
+          load_args:
+            lazy: True
+
     Example usage for the
     `Python API <https://kedro.readthedocs.io/en/stable/data/\
     advanced_data_catalog_usage.html>`_:
@@ -40,12 +76,14 @@ class ImageDataset(AbstractVersionedDataset[Image.Image, Image.Image]):
 
     """
 
+    DEFAULT_LOAD_ARGS: dict[str, Any] = {}
     DEFAULT_SAVE_ARGS: dict[str, Any] = {}
 
     def __init__(  # noqa: PLR0913
         self,
         *,
         filepath: str,
+        load_args: dict[str, Any] = None,
         save_args: dict[str, Any] = None,
         version: Version = None,
         credentials: dict[str, Any] = None,
@@ -60,6 +98,19 @@ class ImageDataset(AbstractVersionedDataset[Image.Image, Image.Image]):
                 `s3://`. If prefix is not provided, `file` protocol (local filesystem) will be used.
                 The prefix should be any protocol supported by ``fsspec``.
                 Note: `http(s)` doesn't support versioning.
+            load_args: Options for loading the image. ``size`` is the (width, height)
+                the image is scaled down to fit in, keeping its aspect ratio, with the
+                ``resample`` filter (e.g. `bilinear`) and ``reducing_gap`` of
+                ``PIL.Image.Image.thumbnail``. Only what is needed is decoded: JPEG
+                images are decoded at a reduced scale with ``draft`` and other images
+                are reduced by an integer factor with ``reduce`` before being
+                resampled. If ``lazy`` is True, only the header of the image is read
+                on load, giving its size, mode and metadata (e.g. ``getexif()``), and
+                the pixels are decoded when first accessed. The file stays open until
+                the image is garbage collected, so callers should close images
+                they don't use with ``image.close()``. ``lazy`` can't be combined with
+                ``size``. Only the first frame of animated images is loaded,
+                unless ``lazy`` is True.
             save_args: Pillow options for saving image files.
                 Here you can find all available arguments:
                 https://pillow.readthedocs.io/en/stable/reference/Image.html#PIL.Image.Image.save
@@ -78,12 +129,20 @@ class ImageDataset(AbstractVersionedDataset[Image.Image, Image.Image]):
                 https://filesystem-spec.readthedocs.io/en/latest/api.html#fsspec.spec.AbstractFileSystem.open
                 All defaults are preserved, except `mode`, which is set to `r` when loading
                 and to `w` when saving.
+                Files on remote filesystems are cached on local disk if ``cache``
+                is set to True or to a dictionary with the cache directory
+                ``path`` and its ``max_size`` in bytes.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
+
+        Raises:
+            DatasetError: If ``resample`` is not the name of a resampling filter, or
+                if ``lazy`` is combined with ``size``.
         """
         _fs_args = deepcopy(fs_args) or {}
         _fs_open_args_load = _fs_args.pop("open_args_load", {})
         _fs_open_args_save = _fs_args.pop("open_args_save", {})
+        _cache = _fs_args.pop("cache", None)
         _credentials = deepcopy(credentials) or {}
 
         protocol, path = get_protocol_and_path(filepath, version)
@@ -91,7 +150,9 @@ class ImageDataset(AbstractVersionedDataset[Image.Image, Image.Image]):
             _fs_args.setdefault("auto_mkdir", True)
 
         self._protocol = protocol
-        self._fs = fsspec.filesystem(self._protocol, **_credentials, **_fs_args)
+        self._fs = cached_filesystem(
+            fsspec.filesystem(self._protocol, **_credentials, **_fs_args), _cache
+        )
 
         self.metadata = metadata
 
@@ -102,11 +163,25 @@ class ImageDataset(AbstractVersionedDataset[Image.Image, Image.Image]):
             glob_function=self._fs.glob,
         )
 
-        # Handle default save argument
+        # Handle default load and save arguments
+        self._load_args = deepcopy(self.DEFAULT_LOAD_ARGS)
+        if load_args is not None:
+            self._load_args.update(load_args)
         self._save_args = deepcopy(self.DEFAULT_SAVE_ARGS)
         if save_args is not None:
             self._save_args.update(save_args)
 
+        size = self._load_args.get("size")
+        self._size = tuple(size) if size is not None else None
+        self._resample = _resampling_filter(self._load_args.get("resample", "bicubic"))
+        self._reducing_gap = self._load_args.get("reducing_gap", 2.0)
+        self._lazy = self._load_args.get("lazy", False)
+        if self._lazy and self._size is not None:
+            raise DatasetError(
+                "'lazy' can't be combined with 'size' in 'load_args', as images "
+                "are resized on load."
+            )
+
         _fs_open_args_save.setdefault("mode", "wb")
         self._fs_open_args_load = _fs_open_args_load
         self._fs_open_args_save = _fs_open_args_save
@@ -115,6 +190,7 @@ class ImageDataset(AbstractVersionedDataset[Image.Image, Image.Image]):
         return {
             "filepath": self._filepath,
             "protocol": self._protocol,
+            "load_args": self._load_args,
             "save_args": self._save_args,
             "version": self._version,
         }
@@ -122,8 +198,30 @@ class ImageDataset(AbstractVersionedDataset[Image.Image, Image.Image]):
     def _load(self) -> Image.Image:
         load_path = get_filepath_str(self._get_load_path(), self._protocol)
 
+        if self._lazy:
+            # Pillow reads the header on open and the pixels on first access,
+            # but doesn't close files it was given once the pixels are read
+            fs_file = self._fs.open(load_path, **self._fs_open_args_load)
+            image = Image.open(fs_file)
+            weakref.finalize(image, fs_file.close)
+            return image
+
         with self._fs.open(load_path, **self._fs_open_args_load) as fs_file:
-            return Image.open(fs_file).copy()
+            image = Image.open(fs_file)
+            if self._size is not None:
+                # Drafts JPEG images to the smallest scale at least reducing_gap
+                # times the size, and reduces others by an integer factor
+                image.thumbnail(
+                    self._size,
+                    resample=self._resample,
+                    reducing_gap=self._reducing_gap,
+                )
+            # Images which already fit in the size are not decoded by thumbnail
+            image.load()
+            # Detach the decoded frame from the file, which is closed on return
+            detached = image.copy()
+            detached.format = image.format
+            return detached
 
     def _save(self, data: Image.Image) -> None:
         save_path = self._get_save_path()
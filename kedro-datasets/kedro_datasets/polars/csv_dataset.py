@@ -3,7 +3,6 @@ filesystem (e.g.: local, S3, GCS). It uses polars to handle the CSV file.
 """
 import logging
 from copy import deepcopy
-from io import BytesIO
 from pathlib import PurePosixPath
 from typing import Any
 
@@ -18,6 +17,8 @@ from kedro.io.core import (
     get_protocol_and_path,
 )
 
+from kedro_datasets._io import atomic_save
+
 logger = logging.getLogger(__name__)
 
 
@@ -170,11 +171,8 @@ class CSVDataset(AbstractVersionedDataset[pl.DataFrame, pl.DataFrame]):
     def _save(self, data: pl.DataFrame) -> None:
         save_path = get_filepath_str(self._get_save_path(), self._protocol)
 
-        buf = BytesIO()
-        data.write_csv(file=buf, **self._save_args)
-
-        with self._fs.open(save_path, mode="wb") as fs_file:
-            fs_file.write(buf.getvalue())
+        with atomic_save(self._fs, save_path) as fs_file:
+            data.write_csv(file=fs_file, **self._save_args)
 
         self._invalidate_cache()
 
@@ -3,7 +3,6 @@ filesystem (e.g.: local, S3, GCS). It uses polars to handle the
 type of read/write target.
 """
 from copy import deepcopy
-from io import BytesIO
 from pathlib import PurePosixPath
 from typing import Any
 
@@ -17,6 +16,8 @@ from kedro.io.core import (
     get_protocol_and_path,
 )
 
+from kedro_datasets._io import atomic_save
+
 
 class EagerPolarsDataset(AbstractVersionedDataset[pl.DataFrame, pl.DataFrame]):
     """``polars.EagerPolarsDataset`` loads/saves data from/to a data file using an underlying
@@ -37,6 +38,18 @@ class EagerPolarsDataset(AbstractVersionedDataset[pl.DataFrame, pl.DataFrame]):
           save_args:
             compression: "snappy"
 
+        features:
+          type: polars.EagerPolarsDataset
+          file_format: ipc
+          filepath: data/04_feature/features.arrow
+          load_args:
+            memory_map: True
+          save_args:
+            compression: uncompressed
+
+    Local ``ipc`` files are memory-mapped when ``memory_map`` is set in
+    ``load_args``, rather than read through ``fsspec``.
+
     Example using Python API:
 
     .. code-block:: pycon
@@ -153,6 +166,14 @@ class EagerPolarsDataset(AbstractVersionedDataset[pl.DataFrame, pl.DataFrame]):
                 " API"
                 " https://pola-rs.github.io/polars/py-polars/html/reference/io.html"
             )
+        if (
+            self._file_format == "ipc"
+            and self._protocol == "file"
+            and self._load_args.get("memory_map")
+        ):
+            # polars can only memory-map files passed by path, not file objects
+            return load_method(load_path, **self._load_args)
+
         with self._fs.open(load_path, **self._fs_open_args_load) as fs_file:
             return load_method(fs_file, **self._load_args)
 
@@ -168,11 +189,10 @@ class EagerPolarsDataset(AbstractVersionedDataset[pl.DataFrame, pl.DataFrame]):
                 " per the Polars API "
                 "https://pola-rs.github.io/polars/py-polars/html/reference/io.html"
             )
-        buf = BytesIO()
-        save_method(buf, **self._save_args)
-        with self._fs.open(save_path, **self._fs_open_args_save) as fs_file:
-            fs_file.write(buf.getvalue())
-            self._invalidate_cache()
+        with atomic_save(self._fs, save_path, **self._fs_open_args_save) as fs_file:
+            save_method(fs_file, **self._save_args)
+
+        self._invalidate_cache()
 
     def _exists(self) -> bool:
         try:
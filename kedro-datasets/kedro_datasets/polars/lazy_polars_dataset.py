@@ -4,7 +4,6 @@ type of read/write target.
 """
 import logging
 from copy import deepcopy
-from io import BytesIO
 from pathlib import PurePosixPath
 from typing import Any, ClassVar, Optional, Union
 
@@ -19,6 +18,8 @@ from kedro.io.core import (
     get_protocol_and_path,
 )
 
+from kedro_datasets._io import atomic_save
+
 ACCEPTED_FILE_FORMATS = ["csv", "parquet"]
 
 PolarsFrame = Union[pl.LazyFrame, pl.DataFrame]
@@ -216,11 +217,9 @@ class LazyPolarsDataset(AbstractVersionedDataset[pl.LazyFrame, PolarsFrame]):
         # https://pola-rs.github.io/polars/py-polars/html/reference/api/polars.DataFrame.write_parquet.html
         save_method = getattr(collected_data, f"write_{self._file_format}", None)
         if save_method:
-            buf = BytesIO()
-            save_method(file=buf, **self._save_args)
-            with self._fs.open(save_path, mode="wb") as fs_file:
-                fs_file.write(buf.getvalue())
-                self._invalidate_cache()
+            with atomic_save(self._fs, save_path) as fs_file:
+                save_method(file=fs_file, **self._save_args)
+            self._invalidate_cache()
         # How the LazyPolarsDataset logic is currently written with
         # ACCEPTED_FILE_FORMATS and a check in the `__init__` method,
         # this else loop is never reached, hence we exclude it from coverage report
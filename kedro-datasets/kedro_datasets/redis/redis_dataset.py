@@ -1,14 +1,61 @@
 """``PickleDataset`` loads/saves data from/to a Redis database. The underlying
 functionality is supported by the redis library, so it supports all allowed
 options for instantiating the redis app ``from_url`` and setting a value."""
+from __future__ import annotations
+
 import importlib
+import json
 import os
+import threading
 from copy import deepcopy
 from typing import Any
 
 import redis
 from kedro.io.core import AbstractDataset, DatasetError
 
+from kedro_datasets._compression import (
+    BACKENDS,
+    compression_module,
+    import_backend,
+    validate_compression,
+)
+
+# values saved in chunks are replaced by this prefix and the number of chunks,
+# the chunks themselves are the fields of the `{<key>}:chunks` hash
+_CHUNKED_PREFIX = b"\x00kedro-chunked\x00"
+# `set_args` deciding whether or how the value is set, which cannot be applied
+# to the chunks of a value in the same transaction
+_CONDITIONAL_SET_ARGS = ("nx", "xx", "keepttl", "get")
+_EXPIRE_COMMANDS = {
+    "ex": "expire",
+    "px": "pexpire",
+    "exat": "expireat",
+    "pxat": "pexpireat",
+}
+
+# clients and their connection pools, shared by the datasets using the same
+# server and credentials
+_CLIENTS: dict[str, redis.Redis] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _compress(data: bytes, compression: str | None) -> bytes:
+    if compression is None:
+        return data
+    module = compression_module(compression)
+    if compression == "lz4":
+        return module.compress(data)
+    return module.ZstdCompressor().compress(data)
+
+
+def _decompress(data: bytes, compression: str | None) -> bytes:
+    if compression is None:
+        return data
+    module = compression_module(compression)
+    if compression == "lz4":
+        return module.decompress(data)
+    return module.ZstdDecompressor().decompress(data)
+
 
 class PickleDataset(AbstractDataset[Any, Any]):
     """``PickleDataset`` loads/saves data from/to a Redis database. The
@@ -37,6 +84,16 @@ class PickleDataset(AbstractDataset[Any, Any]):
           save_args:
             ex: 10
 
+        large_python_object: # example with compression and chunking
+          type: redis.PickleDataset
+          key: my_large_object
+          compression: lz4
+          chunk_size: 16777216
+          redis_args:
+            from_url_args:
+              url: redis://127.0.0.1:6379
+              max_connections: 32
+
     Example usage for the
     `Python API <https://kedro.readthedocs.io/en/stable/data/\
     advanced_data_catalog_usage.html>`_:
@@ -63,6 +120,8 @@ class PickleDataset(AbstractDataset[Any, Any]):
         *,
         key: str,
         backend: str = "pickle",
+        compression: str | None = None,
+        chunk_size: int | None = None,
         load_args: dict[str, Any] = None,
         save_args: dict[str, Any] = None,
         credentials: dict[str, Any] = None,
@@ -87,6 +146,14 @@ class PickleDataset(AbstractDataset[Any, Any]):
             backend: Backend to use, must be an import path to a module which satisfies the
                 ``pickle`` interface. That is, contains a `loads` and `dumps` function.
                 Defaults to 'pickle'.
+            compression: Compress the serialised value with either ``lz4``
+                (``lz4`` package) or ``zstd`` (``zstandard`` package).
+                Defaults to no compression.
+            chunk_size: Size in bytes beyond which serialised values are split
+                into chunks, saved and loaded in a single round trip together
+                with the key. The chunks are kept in the ``{<key>}:chunks``
+                hash, in the same Redis Cluster slot as the key. Defaults to
+                ``None``, which saves values of any size under the key itself.
             load_args: Pickle options for loading pickle files.
                 You can pass in arguments that the backend load function specified accepts, e.g:
                 pickle.loads: https://docs.python.org/3/library/pickle.html#pickle.loads
@@ -114,12 +181,16 @@ class PickleDataset(AbstractDataset[Any, Any]):
                 https://redis-py.readthedocs.io/en/stable/connections.html?highlight=from_url#redis.Redis.from_url
                 All defaults are preserved, except `url`, which is set to `redis://127.0.0.1:6379`.
                 You could also specify the url through the env variable ``REDIS_URL``.
+                Datasets with the same `from_url_args` and credentials share
+                one client and its connection pool.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
 
         Raises:
-            ValueError: If ``backend`` does not satisfy the `pickle` interface.
-            ImportError: If the ``backend`` module could not be imported.
+            ValueError: If ``backend`` does not satisfy the `pickle` interface,
+                or ``compression`` is not supported.
+            ImportError: If the ``backend`` or ``compression`` module could not
+                be imported.
         """
         try:
             imported_backend = importlib.import_module(backend)
@@ -136,8 +207,13 @@ class PickleDataset(AbstractDataset[Any, Any]):
                 f"Selected backend '{backend}' should satisfy the pickle interface. "
                 "Missing one of 'loads' and 'dumps' on the backend."
             )
+        BACKENDS.setdefault(backend, imported_backend)
+
+        validate_compression(compression)
 
         self._backend = backend
+        self._compression = compression
+        self._chunk_size = chunk_size
 
         self._key = key
 
@@ -156,9 +232,26 @@ class PickleDataset(AbstractDataset[Any, Any]):
         if save_args is not None:
             self._save_args.update(save_args)
 
-        self._redis_db = redis.Redis.from_url(
-            **self._redis_from_url_args, **_credentials
-        )
+        self._redis_db = self._get_client({**self._redis_from_url_args, **_credentials})
+
+    @staticmethod
+    def _get_client(from_url_args: dict[str, Any]) -> redis.Redis:
+        client_key = json.dumps(from_url_args, sort_keys=True, default=str)
+        if client_key not in _CLIENTS:
+            with _CLIENTS_LOCK:
+                if client_key not in _CLIENTS:
+                    _CLIENTS[client_key] = redis.Redis.from_url(**from_url_args)
+        return _CLIENTS[client_key]
+
+    @property
+    def _chunks_key(self) -> str:
+        # Redis Cluster hashes only the hash tag of keys which have one, so the
+        # chunks must share it to be in the same slot as the key
+        key = str(self._key)
+        start = key.find("{")
+        if start != -1 and key.find("}", start + 1) > start + 1:
+            return f"{key}:chunks"
+        return f"{{{key}}}:chunks"
 
     def _describe(self) -> dict[str, Any]:
         return {"key": self._key, **self._redis_from_url_args}
@@ -166,26 +259,74 @@ class PickleDataset(AbstractDataset[Any, Any]):
     # `redis_db` mypy does not work since it is optional and optional is not
     # accepted by pickle.loads.
     def _load(self) -> Any:
-        if not self.exists():
+        # the value and its chunks, if any, are read in a single round trip
+        with self._redis_db.pipeline(transaction=True) as pipeline:
+            value, chunks = pipeline.get(self._key).hgetall(self._chunks_key).execute()
+        if value is None:
             raise DatasetError(f"The provided key {self._key} does not exists.")
-        imported_backend = importlib.import_module(self._backend)
+
+        if value.startswith(_CHUNKED_PREFIX):
+            chunk_count = int(value[len(_CHUNKED_PREFIX) :])
+            if len(chunks) != chunk_count:
+                raise DatasetError(
+                    f"Found {len(chunks)} of the {chunk_count} chunks "
+                    f"of key {self._key}."
+                )
+            value = b"".join(
+                chunks[str(index).encode()] for index in range(chunk_count)
+            )
+
+        imported_backend = import_backend(self._backend)
         return imported_backend.loads(  # type: ignore
-            self._redis_db.get(self._key), **self._load_args
+            _decompress(value, self._compression), **self._load_args
         )  # type: ignore
 
     def _save(self, data: Any) -> None:
         try:
-            imported_backend = importlib.import_module(self._backend)
-            self._redis_db.set(
-                self._key,
+            imported_backend = import_backend(self._backend)
+            value = _compress(
                 imported_backend.dumps(data, **self._save_args),  # type: ignore
-                **self._redis_set_args,
+                self._compression,
             )
         except Exception as exc:
             raise DatasetError(
                 f"{data.__class__} was not serialised due to: {exc}"
             ) from exc
 
+        conditional = any(
+            self._redis_set_args.get(arg) for arg in _CONDITIONAL_SET_ARGS
+        )
+        if self._chunk_size is None or len(value) <= self._chunk_size:
+            if conditional:
+                # chunks of a previous value must be kept if it is not replaced
+                self._redis_db.set(self._key, value, **self._redis_set_args)
+                return
+            chunks = []
+        elif conditional:
+            raise DatasetError(
+                f"Cannot save chunks of key {self._key} with any of "
+                f"the {list(_CONDITIONAL_SET_ARGS)} set_args."
+            )
+        else:
+            view = memoryview(value)
+            chunks = [
+                view[start : start + self._chunk_size]
+                for start in range(0, len(view), self._chunk_size)
+            ]
+
+        with self._redis_db.pipeline(transaction=True) as pipeline:
+            pipeline.delete(self._chunks_key)
+            if chunks:
+                pipeline.hset(self._chunks_key, mapping=dict(enumerate(chunks)))
+                for arg, command in _EXPIRE_COMMANDS.items():
+                    if self._redis_set_args.get(arg) is not None:
+                        getattr(pipeline, command)(
+                            self._chunks_key, self._redis_set_args[arg]
+                        )
+                value = _CHUNKED_PREFIX + str(len(chunks)).encode()
+            pipeline.set(self._key, value, **self._redis_set_args)
+            pipeline.execute()
+
     def _exists(self) -> bool:
         try:
             return bool(self._redis_db.exists(self._key))
@@ -3,9 +3,11 @@ filesystem (e.g.: local, S3, GCS). It uses OpenCV VideoCapture to read
 and decode videos and OpenCV VideoWriter to encode and write video.
 """
 import itertools
+import queue
 import tempfile
-from collections import abc
-from collections.abc import Generator, Sequence
+import threading
+from collections import OrderedDict, abc
+from collections.abc import Generator, Iterator, Sequence
 from copy import deepcopy
 from pathlib import Path, PurePosixPath
 from typing import Any, Optional, Union
@@ -14,7 +16,57 @@ import cv2
 import fsspec
 import numpy as np
 import PIL.Image
-from kedro.io.core import AbstractDataset, get_protocol_and_path
+from kedro.io.core import AbstractDataset, DatasetError, get_protocol_and_path
+
+from kedro_datasets._local_cache import CachedFileSystem, cached_filesystem
+
+# Seeking decodes from the previous keyframe, so frames a short distance ahead
+# are reached faster by decoding and discarding the frames in between
+_MAX_GRAB_DISTANCE = 32
+_END_OF_VIDEO = object()
+CHANNEL_ORDERS = ("RGB", "BGR")
+# Lifetime in seconds of the signed URLs of videos read with range requests
+SIGNED_URL_EXPIRATION = 3600
+
+
+def _check_channel_order(channel_order: str) -> None:
+    if channel_order not in CHANNEL_ORDERS:
+        raise ValueError(
+            f"Invalid channel order '{channel_order}', "
+            f"expected one of {', '.join(CHANNEL_ORDERS)}."
+        )
+
+
+def _frame_size(frame: Union[PIL.Image.Image, np.ndarray]) -> tuple[int, int]:
+    if isinstance(frame, np.ndarray):
+        height, width = frame.shape[:2]
+        return width, height
+    return frame.size
+
+
+def _to_array(
+    frame: Union[PIL.Image.Image, np.ndarray], frame_order: str, channel_order: str
+) -> np.ndarray:
+    """Convert a frame to a uint8 array with the given channel order, without
+    copying array frames which already have it"""
+    if isinstance(frame, PIL.Image.Image):
+        if frame.mode != "RGB":
+            frame = frame.convert("RGB")
+        if channel_order == "RGB":
+            return np.asarray(frame)
+        # Let Pillow pack the pixels as BGR instead of swapping them afterwards
+        return np.frombuffer(frame.tobytes("raw", "BGR"), dtype=np.uint8).reshape(
+            frame.height, frame.width, 3
+        )
+    if frame_order == channel_order:
+        return frame
+    return cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)  # Swaps either way
+
+
+def _iter_arrays(video, channel_order: str) -> Iterator[np.ndarray]:
+    _check_channel_order(channel_order)
+    frame_order = video.channel_order
+    return (_to_array(frame, frame_order, channel_order) for frame in video)
 
 
 class SlicedVideo:
@@ -35,12 +87,21 @@ class SlicedVideo:
     def __getattr__(self, item):
         return getattr(self.video, item)
 
+    def get_frames(self, indices: Sequence[int]) -> np.ndarray:
+        """Get frames of the slice as one RGB array of shape (N, height, width, 3)"""
+        return self.video.get_frames([self.indexes[index] for index in indices])
+
+    def iter_arrays(self, channel_order: str = "RGB") -> Iterator[np.ndarray]:
+        """Iterate over the frames of the slice as arrays of shape (height, width, 3)"""
+        return _iter_arrays(self, channel_order)
+
 
 class AbstractVideo(abc.Sequence):
     """Base class for the underlying video data"""
 
     _n_frames = 0
     _index = 0  # Next available frame
+    _channel_order = "RGB"
 
     @property
     def fourcc(self) -> str:
@@ -57,6 +118,11 @@ class AbstractVideo(abc.Sequence):
         """Get the resolution of the video"""
         raise NotImplementedError()
 
+    @property
+    def channel_order(self) -> str:
+        """Get the channel order of the frames which are arrays"""
+        return self._channel_order
+
     def __len__(self) -> int:
         return self._n_frames
 
@@ -64,14 +130,44 @@ class AbstractVideo(abc.Sequence):
         """Get a frame from the video"""
         raise NotImplementedError()
 
+    def get_frames(self, indices: Sequence[int]) -> np.ndarray:
+        """Get frames as one RGB array of shape (N, height, width, 3)"""
+        return np.stack(
+            [_to_array(self[index], self._channel_order, "RGB") for index in indices]
+        )
+
+    def iter_arrays(self, channel_order: str = "RGB") -> Iterator[np.ndarray]:
+        """Iterate over the frames as uint8 arrays of shape (height, width, 3)
+
+        Args:
+            channel_order: Order of the colour channels of the arrays, "RGB" or
+                "BGR". Frames which are arrays in this order already are not copied.
+
+        Returns:
+            An iterator over the frames of the video.
+        """
+        return _iter_arrays(self, channel_order)
+
 
 class FileVideo(AbstractVideo):
-    """A video object read from a file"""
+    """A video object read from a file
+
+    Frames a short distance ahead of the last decoded one are reached by
+    decoding the frames in between instead of seeking, decoded frames can be
+    kept in an LRU cache of ``cache_size`` frames, and iterating over the video
+    decodes up to ``prefetch`` frames ahead in a background thread.
+    """
 
-    def __init__(self, filepath: str) -> None:
+    def __init__(self, filepath: str, cache_size: int = 0, prefetch: int = 0) -> None:
         self._filepath = filepath
         self._cap = cv2.VideoCapture(filepath)
+        if not self._cap.isOpened():
+            raise ValueError(f"Failed to open video '{filepath}'")
         self._n_frames = self._get_length()
+        self._index: Optional[int] = 0
+        self._cache: OrderedDict[int, np.ndarray] = OrderedDict()
+        self._cache_size = cache_size
+        self._prefetch = prefetch
 
     @property
     def fourcc(self) -> str:
@@ -91,23 +187,122 @@ class FileVideo(AbstractVideo):
     def __getitem__(self, index: Union[int, slice]):
         if isinstance(index, slice):
             return SlicedVideo(self, index)
-
+        return PIL.Image.fromarray(self._read_rgb(self._normalise_index(index)))
+
+    def __iter__(self) -> Iterator[PIL.Image.Image]:
+        if not self._prefetch:
+            return super().__iter__()
+        return (PIL.Image.fromarray(frame) for frame in self.iter_arrays())
+
+    def iter_arrays(self, channel_order: str = "RGB") -> Iterator[np.ndarray]:
+        # The frames are decoded with a capture of their own, so that indexing
+        # the video while iterating does not move the position of the decoder.
+        # BGR frames are yielded as decoded, without any conversion.
+        _check_channel_order(channel_order)
+        frames = self._decode(channel_order)
+        if not self._prefetch:
+            return frames
+        return self._prefetched(frames)
+
+    def get_frames(self, indices: Sequence[int]) -> np.ndarray:
+        """Get frames as one RGB array of shape (N, height, width, 3)
+
+        Each distinct frame is decoded once and in the order of the file, so only
+        frames far apart are seeked to.
+        """
+        indices = [self._normalise_index(index) for index in indices]
+        width, height = self.size
+        frames = np.empty((len(indices), height, width, 3), dtype=np.uint8)
+
+        positions: dict[int, list[int]] = {}
+        for position, index in enumerate(indices):
+            positions.setdefault(index, []).append(position)
+        for index in sorted(positions):
+            frames[positions[index]] = self._read_rgb(index)
+        return frames
+
+    def _normalise_index(self, index: int) -> int:
         if index < 0:
             index += len(self)
-        if index >= len(self):
+        if not 0 <= index < len(self):
             raise IndexError()
-
-        if index != self._index:
+        return index
+
+    def _read_rgb(self, index: int) -> np.ndarray:
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            return self._cache[index]
+
+        position = self._index
+        # The position of the decoder is unknown until the frame is read, so
+        # reading after a failed grab or read seeks to the frame
+        self._index = None
+        if position is not None and 0 < index - position <= _MAX_GRAB_DISTANCE:
+            for _ in range(index - position):
+                if not self._cap.grab():
+                    raise IndexError()
+        elif index != position:
             self._cap.set(cv2.CAP_PROP_POS_FRAMES, index)
-        self._index = index + 1  # Next frame to decode after this
         ret, frame_bgr = self._cap.read()
         if not ret:
             raise IndexError()
+        self._index = index + 1  # Next frame to decode after this
+        frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
 
-        height, width = frame_bgr.shape[:2]
-        return PIL.Image.frombuffer(  # Convert to PIL image with RGB instead of BGR
-            "RGB", (width, height), frame_bgr, "raw", "BGR", 0, 0
-        )
+        if self._cache_size:
+            self._cache[index] = frame_rgb
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return frame_rgb
+
+    def _decode(self, channel_order: str) -> Iterator[np.ndarray]:
+        cap = cv2.VideoCapture(self._filepath)
+        try:
+            for _ in range(len(self)):
+                ret, frame_bgr = cap.read()
+                if not ret:
+                    return
+                if channel_order == "BGR":
+                    yield frame_bgr
+                else:
+                    yield cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+        finally:
+            cap.release()
+
+    def _prefetched(self, frames: Iterator[np.ndarray]) -> Iterator[np.ndarray]:
+        buffer: queue.Queue = queue.Queue(maxsize=self._prefetch)
+        stop = threading.Event()
+
+        def put(item: Any) -> None:
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def decode() -> None:
+            try:
+                for frame in frames:
+                    if stop.is_set():
+                        break
+                    put(frame)
+            except Exception as exc:
+                put(exc)
+            finally:
+                frames.close()
+                put(_END_OF_VIDEO)
+
+        thread = threading.Thread(target=decode, daemon=True)
+        thread.start()
+        try:
+            while (item := buffer.get()) is not _END_OF_VIDEO:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            thread.join()
 
     def _get_length(self) -> int:
         # OpenCV's frame count might be an approximation depending on what
@@ -124,19 +319,26 @@ class FileVideo(AbstractVideo):
 
 
 class SequenceVideo(AbstractVideo):
-    """A video object read from an indexable sequence of frames"""
+    """A video object read from an indexable sequence of frames
+
+    Frames are PIL images or uint8 arrays of shape (height, width, 3) with
+    their colour channels in ``channel_order``, and are returned as given.
+    """
 
     def __init__(
         self,
-        frames: Sequence[PIL.Image.Image],
+        frames: Sequence[Union[PIL.Image.Image, np.ndarray]],
         fps: float,
         fourcc: str = "mp4v",
+        channel_order: str = "RGB",
     ) -> None:
+        _check_channel_order(channel_order)
         self._n_frames = len(frames)
         self._frames = frames
         self._fourcc = fourcc
-        self._size = frames[0].size
+        self._size = _frame_size(frames[0])
         self._fps = fps
+        self._channel_order = channel_order
 
     @property
     def fourcc(self) -> str:
@@ -157,21 +359,28 @@ class SequenceVideo(AbstractVideo):
 
 
 class GeneratorVideo(AbstractVideo):
-    """A video object with frames yielded by a generator"""
+    """A video object with frames yielded by a generator
 
-    def __init__(
+    Frames are PIL images or uint8 arrays of shape (height, width, 3) with
+    their colour channels in ``channel_order``, and are yielded as given.
+    """
+
+    def __init__(  # noqa: PLR0913
         self,
-        frames: Generator[PIL.Image.Image, None, None],
+        frames: Generator[Union[PIL.Image.Image, np.ndarray], None, None],
         length,
         fps: float,
         fourcc: str = "mp4v",
+        channel_order: str = "RGB",
     ) -> None:
+        _check_channel_order(channel_order)
         self._n_frames = length
         first = next(frames)
         self._gen = itertools.chain([first], frames)
         self._fourcc = fourcc
-        self._size = first.size
+        self._size = _frame_size(first)
         self._fps = fps
+        self._channel_order = channel_order
 
     @property
     def fourcc(self) -> str:
@@ -214,6 +423,29 @@ class VideoDataset(AbstractDataset[AbstractVideo, AbstractVideo]):
           filepath: s3://your_bucket/data/02_intermediate/company/motorbikes.mp4
           credentials: dev_s3
 
+        dashcam:
+          type: video.VideoDataset
+          filepath: data/01_raw/dashcam.mp4
+          load_args:
+            cache_size: 256
+            prefetch: 16
+
+        surveillance:
+          type: video.VideoDataset
+          filepath: s3://your_bucket/data/01_raw/surveillance.mp4
+          credentials: dev_s3
+          fs_args:
+            cache:
+              path: /mnt/scratch/video-cache
+              max_size: 50000000000
+
+        surveillance_preview:
+          type: video.VideoDataset
+          filepath: s3://your_bucket/data/01_raw/surveillance.mp4
+          credentials: dev_s3
+          load_args:
+            range_read: True
+
     Example usage for the
     `Python API <https://kedro.readthedocs.io/en/stable/data/\
     advanced_data_catalog_usage.html>`_:
@@ -227,6 +459,7 @@ class VideoDataset(AbstractDataset[AbstractVideo, AbstractVideo]):
         ...     filepath="https://storage.googleapis.com/gtv-videos-bucket/sample/ForBiggerBlazes.mp4"
         ... ).load()
         >>> frame = video[0]
+        >>> frames = video.get_frames([0, 10, 20])  # (3, height, width, 3) uint8 array
 
 
     Example creating a video from numpy frames using Python API:
@@ -264,6 +497,20 @@ class VideoDataset(AbstractDataset[AbstractVideo, AbstractVideo]):
         >>> video = VideoDataset(filepath=tmp_path / "my_video.mp4")
         >>> video.save(GeneratorVideo(gen(), fps=25, length=None))
 
+
+    Example creating a video from numpy arrays in OpenCV's BGR channel order, which
+    are written without any conversion:
+
+    .. code-block:: pycon
+
+        >>> from kedro_datasets.video.video_dataset import VideoDataset, SequenceVideo
+        >>> import numpy as np
+        >>>
+        >>> frames = [np.full((480, 640, 3), i, dtype=np.uint8) for i in range(25)]
+        >>> video = VideoDataset(filepath=tmp_path / "my_video.mp4")
+        >>> video.save(SequenceVideo(frames, fps=25, channel_order="BGR"))
+        >>> bgr_frames = list(video.load().iter_arrays("BGR"))
+
     """
 
     def __init__(  # noqa: PLR0913
@@ -271,6 +518,7 @@ class VideoDataset(AbstractDataset[AbstractVideo, AbstractVideo]):
         *,
         filepath: str,
         fourcc: Optional[str] = "mp4v",
+        load_args: dict[str, Any] = None,
         credentials: dict[str, Any] = None,
         fs_args: dict[str, Any] = None,
         metadata: dict[str, Any] = None,
@@ -282,10 +530,21 @@ class VideoDataset(AbstractDataset[AbstractVideo, AbstractVideo]):
             fourcc: The codec to use when writing video, note that depending on how opencv is
                 installed there might be more or less codecs avaiable. If set to None, the
                 fourcc from the video object will be used.
+            load_args: Options of the loaded ``FileVideo``: ``cache_size``, the number
+                of decoded frames kept in memory, and ``prefetch``, the number of frames
+                decoded ahead by a background thread when iterating over the video.
+                If ``range_read`` is True, remote videos are not downloaded but read
+                by OpenCV from their http(s) or signed URL with range requests, which
+                only fetches the parts of the file that are decoded. This is best
+                suited to MP4 files with their metadata at the start ("faststart").
             credentials: Credentials required to get access to the underlying filesystem.
                 E.g. for ``GCSFileSystem`` it should look like `{"token": None}`.
             fs_args: Extra arguments to pass into underlying filesystem class constructor
                 (e.g. `{"project": "my-project"}` for ``GCSFileSystem``).
+                Remote videos are downloaded to a temporary file before being
+                loaded, or to a local cache kept between loads if ``cache`` is set
+                to True or to a dictionary with the cache directory ``path`` and
+                its ``max_size`` in bytes.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
         """
@@ -294,10 +553,15 @@ class VideoDataset(AbstractDataset[AbstractVideo, AbstractVideo]):
         self._protocol = protocol
         self._filepath = PurePosixPath(path)
         self._fourcc = fourcc
+        self._load_args = deepcopy(load_args) or {}
+        self._range_read = self._load_args.pop("range_read", False)
         _fs_args = deepcopy(fs_args) or {}
+        _cache = _fs_args.pop("cache", None)
         _credentials = deepcopy(credentials) or {}
         self._storage_options = {**_credentials, **_fs_args}
-        self._fs = fsspec.filesystem(self._protocol, **self._storage_options)
+        self._fs = cached_filesystem(
+            fsspec.filesystem(self._protocol, **self._storage_options), _cache
+        )
         self.metadata = metadata
 
     def _load(self) -> AbstractVideo:
@@ -306,12 +570,39 @@ class VideoDataset(AbstractDataset[AbstractVideo, AbstractVideo]):
         Returns:
             Data from the video file as a AbstractVideo object
         """
+        load_path = str(self._filepath)
+        if self._protocol == "file":
+            return FileVideo(load_path, **self._load_args)
+        if self._range_read:
+            return FileVideo(self._get_url(load_path), **self._load_args)
+        if isinstance(self._fs, CachedFileSystem):
+            return FileVideo(
+                self._fs.fetch(self._get_fs_path(load_path)), **self._load_args
+            )
+        # OpenCV needs a local file, so remote videos are downloaded first
         with fsspec.open(
-            f"filecache::{self._protocol}://{self._filepath}",
+            f"filecache::{self._protocol}://{load_path}",
             mode="rb",
             **{self._protocol: self._storage_options},
         ) as fs_file:
-            return FileVideo(fs_file.name)
+            return FileVideo(fs_file.name, **self._load_args)
+
+    def _get_fs_path(self, path: str) -> str:
+        # the http(s) filesystem expects URLs, which get_protocol_and_path strips
+        if self._protocol in ("http", "https"):
+            return f"{self._protocol}://{path}"
+        return path
+
+    def _get_url(self, load_path: str) -> str:
+        if self._protocol in ("http", "https"):
+            return self._get_fs_path(load_path)
+        try:
+            return self._fs.sign(load_path, expiration=SIGNED_URL_EXPIRATION)
+        except NotImplementedError as exc:
+            raise DatasetError(
+                f"Range reads are not supported for protocol '{self._protocol}', "
+                f"as its filesystem can't sign URLs."
+            ) from exc
 
     def _save(self, data: AbstractVideo) -> None:
         """Saves video data to the specified filepath."""
@@ -320,19 +611,14 @@ class VideoDataset(AbstractDataset[AbstractVideo, AbstractVideo]):
             self._write_to_filepath(data, str(self._filepath))
         else:
             # VideoWriter can't write to an open file object, instead write to a
-            # local tmpfile and then copy that to the destination with fsspec.
+            # local tmpfile and then upload that to the destination with fsspec,
+            # which streams it in chunks (multipart uploads on object stores).
             # Note that the VideoWriter fails to write to the file on Windows if
             # the file is already open, thus we can't use NamedTemporaryFile.
             with tempfile.TemporaryDirectory() as tmp_dir:
                 tmp_file = Path(tmp_dir) / self._filepath.name
                 self._write_to_filepath(data, str(tmp_file))
-                with fsspec.open(
-                    f"{self._protocol}://{self._filepath}",
-                    "wb",
-                    **self._storage_options,
-                ) as f_target:
-                    with tmp_file.open("r+b") as f_tmp:
-                        f_target.write(f_tmp.read())
+                self._fs.put_file(str(tmp_file), str(self._filepath))
 
     def _write_to_filepath(self, video: AbstractVideo, filepath: str) -> None:
         # TODO: This uses the codec specified in the VideoDataset if it is not None, this is due
@@ -354,15 +640,17 @@ class VideoDataset(AbstractDataset[AbstractVideo, AbstractVideo]):
                 + f"path={filepath}"
             )
         try:
-            for frame in iter(video):
-                writer.write(  # PIL images are RGB, opencv expects BGR
-                    np.asarray(frame)[:, :, ::-1]
-                )
+            for frame in video.iter_arrays("BGR"):  # OpenCV expects BGR
+                writer.write(frame)
         finally:
             writer.release()
 
     def _describe(self) -> dict[str, Any]:
-        return {"filepath": self._filepath, "protocol": self._protocol}
+        return {
+            "filepath": self._filepath,
+            "protocol": self._protocol,
+            "load_args": self._load_args,
+        }
 
     def _exists(self) -> bool:
-        return self._fs.exists(self._filepath)
+        return self._fs.exists(self._get_fs_path(str(self._filepath)))
@@ -36,7 +36,7 @@ pandas_require = {
     "pandas.CSVDataset": [PANDAS],
     "pandas.ExcelDataset": [PANDAS, "openpyxl>=3.0.6, <4.0"],
     "pandas.DeltaTableDataset": [PANDAS, "deltalake>=0.10.0"],
-    "pandas.FeatherDataset": [PANDAS],
+    "pandas.FeatherDataset": [PANDAS, "pyarrow>=6.0"],
     "pandas.GBQTableDataset": [
         PANDAS,
         "pandas-gbq>=0.12.0, <0.18.0; python_version < '3.11'",
@@ -58,8 +58,13 @@ pandas_require = {
     "pandas.XMLDataset": [PANDAS, "lxml~=4.6"],
     "pandas.GenericDataset": [PANDAS],
 }
-pickle_require = {"pickle.PickleDataset": ["compress-pickle[lz4]~=2.1.0"]}
-pillow_require = {"pillow.ImageDataset": ["Pillow~=9.0"]}
+pickle_require = {
+    "pickle.PickleDataset": ["compress-pickle[lz4]~=2.1.0", "zstandard>=0.15"]
+}
+pillow_require = {
+    "pillow.ImageBatchDataset": ["Pillow~=9.1", "numpy"],
+    "pillow.ImageDataset": ["Pillow~=9.1"],
+}
 plotly_require = {
     "plotly.PlotlyDataset": [PANDAS, "plotly>=4.8.0, <6.0"],
     "plotly.JSONDataset": ["plotly>=4.8.0, <6.0"],
@@ -209,7 +214,7 @@ extras_require["test"] = [
     "pandas-gbq>=0.12.0, <0.18.0; python_version < '3.11'",
     "pandas-gbq>=0.18.0; python_version >= '3.11'",
     "pandas~=1.3  # 1.3 for read_xml/to_xml",
-    "Pillow~=9.0",
+    "Pillow~=9.1",
     "plotly>=4.8.0, <6.0",
     "polars[xlsx2csv, deltalake]~=0.18.0",
     "pre-commit>=2.9.2",
@@ -240,6 +245,7 @@ extras_require["test"] = [
     "triad>=0.6.7, <1.0",
     "trufflehog~=2.1",
     "xlsxwriter~=1.0",
+    "zstandard>=0.15",
     # huggingface
     "datasets",
     "huggingface_hub",
@@ -1,12 +1,19 @@
 import base64
+import io
 import json
 import socket
+import threading
+import time
+from collections.abc import Iterator
+from itertools import islice
 from typing import Any
+from urllib.parse import parse_qsl, urlparse
 
 import pytest
 import requests
 from kedro.io.core import DatasetError
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
 from kedro_datasets.api import APIDataset
 
@@ -395,3 +402,433 @@ class TestAPIDataset:
             DatasetError, match="Failed to connect to the remote server"
         ):
             api_dataset.save(TEST_SAVE_DATA[0])
+
+
+class TestAPIDatasetSession:
+    def test_session_reused(self, requests_mock):
+        """Test that all requests of a dataset share one session."""
+        api_dataset = APIDataset(url=TEST_URL, method=TEST_METHOD)
+        requests_mock.register_uri(TEST_METHOD, TEST_URL, text=TEST_TEXT_RESPONSE_DATA)
+
+        api_dataset.load()
+        session = api_dataset._session
+        assert api_dataset.exists()
+        api_dataset.load()
+        assert api_dataset._session is session
+        assert requests_mock.call_count == 3
+
+    def test_release_closes_session(self, requests_mock, mocker):
+        api_dataset = APIDataset(url=TEST_URL, method=TEST_METHOD)
+        requests_mock.register_uri(TEST_METHOD, TEST_URL)
+        api_dataset.load()
+        close = mocker.spy(api_dataset._session, "close")
+
+        api_dataset.release()
+        close.assert_called_once()
+        assert api_dataset._session is None
+        api_dataset.load()
+        assert api_dataset._session is not None
+
+    def test_no_retry_by_default(self):
+        adapter = APIDataset(url=TEST_URL)._get_session().get_adapter(TEST_URL)
+        assert adapter.max_retries.total == 0
+
+    @pytest.mark.parametrize(
+        "retry,total,backoff_factor,allowed_methods",
+        [
+            (3, 3, 0.5, Retry.DEFAULT_ALLOWED_METHODS),
+            (
+                {"total": 5, "backoff_factor": 1, "allowed_methods": ["GET", "POST"]},
+                5,
+                1,
+                ["GET", "POST"],
+            ),
+        ],
+    )
+    def test_retry(self, retry, total, backoff_factor, allowed_methods):
+        """Test that requests are retried on 429 and 5xx responses."""
+        api_dataset = APIDataset(
+            url=TEST_URL, method="POST", save_args={"retry": retry, "max_workers": 32}
+        )
+        adapter = api_dataset._get_session().get_adapter(TEST_URL)
+
+        assert adapter.max_retries.total == total
+        assert adapter.max_retries.backoff_factor == backoff_factor
+        assert adapter.max_retries.allowed_methods == allowed_methods
+        assert adapter.max_retries.is_retry("GET", 429)
+        assert adapter.max_retries.is_retry("GET", 503)
+        assert not adapter.max_retries.is_retry("GET", 404)
+        assert adapter._pool_maxsize == 32
+
+    def test_retried_request_error(self, requests_mock):
+        """Test that the last response is reported once retries are exhausted."""
+        api_dataset = APIDataset(url=TEST_URL, load_args={"retry": 2})
+        requests_mock.register_uri(
+            TEST_METHOD, TEST_URL, status_code=requests.codes.SERVICE_UNAVAILABLE
+        )
+        with pytest.raises(DatasetError, match="Failed to fetch data"):
+            api_dataset.load()
+
+
+class TestAPIDatasetChunks:
+    @pytest.mark.parametrize(
+        "records,chunk_size,expected_chunks",
+        [(4, 2, [[0, 1], [2, 3]]), (5, 2, [[0, 1], [2, 3], [4]]), (0, 2, [[]])],
+    )
+    def test_chunks(self, requests_mock, records, chunk_size, expected_chunks):
+        """Test that data is split into chunks without a trailing empty chunk."""
+        api_dataset = APIDataset(
+            url=TEST_URL, method="POST", save_args={"chunk_size": chunk_size}
+        )
+        requests_mock.register_uri("POST", TEST_URL)
+
+        api_dataset.save(list(range(records)))
+        assert [request.json() for request in requests_mock.request_history] == (
+            expected_chunks
+        )
+
+    def test_concurrent_chunks(self, requests_mock):
+        """Test that chunks are sent concurrently and the last response is returned."""
+        threads = set()
+
+        def json_callback(request: requests.Request, context: Any) -> list:
+            threads.add(threading.get_ident())
+            time.sleep(0.01)
+            return request.json()
+
+        api_dataset = APIDataset(
+            url=TEST_URL,
+            method="POST",
+            save_args={"chunk_size": 10, "max_workers": 4},
+        )
+        requests_mock.register_uri("POST", TEST_URL, json=json_callback)
+
+        response = api_dataset._save(list(range(100)))
+        assert response.json() == list(range(90, 100))
+        assert len(threads) > 1
+        sent = sorted(
+            record
+            for request in requests_mock.request_history
+            for record in request.json()
+        )
+        assert sent == list(range(100))
+
+    def test_concurrent_chunks_error(self, requests_mock):
+        api_dataset = APIDataset(
+            url=TEST_URL,
+            method="POST",
+            save_args={"chunk_size": 1, "max_workers": 2},
+        )
+        requests_mock.register_uri(
+            "POST", TEST_URL, status_code=requests.codes.FORBIDDEN
+        )
+
+        with pytest.raises(DatasetError, match="Failed to send data"):
+            api_dataset.save(list(range(100)))
+        assert requests_mock.call_count < 100
+
+
+def _query(request: requests.Request) -> dict[str, str]:
+    return dict(parse_qsl(urlparse(request.url).query))
+
+
+class TestAPIDatasetPagination:
+    @pytest.mark.parametrize("iterate", [False, True])
+    def test_cursor(self, requests_mock, iterate):
+        """Test that the cursor of each page is followed until there is none."""
+        pages = {
+            None: {"data": [1, 2], "meta": {"next": "b"}},
+            "b": {"data": [3, 4], "meta": {"next": "c"}},
+            "c": {"data": [5], "meta": None},
+        }
+        requests_mock.register_uri(
+            TEST_METHOD,
+            TEST_URL,
+            json=lambda request, context: pages[_query(request).get("after")],
+        )
+        api_dataset = APIDataset(
+            url=TEST_URL,
+            load_args={
+                "params": TEST_PARAMS,
+                "pagination": {
+                    "type": "cursor",
+                    "records_path": "data",
+                    "cursor_path": "meta.next",
+                    "cursor_param": "after",
+                    "iterate": iterate,
+                },
+            },
+        )
+
+        records = api_dataset.load()
+        assert requests_mock.call_count == 1 if iterate else 3
+        assert isinstance(records, Iterator if iterate else list)
+        assert list(records) == [1, 2, 3, 4, 5]
+        assert all(
+            _query(request)["param"] == "value"
+            for request in requests_mock.request_history
+        )
+
+    def test_max_pages(self, requests_mock):
+        requests_mock.register_uri(
+            TEST_METHOD, TEST_URL, json={"data": [1, 2], "cursor": "next"}
+        )
+        api_dataset = APIDataset(
+            url=TEST_URL,
+            load_args={
+                "pagination": {
+                    "type": "cursor",
+                    "records_path": "data",
+                    "cursor_path": "cursor",
+                    "max_pages": 3,
+                }
+            },
+        )
+        assert api_dataset.load() == [1, 2] * 3
+        assert requests_mock.call_count == 3
+
+    def test_link_header(self, requests_mock):
+        requests_mock.register_uri(
+            TEST_METHOD,
+            TEST_URL,
+            json=[1, 2],
+            headers={"Link": '</api/test?page=2>; rel="next"'},
+        )
+        requests_mock.register_uri(
+            TEST_METHOD,
+            TEST_URL + "?page=2",
+            json=[3],
+            complete_qs=True,
+        )
+        api_dataset = APIDataset(
+            url=TEST_URL,
+            load_args={"params": TEST_PARAMS, "pagination": {"type": "link"}},
+        )
+
+        assert api_dataset.load() == [1, 2, 3]
+        assert requests_mock.request_history[-1].url == TEST_URL + "?page=2"
+
+    def test_next_url_in_body(self, requests_mock):
+        requests_mock.register_uri(
+            TEST_METHOD,
+            TEST_URL,
+            json={"results": [1], "next": TEST_URL + "?page=2"},
+        )
+        requests_mock.register_uri(
+            TEST_METHOD,
+            TEST_URL + "?page=2",
+            json={"results": [2], "next": None},
+            complete_qs=True,
+        )
+        api_dataset = APIDataset(
+            url=TEST_URL,
+            load_args={
+                "pagination": {
+                    "type": "link",
+                    "records_path": "results",
+                    "next_url_path": "next",
+                }
+            },
+        )
+        assert api_dataset.load() == [1, 2]
+
+    @pytest.mark.parametrize("max_pages,expected", [(None, 25), (2, 20)])
+    def test_offset(self, requests_mock, max_pages, expected):
+        """Test that offset pages are fetched until one is not full."""
+        requests_mock.register_uri(
+            TEST_METHOD,
+            TEST_URL,
+            json=lambda request, context: list(range(int(_query(request)["skip"]), 25))[
+                : int(_query(request)["top"])
+            ],
+        )
+        api_dataset = APIDataset(
+            url=TEST_URL,
+            load_args={
+                "pagination": {
+                    "type": "offset",
+                    "offset_param": "skip",
+                    "limit_param": "top",
+                    "limit": 10,
+                    "max_pages": max_pages,
+                }
+            },
+        )
+        assert api_dataset.load() == list(range(expected))
+
+    @pytest.mark.parametrize("max_pages,expected", [(None, 95), (3, 30)])
+    def test_offset_with_total(self, requests_mock, max_pages, expected):
+        """Test that pages are fetched concurrently once the total is known."""
+        threads = set()
+
+        def json_callback(request: requests.Request, context: Any) -> dict:
+            threads.add(threading.get_ident())
+            time.sleep(0.01)
+            offset = int(_query(request)["offset"])
+            return {"items": list(range(offset, min(offset + 10, 95))), "total": 95}
+
+        requests_mock.register_uri(TEST_METHOD, TEST_URL, json=json_callback)
+        api_dataset = APIDataset(
+            url=TEST_URL,
+            load_args={
+                "max_workers": 4,
+                "pagination": {
+                    "type": "offset",
+                    "limit": 10,
+                    "records_path": "items",
+                    "total_path": "total",
+                    "max_pages": max_pages,
+                },
+            },
+        )
+
+        assert api_dataset.load() == list(range(expected))
+        assert requests_mock.call_count == expected // 10 + bool(expected % 10)
+        assert len(threads) > 1
+
+    def test_offset_with_total_bounded(self, requests_mock):
+        """Test that only a bounded number of pages are fetched ahead of the
+        records consumed."""
+        requests_mock.register_uri(
+            TEST_METHOD,
+            TEST_URL,
+            json=lambda request, context: {
+                "items": [int(_query(request)["offset"])] * 10,
+                "total": 1000,
+            },
+        )
+        api_dataset = APIDataset(
+            url=TEST_URL,
+            load_args={
+                "max_workers": 2,
+                "pagination": {
+                    "type": "offset",
+                    "limit": 10,
+                    "records_path": "items",
+                    "total_path": "total",
+                    "iterate": True,
+                },
+            },
+        )
+
+        records = api_dataset.load()
+        assert list(islice(records, 11)) == [0] * 10 + [10]
+        # the first two pages and at most four pages ahead of the second one
+        assert requests_mock.call_count <= 6
+        assert len(list(records)) == 989
+
+    def test_offset_with_total_page_error(self, requests_mock):
+        """Test that the pages queued after a failed page are not fetched."""
+
+        def json_callback(request: requests.Request, context: Any) -> dict:
+            offset = int(_query(request)["offset"])
+            if offset == 10:
+                context.status_code = requests.codes.SERVICE_UNAVAILABLE
+            return {"items": [offset] * 10, "total": 1000}
+
+        requests_mock.register_uri(TEST_METHOD, TEST_URL, json=json_callback)
+        api_dataset = APIDataset(
+            url=TEST_URL,
+            load_args={
+                "pagination": {
+                    "type": "offset",
+                    "limit": 10,
+                    "records_path": "items",
+                    "total_path": "total",
+                },
+            },
+        )
+        with pytest.raises(DatasetError, match="Failed to fetch data"):
+            api_dataset.load()
+        assert requests_mock.call_count <= 3
+
+    @pytest.mark.parametrize(
+        "pagination,body,pattern",
+        [
+            (
+                {"type": "offset", "records_path": "items"},
+                '{"items": null}',
+                r"Found no records at 'items' in a page of",
+            ),
+            (
+                {"type": "offset", "records_path": "items", "total_path": "total"},
+                '{"items": [1], "total": null}',
+                r"Expected the total number of records at 'total' in the first "
+                r"page of '.*', got None\.",
+            ),
+            ({"type": "link"}, "null", r"Found no records in a page of"),
+        ],
+    )
+    def test_null_pagination_values(self, requests_mock, pagination, body, pattern):
+        requests_mock.register_uri(TEST_METHOD, TEST_URL, text=body)
+        api_dataset = APIDataset(url=TEST_URL, load_args={"pagination": pagination})
+        with pytest.raises(DatasetError, match=pattern):
+            api_dataset.load()
+
+    def test_page_error(self, requests_mock):
+        requests_mock.register_uri(
+            TEST_METHOD,
+            TEST_URL,
+            [
+                {"json": {"data": [1], "cursor": "b"}},
+                {"status_code": requests.codes.SERVICE_UNAVAILABLE},
+            ],
+        )
+        api_dataset = APIDataset(
+            url=TEST_URL,
+            load_args={
+                "pagination": {
+                    "type": "cursor",
+                    "records_path": "data",
+                    "cursor_path": "cursor",
+                }
+            },
+        )
+        with pytest.raises(DatasetError, match="Failed to fetch data"):
+            api_dataset.load()
+
+    @pytest.mark.parametrize(
+        "load_args,pattern",
+        [
+            ({"pagination": {"type": "page"}}, "Pagination 'type' must be one of"),
+            ({"pagination": {"type": "cursor"}}, "requires a 'cursor_path'"),
+            (
+                {"pagination": {"type": "link"}, "ndjson": True},
+                "Cannot combine 'pagination' and 'ndjson'",
+            ),
+        ],
+    )
+    def test_invalid_pagination(self, load_args, pattern):
+        with pytest.raises(ValueError, match=pattern):
+            APIDataset(url=TEST_URL, load_args=load_args)
+
+    def test_describe(self):
+        pagination = {"type": "link"}
+        api_dataset = APIDataset(url=TEST_URL, load_args={"pagination": pagination})
+        assert api_dataset._describe()["pagination"] == pagination
+        assert "ndjson" not in api_dataset._describe()
+
+
+class TestAPIDatasetNDJSON:
+    def test_ndjson(self, requests_mock):
+        """Test that records are parsed from the streamed response line by line."""
+        requests_mock.register_uri(
+            TEST_METHOD,
+            TEST_URL,
+            body=io.BytesIO(b'{"id": 1}\n\n{"id": 2}\r\n{"id": 3}'),
+        )
+        api_dataset = APIDataset(url=TEST_URL, load_args={"ndjson": True})
+
+        records = api_dataset.load()
+        assert requests_mock.last_request.stream
+        assert next(records) == {"id": 1}
+        assert list(records) == [{"id": 2}, {"id": 3}]
+        assert api_dataset._describe()["ndjson"]
+
+    def test_ndjson_http_error(self, requests_mock):
+        requests_mock.register_uri(
+            TEST_METHOD, TEST_URL, status_code=requests.codes.FORBIDDEN
+        )
+        api_dataset = APIDataset(url=TEST_URL, load_args={"ndjson": True})
+        with pytest.raises(DatasetError, match="Failed to fetch data"):
+            api_dataset.load()
@@ -15,6 +15,7 @@ import aiohttp.client_reqrep
 import aiohttp.typedefs
 import botocore.awsrequest
 import botocore.model
+import fsspec
 from kedro.io.core import generate_timestamp
 from pytest import fixture
 
@@ -102,3 +103,12 @@ def save_args(request):
 @fixture(params=[None])
 def fs_args(request):
     return request.param
+
+
+@fixture
+def memory_fs():
+    fs = fsspec.filesystem("memory")
+    yield fs
+    fs.store.clear()
+    fs.pseudo_dirs.clear()
+    fs.pseudo_dirs.append("")
@@ -1,3 +1,4 @@
+import io
 import os
 import sys
 from pathlib import Path, PurePosixPath
@@ -16,6 +17,7 @@ from pandas.testing import assert_frame_equal
 from s3fs.core import S3FileSystem
 
 from kedro_datasets.pandas import CSVDataset
+from kedro_datasets.pandas import _glob as pd_glob
 
 BUCKET_NAME = "test_bucket"
 FILE_NAME = "test.csv"
@@ -114,6 +116,110 @@ class TestCSVDataset:
         for key, value in save_args.items():
             assert csv_dataset._save_args[key] == value
 
+    @pytest.mark.parametrize("save_args", [{"chunksize": 100}], indirect=True)
+    def test_save_streams_to_file(self, csv_dataset, mocker):
+        """Test that data is written to the file handle in chunks, without
+        being serialised to an in-memory buffer first."""
+        written = []
+
+        class WriteOnlyFile(io.RawIOBase):
+            def writable(self):
+                return True
+
+            def write(self, b):
+                written.append(bytes(b))
+                return len(b)
+
+        mocker.patch.object(csv_dataset._fs, "open", return_value=WriteOnlyFile())
+        mocker.patch.object(csv_dataset._fs, "mv_file")
+        data = pd.DataFrame({"col1": range(100_000)})
+        csv_dataset.save(data)
+
+        assert len(written) > 1
+        assert b"".join(written) == data.to_csv(index=False, chunksize=100).encode()
+
+    def test_load_glob(self, tmp_path, mocker):
+        """Test loading all files matching a glob pattern concurrently."""
+        for i in range(3):
+            pd.DataFrame({"col1": [i, i]}).to_csv(
+                tmp_path / f"export_{i}.csv.gz", index=False
+            )
+        (tmp_path / "other.csv").write_text("col1\n42\n")
+        executor = mocker.spy(pd_glob, "ThreadPoolExecutor")
+
+        dataset = CSVDataset(
+            filepath=(tmp_path / "export_*.csv.gz").as_posix(),
+            load_args={
+                "glob": True,
+                "max_workers": 2,
+                "include_source_column": "shard",
+            },
+        )
+        reloaded = dataset.load()
+
+        executor.assert_called_once_with(max_workers=2)
+        assert reloaded["col1"].tolist() == [0, 0, 1, 1, 2, 2]
+        assert reloaded.index.tolist() == list(range(6))
+        assert [Path(shard).name for shard in reloaded["shard"].unique()] == [
+            f"export_{i}.csv.gz" for i in range(3)
+        ]
+        assert dataset.exists()
+
+    def test_load_glob_no_match(self, tmp_path):
+        dataset = CSVDataset(
+            filepath=(tmp_path / "export_*.csv").as_posix(), load_args={"glob": True}
+        )
+        assert not dataset.exists()
+        pattern = r"No files found matching '.+export_\*\.csv'\."
+        with pytest.raises(DatasetError, match=pattern):
+            dataset.load()
+
+    def test_save_glob(self, tmp_path, dummy_dataframe):
+        dataset = CSVDataset(
+            filepath=(tmp_path / "export_*.csv").as_posix(), load_args={"glob": True}
+        )
+        pattern = r"Saving CSVDataset to a glob pattern '.+' is not supported\."
+        with pytest.raises(DatasetError, match=pattern):
+            dataset.save(dummy_dataframe)
+
+    def test_glob_characters_without_glob(self, tmp_path, dummy_dataframe):
+        """Test that paths with glob characters are read and written as is
+        unless globbing is enabled."""
+        (tmp_path / "d1.csv").write_text("col1\n42\n")
+        dataset = CSVDataset(filepath=(tmp_path / "d[1].csv").as_posix())
+        assert not dataset.exists()
+
+        dataset.save(dummy_dataframe)
+        assert dataset.exists()
+        assert_frame_equal(dataset.load(), dummy_dataframe)
+
+    def test_http_query_string_not_globbed(self, mocker, dummy_dataframe):
+        read_csv = mocker.patch.object(pd, "read_csv", return_value=dummy_dataframe)
+        dataset = CSVDataset(filepath="http://127.0.0.1:8765/a.csv?raw=true")
+        assert_frame_equal(dataset.load(), dummy_dataframe)
+        assert read_csv.call_args[0][0] == "http://127.0.0.1:8765/a.csv?raw=true"
+
+    def test_http_glob_not_supported(self):
+        pattern = r"Glob patterns are not supported for protocol 'https'\."
+        with pytest.raises(DatasetError, match=pattern):
+            CSVDataset(
+                filepath="https://example.com/export_*.csv", load_args={"glob": True}
+            )
+
+    def test_include_source_column(self, filepath_csv, dummy_dataframe):
+        dataset = CSVDataset(
+            filepath=filepath_csv, load_args={"include_source_column": True}
+        )
+        dataset.save(dummy_dataframe)
+        assert dataset.load()["source"].tolist() == [filepath_csv] * 2
+
+    def test_failed_save_leaves_no_file(self, csv_dataset, mocker):
+        """Test that a save which fails midway does not leave a file behind."""
+        mocker.patch.object(pd.DataFrame, "to_csv", side_effect=ValueError("boom"))
+        with pytest.raises(DatasetError, match="boom"):
+            csv_dataset.save(pd.DataFrame({"col1": [1, 2]}))
+        assert not csv_dataset.exists()
+
     @pytest.mark.parametrize(
         "load_args,save_args",
         [
@@ -1,3 +1,4 @@
+import io
 from pathlib import Path, PurePosixPath
 
 import pandas as pd
@@ -62,6 +63,26 @@ class TestExcelDataset:
         reloaded = excel_dataset.load()
         assert_frame_equal(dummy_dataframe, reloaded)
 
+    def test_save_to_non_seekable_file(self, excel_dataset, dummy_dataframe, mocker):
+        """Test that the workbook can be written straight to a file handle
+        which does not support seeking, such as a remote upload."""
+        written = []
+
+        class WriteOnlyFile(io.RawIOBase):
+            def writable(self):
+                return True
+
+            def write(self, b):
+                written.append(bytes(b))
+                return len(b)
+
+        mocker.patch.object(excel_dataset._fs, "open", return_value=WriteOnlyFile())
+        mocker.patch.object(excel_dataset._fs, "mv_file")
+        excel_dataset.save(dummy_dataframe)
+
+        reloaded = pd.read_excel(io.BytesIO(b"".join(written)))
+        assert_frame_equal(dummy_dataframe, reloaded)
+
     def test_save_and_load_multiple_sheets(
         self, excel_multisheet_dataset, dummy_dataframe, another_dummy_dataframe
     ):
@@ -1,6 +1,7 @@
 from pathlib import Path, PurePosixPath
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 from fsspec.implementations.http import HTTPFileSystem
 from fsspec.implementations.local import LocalFileSystem
@@ -80,6 +81,38 @@ class TestFeatherDataset:
         assert "storage_options" not in ds._save_args
         assert "storage_options" not in ds._load_args
 
+    def test_load_memory_map(self, filepath_feather):
+        """Test that memory-mapped single chunk columns are loaded without copying."""
+        data = pd.DataFrame({"col1": range(100_000), "col2": 0.5})
+        FeatherDataset(
+            filepath=filepath_feather,
+            save_args={"compression": "uncompressed", "chunksize": len(data)},
+        ).save(data)
+        dataset = FeatherDataset(
+            filepath=filepath_feather, load_args={"memory_map": True}
+        )
+
+        allocated = pa.total_allocated_bytes()
+        reloaded = dataset.load()
+
+        assert pa.total_allocated_bytes() == allocated
+        assert not reloaded["col1"].to_numpy().flags.owndata
+        assert_frame_equal(data, reloaded)
+
+    @pytest.mark.parametrize("protocol", ["", "memory://"])
+    def test_load_as_table(self, filepath_feather, dummy_dataframe, protocol):
+        """Test loading a ``pyarrow.Table`` and saving it back."""
+        dataset = FeatherDataset(
+            filepath=f"{protocol}{filepath_feather}",
+            load_args={"memory_map": True, "as_table": True, "columns": ["col1"]},
+        )
+        dataset.save(pa.Table.from_pandas(dummy_dataframe))
+        reloaded = dataset.load()
+
+        assert isinstance(reloaded, pa.Table)
+        assert reloaded.column_names == ["col1"]
+        assert reloaded.to_pandas().equals(dummy_dataframe[["col1"]])
+
     def test_load_missing_file(self, feather_dataset):
         """Check the error when trying to load missing file."""
         pattern = r"Failed while loading data from data set FeatherDataset\(.*\)"
@@ -92,6 +92,46 @@ class TestJSONDataset:
         assert "storage_options" not in ds._save_args
         assert "storage_options" not in ds._load_args
 
+    def test_load_glob(self, tmp_path):
+        """Test loading all files matching a glob pattern."""
+        for i in range(3):
+            pd.DataFrame({"col1": [i, i]}).to_json(
+                tmp_path / f"events_{i}.jsonl", orient="records", lines=True
+            )
+        dataset = JSONDataset(
+            filepath=(tmp_path / "events_*.jsonl").as_posix(),
+            load_args={"glob": True, "lines": True, "include_source_column": True},
+        )
+        reloaded = dataset.load()
+
+        assert reloaded["col1"].tolist() == [0, 0, 1, 1, 2, 2]
+        assert reloaded.index.tolist() == list(range(6))
+        assert [Path(source).name for source in reloaded["source"].unique()] == [
+            f"events_{i}.jsonl" for i in range(3)
+        ]
+        assert dataset.exists()
+
+    def test_save_glob(self, tmp_path, dummy_dataframe):
+        dataset = JSONDataset(
+            filepath=(tmp_path / "events_*.json").as_posix(), load_args={"glob": True}
+        )
+        pattern = r"Saving JSONDataset to a glob pattern '.+' is not supported\."
+        with pytest.raises(DatasetError, match=pattern):
+            dataset.save(dummy_dataframe)
+
+    def test_http_glob_not_supported(self):
+        pattern = r"Glob patterns are not supported for protocol 'https'\."
+        with pytest.raises(DatasetError, match=pattern):
+            JSONDataset(
+                filepath="https://example.com/events_*.json", load_args={"glob": True}
+            )
+
+    def test_glob_characters_without_glob(self, tmp_path, dummy_dataframe):
+        dataset = JSONDataset(filepath=(tmp_path / "events?.json").as_posix())
+        dataset.save(dummy_dataframe)
+        assert dataset.exists()
+        assert_frame_equal(dataset.load(), dummy_dataframe)
+
     def test_load_missing_file(self, json_dataset):
         """Check the error when trying to load missing file."""
         pattern = r"Failed while loading data from data set JSONDataset\(.*\)"
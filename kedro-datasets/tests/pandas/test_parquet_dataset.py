@@ -1,3 +1,4 @@
+import io
 from pathlib import Path, PurePosixPath
 
 import pandas as pd
@@ -64,6 +65,79 @@ class TestParquetDataset:
         assert all(files)
         assert len(files) == 1
 
+    def test_save_streams_to_file(self, parquet_dataset, mocker):
+        """Test that data is written to the file handle as it is serialised,
+        without being buffered in memory first."""
+        written = []
+
+        class WriteOnlyFile(io.RawIOBase):
+            def writable(self):
+                return True
+
+            def write(self, b):
+                written.append(bytes(b))
+                return len(b)
+
+        mocker.patch.object(parquet_dataset._fs, "open", return_value=WriteOnlyFile())
+        mocker.patch.object(parquet_dataset._fs, "mv_file")
+        data = pd.DataFrame({"col1": range(100_000)})
+        parquet_dataset._save_args["row_group_size"] = 10_000
+        parquet_dataset.save(data)
+
+        assert len(written) > 1
+        assert_frame_equal(pd.read_parquet(io.BytesIO(b"".join(written))), data)
+
+    @pytest.mark.parametrize("protocol", ["", "memory://"])
+    def test_load_columns_and_filters(self, tmp_path, protocol):
+        """Test that only the selected columns and matching row groups are read."""
+        data = pd.DataFrame({"col1": range(100), "col2": range(100), "col3": "x"})
+        filepath = f"{protocol}{(tmp_path / FILENAME).as_posix()}"
+        ParquetDataset(filepath=filepath, save_args={"row_group_size": 10}).save(data)
+
+        dataset = ParquetDataset(
+            filepath=filepath, columns=["col1"], filters=[("col2", ">=", 85)]
+        )
+        reloaded = dataset.load()
+
+        assert reloaded["col1"].tolist() == list(range(85, 100))
+        assert list(reloaded.columns) == ["col1"]
+        metrics = dataset.scan_metrics
+        assert metrics["row_groups"] == 10
+        assert metrics["row_groups_skipped"] == 8
+        assert 0 < metrics["bytes_skipped"] < metrics["bytes"]
+
+    def test_load_columns_keeps_index(self, tmp_path):
+        """Test that the index saved by pandas is loaded with the selected columns."""
+        data = pd.DataFrame(
+            {"col1": [1, 2], "col2": [3, 4]}, index=pd.Index(["a", "b"], name="key")
+        )
+        filepath = (tmp_path / FILENAME).as_posix()
+        ParquetDataset(filepath=filepath).save(data)
+
+        dataset = ParquetDataset(filepath=filepath, columns=["col2"])
+        assert_frame_equal(dataset.load(), data[["col2"]])
+        assert dataset.scan_metrics["row_groups_skipped"] == 0
+        assert 0 < dataset.scan_metrics["bytes_skipped"] < dataset.scan_metrics["bytes"]
+
+    def test_load_filters_hive_partitions(self, tmp_path):
+        """Test that hive partitions which cannot match the filters are skipped."""
+        for year in [2022, 2023]:
+            partition = tmp_path / "flights" / f"year={year}"
+            partition.mkdir(parents=True)
+            pd.DataFrame({"delay": [year - 2022, 60]}).to_parquet(
+                partition / "part-0.parquet"
+            )
+
+        dataset = ParquetDataset(
+            filepath=(tmp_path / "flights").as_posix(),
+            filters=[[("year", "=", 2023), ("delay", "<", 10)]],
+        )
+        reloaded = dataset.load()
+
+        assert reloaded["delay"].tolist() == [1]
+        assert dataset.scan_metrics["row_groups"] == 2
+        assert dataset.scan_metrics["row_groups_skipped"] == 1
+
     def test_save_and_load_non_existing_dir(self, tmp_path, dummy_dataframe):
         """Test saving and reloading the data set to non-existing directory."""
         filepath = (tmp_path / "non-existing" / FILENAME).as_posix()
@@ -1,12 +1,19 @@
-from pathlib import PosixPath
+import threading
+import time
+from pathlib import Path, PosixPath
 from unittest.mock import ANY
 
 import pandas as pd
 import pytest
 import sqlalchemy
 from kedro.io.core import DatasetError
+from pandas.testing import assert_frame_equal
 
 from kedro_datasets.pandas import SQLQueryDataset, SQLTableDataset
+from kedro_datasets.pandas.sql_dataset import (
+    _insert_copy,
+    _insert_fast_executemany,
+)
 
 TABLE_NAME = "table_a"
 CONNECTION = "sqlite:///kedro.db"
@@ -22,8 +29,8 @@ ERROR_PREFIX = (
 @pytest.fixture(autouse=True)
 def cleanup_engines():
     yield
-    SQLTableDataset.engines = {}
-    SQLQueryDataset.engines = {}
+    SQLTableDataset.engines.clear()
+    SQLQueryDataset.engines.clear()
 
 
 @pytest.fixture
@@ -38,6 +45,14 @@ def sql_file(tmp_path: PosixPath):
     return file.as_posix()
 
 
+@pytest.fixture
+def sqlite_connection(tmp_path: PosixPath):
+    connection = f"sqlite:///{tmp_path / 'test.db'}"
+    data = pd.DataFrame({"col1": range(5), "col2": list("abcde")})
+    data.to_sql(TABLE_NAME, connection, index=False)
+    return connection
+
+
 @pytest.fixture(params=[{}])
 def table_dataset(request):
     kwargs = {"table_name": TABLE_NAME, "credentials": {"con": CONNECTION}}
@@ -198,6 +213,129 @@ class TestSQLTableDataset:
             name=TABLE_NAME, con=table_dataset.engines[CONNECTION], index=False
         )
 
+    def test_load_chunks(self, sqlite_connection):
+        dataset = SQLTableDataset(
+            table_name=TABLE_NAME,
+            credentials={"con": sqlite_connection},
+            load_args={"chunksize": 2},
+        )
+        chunks = dataset.load()
+        assert not isinstance(chunks, pd.DataFrame)
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        metrics = dataset.stream_metrics
+        assert metrics["chunks"] == 3
+        assert metrics["rows"] == 5
+        assert metrics["bytes"] > 0
+
+    def test_save_chunks(self, tmp_path, sqlite_connection):
+        """Test that an iterator of chunks is appended after the first chunk"""
+        source = SQLTableDataset(
+            table_name=TABLE_NAME,
+            credentials={"con": sqlite_connection},
+            load_args={"chunksize": 2},
+        )
+        # SQLite locks the database file while the source cursor is open
+        target = SQLTableDataset(
+            table_name="table_b",
+            credentials={"con": f"sqlite:///{tmp_path / 'target.db'}"},
+            save_args={"if_exists": "replace"},
+        )
+        target.save(source.load())
+        target.save(source.load())
+
+        expected = pd.read_sql_table(TABLE_NAME, sqlite_connection)
+        pd.testing.assert_frame_equal(target.load(), expected)
+
+    @pytest.mark.parametrize("method", [None, "multi"])
+    def test_save_transaction_per_chunk(self, mocker, sqlite_connection, method):
+        data = pd.DataFrame({"col1": range(5), "col2": list("vwxyz")})
+        dataset = SQLTableDataset(
+            table_name="table_b",
+            credentials={"con": sqlite_connection},
+            save_args={"method": method, "chunksize": 2, "transaction_per_chunk": True},
+        )
+        spy_to_sql = mocker.spy(pd.DataFrame, "to_sql")
+        dataset.save(data)
+
+        # each chunk is written by its own ``to_sql`` call and transaction
+        assert [len(call.args[0]) for call in spy_to_sql.call_args_list] == [2, 2, 1]
+        pd.testing.assert_frame_equal(dataset.load(), data)
+
+    def test_transaction_per_chunk_without_chunksize(self):
+        pattern = r"'transaction_per_chunk' requires 'chunksize' in 'save_args'\."
+        with pytest.raises(DatasetError, match=pattern):
+            SQLTableDataset(
+                table_name=TABLE_NAME,
+                credentials={"con": CONNECTION},
+                save_args={"transaction_per_chunk": True},
+            )
+
+    @pytest.mark.parametrize(
+        "method,expected", [("copy", _insert_copy), ("multi", "multi")]
+    )
+    def test_save_method(self, mocker, dummy_dataframe, method, expected):
+        dataset = SQLTableDataset(
+            table_name=TABLE_NAME,
+            credentials={"con": CONNECTION},
+            save_args={"method": method},
+        )
+        mocker.patch.object(dummy_dataframe, "to_sql")
+        dataset.save(dummy_dataframe)
+        dummy_dataframe.to_sql.assert_called_once_with(
+            name=TABLE_NAME, con=dataset.engine, index=False, method=expected
+        )
+        assert dataset._save_args["method"] == method
+
+    @staticmethod
+    def _mock_sql_table(mocker, dialect):
+        table = sqlalchemy.Table(
+            TABLE_NAME,
+            sqlalchemy.MetaData(),
+            sqlalchemy.Column("col1"),
+            sqlalchemy.Column("Col 2"),
+            schema="dwschema",
+        )
+        conn = mocker.MagicMock()
+        conn.dialect = dialect
+        return mocker.MagicMock(table=table), conn
+
+    def test_insert_copy(self, mocker):
+        from sqlalchemy.dialects import postgresql
+
+        table, conn = self._mock_sql_table(mocker, postgresql.dialect())
+        cursor = conn.connection.cursor.return_value.__enter__.return_value
+        copied = {}
+        cursor.copy_expert.side_effect = lambda sql, buffer: copied.update(
+            sql=sql, data=buffer.read()
+        )
+
+        rows = [(1, "a"), (2, None), (3, ""), (None, 'say "\\N"')]
+        _insert_copy(table, conn, ["col1", "Col 2"], iter(rows))
+
+        assert copied["sql"] == (
+            'COPY dwschema.table_a (col1, "Col 2") FROM STDIN '
+            "WITH (FORMAT CSV, NULL '\\N')"
+        )
+        assert copied["data"] == ('"1","a"\n"2",\\N\n"3",""\n\\N,"say ""\\N"""\n')
+
+    def test_insert_fast_executemany(self, mocker):
+        from sqlalchemy.dialects import mssql
+
+        table, conn = self._mock_sql_table(mocker, mssql.dialect())
+        cursor = conn.connection.cursor.return_value
+
+        _insert_fast_executemany(
+            table, conn, ["col1", "Col 2"], iter([(1, "a"), (2, None)])
+        )
+
+        assert cursor.fast_executemany is True
+        cursor.executemany.assert_called_once_with(
+            "INSERT INTO dwschema.table_a (col1, [Col 2]) VALUES (?, ?)",
+            [(1, "a"), (2, None)],
+        )
+        cursor.close.assert_called_once()
+
 
 class TestSQLTableDatasetSingleConnection:
     def test_single_connection(self, dummy_dataframe, mocker):
@@ -268,6 +406,96 @@ class TestSQLTableDatasetSingleConnection:
         expected_calls = [mocker.call(CONNECTION), mocker.call(second_con)]
         assert mock_engine.call_args_list == expected_calls
 
+    def test_create_connection_thread_safe(self, mocker):
+        """Test that datasets racing to connect to the same db from several
+        threads only create one engine."""
+
+        def _slow_create_engine(*args, **kwargs):
+            time.sleep(0.05)
+            return mocker.Mock()
+
+        mock_engine = mocker.patch(
+            "kedro_datasets.pandas.sql_dataset.create_engine",
+            side_effect=_slow_create_engine,
+        )
+        datasets = [
+            SQLTableDataset(table_name=TABLE_NAME, credentials={"con": CONNECTION})
+            for _ in range(10)
+        ]
+        engines = []
+        threads = [
+            threading.Thread(target=lambda ds=ds: engines.append(ds.engine))
+            for ds in datasets
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        mock_engine.assert_called_once_with(CONNECTION)
+        assert all(engine is engines[0] for engine in engines)
+
+    def test_engine_shared_with_query_dataset(self, mocker):
+        """Test that table and query datasets on the same db share the engine."""
+        mock_engine = mocker.patch("kedro_datasets.pandas.sql_dataset.create_engine")
+        table = SQLTableDataset(table_name=TABLE_NAME, credentials={"con": CONNECTION})
+        query = SQLQueryDataset(sql=SQL_QUERY, credentials={"con": CONNECTION})
+
+        assert table.engine is query.engine
+        mock_engine.assert_called_once_with(CONNECTION)
+
+    def test_engine_args(self, mocker):
+        """Test that ``engine_args`` are passed to ``create_engine``."""
+        mock_engine = mocker.patch("kedro_datasets.pandas.sql_dataset.create_engine")
+        engine_args = {
+            "pool_size": 5,
+            "max_overflow": 10,
+            "pool_pre_ping": True,
+            "pool_recycle": 3600,
+        }
+        dataset = SQLTableDataset(
+            table_name=TABLE_NAME,
+            credentials={"con": CONNECTION},
+            engine_args=engine_args,
+        )
+        assert dataset.engine is mock_engine.return_value
+        mock_engine.assert_called_once_with(CONNECTION, **engine_args)
+
+    def test_release_keeps_shared_engine(self, mocker):
+        """Test that releasing the dataset does not dispose of the engine
+        shared with other datasets."""
+        mocker.patch("kedro_datasets.pandas.sql_dataset.create_engine")
+        dataset = SQLTableDataset(
+            table_name=TABLE_NAME, credentials={"con": CONNECTION}
+        )
+        engine = dataset.engine
+        dataset.release()
+        engine.dispose.assert_not_called()
+        assert dataset.engines[CONNECTION] is engine
+
+    def test_different_engine_args(self, mocker, caplog):
+        """Test that differing engine_args of datasets sharing an engine are
+        ignored with a warning."""
+        mock_engine = mocker.patch("kedro_datasets.pandas.sql_dataset.create_engine")
+        first, second, third = (
+            SQLTableDataset(
+                table_name=TABLE_NAME,
+                credentials={"con": CONNECTION},
+                engine_args=engine_args,
+            )
+            for engine_args in ({"pool_size": 5}, {"pool_size": 5}, {"pool_size": 1})
+        )
+        assert first.engine is second.engine
+        assert "Ignoring 'engine_args'" not in caplog.text
+
+        assert third.engine is first.engine
+        mock_engine.assert_called_once_with(CONNECTION, pool_size=5)
+        assert (
+            "Ignoring 'engine_args' {'pool_size': 1}, as the engine shared by the "
+            "datasets using the same connection string was created with "
+            "{'pool_size': 5}." in caplog.text
+        )
+
 
 class TestSQLQueryDataset:
     def test_empty_query_error(self):
@@ -334,6 +562,184 @@ class TestSQLQueryDataset:
         if has_execution_options:
             assert con_arg.get_execution_options() == EXECUTION_OPTIONS
 
+    def test_load_chunks(self, sqlite_connection):
+        dataset = SQLQueryDataset(
+            sql=f"SELECT col2 FROM {TABLE_NAME} WHERE col1 > 0",
+            credentials={"con": sqlite_connection},
+            load_args={"chunksize": 3},
+        )
+        chunks = list(dataset.load())
+
+        assert [len(chunk) for chunk in chunks] == [3, 1]
+        assert pd.concat(chunks)["col2"].tolist() == list("bcde")
+        assert dataset.stream_metrics["rows"] == 4
+
+    def test_load_chunks_stream_results(self, mocker, query_dataset):
+        """Test that chunked loads use a connection with a server-side cursor"""
+        query_dataset._load_args["chunksize"] = 10
+        mock_engine = mocker.patch.object(SQLQueryDataset, "engines", {})
+        engine = mock_engine[CONNECTION] = mocker.MagicMock()
+        mocker.patch("pandas.read_sql_query", return_value=iter([]))
+
+        assert list(query_dataset.load()) == []
+        connection = engine.connect.return_value.__enter__.return_value
+        connection.execution_options.assert_called_once_with(stream_results=True)
+        pd.read_sql_query.assert_called_once_with(
+            con=connection.execution_options.return_value,
+            sql=SQL_QUERY,
+            chunksize=10,
+        )
+
+    def test_load_cached(self, mocker, sqlite_connection, tmp_path):
+        """Test that repeated loads of the same query are read from the cache"""
+        read_sql_query = mocker.spy(pd, "read_sql_query")
+        kwargs = {
+            "sql": f"SELECT * FROM {TABLE_NAME}",
+            "credentials": {"con": sqlite_connection},
+            "cache": {"path": str(tmp_path / "cache")},
+        }
+        first = SQLQueryDataset(**kwargs).load()
+        second = SQLQueryDataset(**kwargs).load()
+
+        assert read_sql_query.call_count == 1
+        assert_frame_equal(first, second)
+        assert len(list((tmp_path / "cache").glob("*.parquet"))) == 1
+
+    def test_cache_key(self, mocker, sqlite_connection, tmp_path):
+        """Test that queries with different parameters are cached separately"""
+        read_sql_query = mocker.spy(pd, "read_sql_query")
+        cache = {"path": str(tmp_path / "cache")}
+        for col1 in [1, 2, 1]:
+            dataset = SQLQueryDataset(
+                sql=f"SELECT * FROM {TABLE_NAME} WHERE col1 > ?",
+                credentials={"con": sqlite_connection},
+                load_args={"params": [col1]},
+                cache=cache,
+            )
+            assert len(dataset.load()) == 4 - col1
+
+        assert read_sql_query.call_count == 2
+
+    def test_cache_ttl(self, mocker, sqlite_connection, tmp_path):
+        """Test that expired results are queried again"""
+        read_sql_query = mocker.spy(pd, "read_sql_query")
+        dataset = SQLQueryDataset(
+            sql=f"SELECT * FROM {TABLE_NAME}",
+            credentials={"con": sqlite_connection},
+            cache={"path": str(tmp_path / "cache"), "ttl": 60},
+        )
+        dataset.load()
+        mocker.patch("time.time", return_value=time.time() + 61)
+        dataset.load()
+
+        assert read_sql_query.call_count == 2
+
+    def test_cache_lru_eviction(self, sqlite_connection, tmp_path):
+        """Test that the least recently used results are evicted beyond max_size"""
+        cache_path = tmp_path / "cache"
+        datasets = [
+            SQLQueryDataset(
+                sql=f"SELECT * FROM {TABLE_NAME} WHERE col1 >= {col1}",
+                credentials={"con": sqlite_connection},
+                cache={"path": str(cache_path), "max_size": 10_000},
+            )
+            for col1 in range(3)
+        ]
+        datasets[0].load()
+        entry_size = next(cache_path.glob("*.parquet")).stat().st_size
+        for dataset in datasets:
+            dataset._cache._max_size = 2 * entry_size + entry_size // 2
+
+        datasets[1].load()
+        # make the first result the most recently used one
+        time.sleep(0.01)
+        datasets[0].load()
+        time.sleep(0.01)
+        datasets[2].load()
+
+        cached = {entry.stem for entry in cache_path.glob("*.parquet")}
+        expected = {
+            ds._cache_key(ds._get_load_args()) for ds in (datasets[0], datasets[2])
+        }
+        assert cached == expected
+
+    def test_cache_eviction_skips_removed_entries(
+        self, mocker, sqlite_connection, tmp_path
+    ):
+        """Test that entries removed by another process while evicting are skipped"""
+        cache_path = tmp_path / "cache"
+        removed = cache_path / "removed.parquet"
+        glob = Path.glob
+        mocker.patch.object(
+            Path,
+            "glob",
+            lambda self, pattern: [*glob(self, pattern), removed],
+        )
+        dataset = SQLQueryDataset(
+            sql=f"SELECT * FROM {TABLE_NAME}",
+            credentials={"con": sqlite_connection},
+            cache={"path": str(cache_path), "max_size": 10_000},
+        )
+        dataset.load()
+
+        key = dataset._cache_key(dataset._get_load_args())
+        assert dataset._cache.get(key) is not None
+
+    def test_invalidate_cache(self, mocker, sqlite_connection, tmp_path):
+        """Test that invalidating the cache runs the query again"""
+        read_sql_query = mocker.spy(pd, "read_sql_query")
+        dataset = SQLQueryDataset(
+            sql=f"SELECT * FROM {TABLE_NAME}",
+            credentials={"con": sqlite_connection},
+            cache={"path": str(tmp_path / "cache")},
+        )
+        dataset.load()
+        dataset.invalidate_cache()
+        dataset.load()
+
+        assert read_sql_query.call_count == 2
+
+    def test_cache_write_failure(self, sqlite_connection, tmp_path, caplog):
+        """Test that results which can't be cached are still loaded"""
+        dataset = SQLQueryDataset(
+            sql=f"SELECT col1, col1 FROM {TABLE_NAME}",
+            credentials={"con": sqlite_connection},
+            cache={"path": str(tmp_path / "cache")},
+        )
+        assert list(dataset.load().columns) == ["col1", "col1"]
+        assert "Failed to cache the query result" in caplog.text
+        assert not list((tmp_path / "cache").iterdir())
+
+    def test_cache_default_path(self, sqlite_connection, tmp_path, monkeypatch):
+        """Test that results are cached in the user's cache directory by default"""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        dataset = SQLQueryDataset(
+            sql=f"SELECT * FROM {TABLE_NAME}",
+            credentials={"con": sqlite_connection},
+            cache={},
+        )
+        dataset.load()
+        assert len(list((tmp_path / "kedro-datasets" / "sql").glob("*.parquet"))) == 1
+
+    def test_cache_in_str(self, sqlite_connection, tmp_path):
+        dataset = SQLQueryDataset(
+            sql=f"SELECT * FROM {TABLE_NAME}",
+            credentials={"con": sqlite_connection},
+            cache={"ttl": 60},
+        )
+        assert "cache={'ttl': 60}" in str(dataset)
+
+    def test_load_chunks_not_cached(self, sqlite_connection, tmp_path):
+        """Test that chunked loads bypass the cache"""
+        dataset = SQLQueryDataset(
+            sql=f"SELECT * FROM {TABLE_NAME}",
+            credentials={"con": sqlite_connection},
+            load_args={"chunksize": 2},
+            cache={"path": str(tmp_path / "cache")},
+        )
+        assert len(list(dataset.load())) == 3
+        assert not (tmp_path / "cache").exists()
+
     def test_load_driver_missing(self, mocker):
         """Test that if an unknown module/driver is encountered by SQLAlchemy
         then the error should contain the original error message"""
@@ -87,6 +87,143 @@ class TestIncrementalDatasetLocal:
         reloaded_after_release = pds.load()
         assert not reloaded_after_release
 
+    def test_load_all(self, local_csvs, partitioned_data_pandas):
+        """Test that partitions past the checkpoint can be loaded concurrently"""
+        pds = IncrementalDataset(
+            path=str(local_csvs), dataset=DATASET, checkpoint="p01/data.csv"
+        )
+        loaded = pds.load_all(max_workers=2)
+
+        assert list(loaded) == ["p02/data.csv", "p03/data.csv", "p04/data.csv"]
+        for partition_id, data in loaded.items():
+            assert_frame_equal(data, partitioned_data_pandas[partition_id])
+
+    def test_manifest(self, local_csvs, partitioned_data_pandas, mocker):
+        """Test that partitions are listed from the manifest once it exists"""
+        pds = IncrementalDataset(path=str(local_csvs), dataset=DATASET, manifest=True)
+        pds.save({"p05/data.csv": pd.DataFrame({"foo": [42]})})
+        assert pds.load().keys() == {*partitioned_data_pandas, "p05/data.csv"}
+        pds.confirm()
+
+        pds = IncrementalDataset(path=str(local_csvs), dataset=DATASET, manifest=True)
+        mocked_find = mocker.patch.object(pds._filesystem, "find")
+        assert pds.load() == {}
+        mocked_find.assert_not_called()
+
+    def test_filters(self, tmp_path):
+        local_dir = tmp_path / "hive"
+        for day in range(1, 5):
+            path = local_dir / f"day={day:02d}"
+            path.mkdir(parents=True)
+            pd.DataFrame({"day": [day]}).to_csv(path / "data.csv", index=False)
+
+        pds = IncrementalDataset(
+            path=str(local_dir),
+            dataset=DATASET,
+            checkpoint="day=01/data.csv",
+            filters=[("day", "<=", 3)],
+        )
+        assert list(pds.load()) == ["day=02/data.csv", "day=03/data.csv"]
+
+    def test_load_concurrently(self, local_csvs, partitioned_data_pandas):
+        pds = IncrementalDataset(path=str(local_csvs), dataset=DATASET, max_workers=3)
+        loaded = pds.load()
+
+        assert list(loaded) == sorted(partitioned_data_pandas)
+        for partition_id, data in loaded.items():
+            assert_frame_equal(data, partitioned_data_pandas[partition_id])
+
+    @pytest.mark.parametrize("max_workers", [None, 2])
+    def test_load_in_batches(self, local_csvs, partitioned_data_pandas, max_workers):
+        """Test that the checkpoint advances once a batch has been consumed"""
+        pds = IncrementalDataset(
+            path=str(local_csvs), dataset=DATASET, max_workers=max_workers, batch_size=2
+        )
+        batches = pds.load()
+        assert pds._read_checkpoint() is None
+
+        first_batch = next(batches)
+        assert list(first_batch) == ["p00/data.csv", "p01/data.csv"]
+        assert pds._read_checkpoint() is None
+
+        second_batch = next(batches)
+        assert list(second_batch) == ["p02/data.csv", "p03/data.csv"]
+        assert pds._read_checkpoint() == "p01/data.csv"
+
+        assert list(next(batches)) == ["p04/data.csv"]
+        with pytest.raises(StopIteration):
+            next(batches)
+        assert pds._read_checkpoint() == "p04/data.csv"
+
+        for batch in (first_batch, second_batch):
+            for partition_id, data in batch.items():
+                assert_frame_equal(data, partitioned_data_pandas[partition_id])
+
+    def test_load_in_batches_interrupted(self, local_csvs):
+        """Test that an interrupted run resumes from the last consumed batch"""
+        pds = IncrementalDataset(path=str(local_csvs), dataset=DATASET, batch_size=2)
+        batches = pds.load()
+        next(batches)
+        next(batches)
+        del batches
+
+        pds = IncrementalDataset(path=str(local_csvs), dataset=DATASET, batch_size=2)
+        remaining = [partition_id for batch in pds.load() for partition_id in batch]
+        assert remaining == ["p02/data.csv", "p03/data.csv", "p04/data.csv"]
+
+    def test_listing_skips_processed_directories(self, local_csvs, mocker):
+        pds = IncrementalDataset(
+            path=str(local_csvs), dataset=DATASET, checkpoint="p02/data.csv"
+        )
+        spy_ls = mocker.spy(pds._filesystem, "ls")
+        spy_find = mocker.spy(pds._filesystem, "find")
+        loaded = pds.load()
+
+        assert list(loaded) == ["p03/data.csv", "p04/data.csv"]
+        listed = [
+            call.args[0] for call in spy_ls.call_args_list + spy_find.call_args_list
+        ]
+        assert not any(path.endswith(("p00", "p01")) for path in listed)
+        assert any(path.endswith("p03") for path in listed)
+
+    @pytest.mark.parametrize(
+        "checkpoint",
+        ["", "2023", "2023/12", "2024/01/15.csv", "2024/01/3", "2024/02/01.csv", "3"],
+    )
+    @pytest.mark.parametrize("maxdepth", [None, 1, 2, 3])
+    def test_listing_after_checkpoint_matches_full_scan(
+        self, tmp_path, checkpoint, maxdepth
+    ):
+        local_dir = tmp_path / "dates"
+        for partition in [
+            "2023/12/31.csv",
+            "2024/01/01.csv",
+            "2024/01/15.csv",
+            "2024/01/31.csv",
+            "2024/02/01.csv",
+            "2024-03.csv",
+        ]:
+            (local_dir / partition).parent.mkdir(parents=True, exist_ok=True)
+            (local_dir / partition).write_text("value\n1\n")
+
+        load_args = {"maxdepth": maxdepth} if maxdepth else None
+        bounded = IncrementalDataset(
+            path=str(local_dir),
+            dataset=DATASET,
+            checkpoint=checkpoint,
+            load_args=load_args,
+        )
+        full_scan = IncrementalDataset(
+            path=str(local_dir),
+            dataset=DATASET,
+            load_args=load_args,
+            checkpoint={
+                "force_checkpoint": checkpoint,
+                "comparison_func": "tests.partitions.test_incremental_dataset.dummy_gt_func",
+            },
+        )
+        assert bounded._list_partitions() == full_scan._list_partitions()
+
     def test_save(self, local_csvs):
         """Test saving a new partition into an IncrementalDataset"""
         df = pd.DataFrame({"dummy": [1, 2, 3]})
@@ -1,6 +1,10 @@
+import json
 import logging
 import os
 import re
+import threading
+import time
+import tracemalloc
 from pathlib import Path
 
 import boto3
@@ -13,7 +17,7 @@ from moto import mock_s3
 from pandas.util.testing import assert_frame_equal
 
 from kedro_datasets.pandas import CSVDataset, ParquetDataset
-from kedro_datasets.partitions import PartitionedDataset
+from kedro_datasets.partitions import PartitionedDataset, partitioned_dataset
 from kedro_datasets.partitions.partitioned_dataset import KEY_PROPAGATION_WARNING
 
 
@@ -38,6 +42,22 @@ def local_csvs(tmp_path, partitioned_data_pandas):
     return local_dir
 
 
+@pytest.fixture
+def hive_csvs(tmp_path):
+    local_dir = tmp_path / "hive"
+    for year, month, region in [
+        (2023, 12, "eu"),
+        (2024, 1, "eu"),
+        (2024, 2, "eu"),
+        (2024, 2, "us"),
+        (2024, 3, "us"),
+    ]:
+        path = local_dir / f"year={year}" / f"month={month:02d}" / f"region={region}"
+        path.mkdir(parents=True)
+        pd.DataFrame({"value": [month]}).to_csv(path / "data.csv", index=False)
+    return local_dir
+
+
 @pytest.fixture
 def filepath_csvs(tmp_path):
     return str(tmp_path / "csvs")
@@ -111,6 +131,494 @@ class TestPartitionedDatasetLocal:
         reloaded_data = loaded_partitions[part_id]()
         assert_frame_equal(reloaded_data, original_data())
 
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_load_all(self, local_csvs, partitioned_data_pandas, executor):
+        pds = PartitionedDataset(path=str(local_csvs), dataset="pandas.CSVDataset")
+        loaded = pds.load_all(max_workers=2, executor=executor)
+
+        assert list(loaded) == sorted(partitioned_data_pandas)
+        for partition_id, df in loaded.items():
+            assert_frame_equal(df, partitioned_data_pandas[partition_id])
+
+    def test_iter_loaded_bounded(self, local_csvs, mocker):
+        """Test that no more than ``max_workers`` partitions load at once"""
+        lock = threading.Lock()
+        running, peak = 0, 0
+
+        def _load_func(value):
+            def _load():
+                nonlocal running, peak
+                with lock:
+                    running += 1
+                    peak = max(peak, running)
+                time.sleep(0.01)
+                with lock:
+                    running -= 1
+                return value
+
+            return _load
+
+        pds = PartitionedDataset(path=str(local_csvs), dataset="pandas.CSVDataset")
+        loaders = {f"part{i}": _load_func(i) for i in range(20)}
+        mocker.patch.object(pds, "_partition_loaders", return_value=loaders)
+
+        loaded = dict(pds.iter_loaded(max_workers=3))
+        assert loaded == {f"part{i}": i for i in range(20)}
+        assert 1 <= peak <= 3
+
+    def test_iter_loaded_invalid_executor(self, local_csvs):
+        pds = PartitionedDataset(path=str(local_csvs), dataset="pandas.CSVDataset")
+        pattern = r"Unknown executor 'fiber'"
+        with pytest.raises(DatasetError, match=pattern):
+            pds.load_all(executor="fiber")
+
+    def test_iter_loaded_error(self, local_csvs):
+        (local_csvs / "p2.csv").write_text("")
+        pds = PartitionedDataset(path=str(local_csvs), dataset="pandas.CSVDataset")
+        pattern = r"No columns to parse from file"
+        with pytest.raises(DatasetError, match=pattern):
+            pds.load_all(max_workers=2)
+
+    def test_iter_loaded_stop(self, local_csvs, mocker):
+        """Test that partitions past the window are not loaded once iteration
+        stops"""
+        pds = PartitionedDataset(path=str(local_csvs), dataset="pandas.CSVDataset")
+        loaders = {f"part{i}": mocker.Mock(return_value=i) for i in range(4)}
+        mocker.patch.object(pds, "_partition_loaders", return_value=loaders)
+
+        iterator = pds.iter_loaded(max_workers=1)
+        partition_id, value = next(iterator)
+        iterator.close()
+
+        assert partition_id in {"part0", "part1"}
+        assert value == int(partition_id[-1])
+        # only the window of two partitions was submitted
+        assert sum(loader.call_count for loader in loaders.values()) <= 2
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_save_concurrently(self, local_csvs, executor):
+        pds = PartitionedDataset(
+            path=str(local_csvs),
+            dataset="pandas.CSVDataset",
+            save_args={"max_workers": 2, "executor": executor},
+        )
+        original_data = {
+            f"new/data{i}": pd.DataFrame({"foo": [i], "bar": ["a"]}) for i in range(5)
+        }
+        pds.save(original_data)
+
+        loaded_partitions = pds.load()
+        for part_id, data in original_data.items():
+            assert_frame_equal(loaded_partitions[part_id](), data)
+
+    def test_lazy_save_concurrently_bounded(self, local_csvs):
+        """Test that lazy partitions are materialised in a bounded window"""
+        lock = threading.Lock()
+        materialised, peak = 0, 0
+
+        def _original_data(value):
+            def _materialise():
+                nonlocal materialised, peak
+                with lock:
+                    materialised += 1
+                    peak = max(peak, materialised)
+                time.sleep(0.01)
+                with lock:
+                    materialised -= 1
+                return pd.DataFrame({"foo": [value]})
+
+            return _materialise
+
+        pds = PartitionedDataset(
+            path=str(local_csvs),
+            dataset="pandas.CSVDataset",
+            save_args={"max_workers": 2},
+        )
+        pds.save({f"new/data{i:02d}": _original_data(i) for i in range(20)})
+
+        assert 1 <= peak <= 2
+        assert len([p for p in pds.load() if p.startswith("new/")]) == 20
+
+    def test_save_concurrently_collects_errors(self, local_csvs):
+        pds = PartitionedDataset(
+            path=str(local_csvs),
+            dataset="pandas.CSVDataset",
+            save_args={"max_workers": 2},
+        )
+        original_data = pd.DataFrame({"foo": 42, "bar": ["a", "b", None]})
+        pattern = r"(?s)Failed to save 2 of 3 partition\(s\).+new/bad1: .+new/bad2: "
+        with pytest.raises(DatasetError, match=pattern):
+            pds.save(
+                {"new/bad1": "invalid", "new/good": original_data, "new/bad2": None}
+            )
+
+        loaded_partitions = pds.load()
+        assert "new/good" in loaded_partitions
+        assert "new/bad1" not in loaded_partitions
+
+    def test_manifest_not_written_on_load(self, local_csvs, partitioned_data_pandas):
+        pds = PartitionedDataset(
+            path=str(local_csvs), dataset="pandas.CSVDataset", manifest=True
+        )
+        assert pds.exists()
+        assert pds.load().keys() == partitioned_data_pandas.keys()
+        assert not (local_csvs / "_partitions.json").exists()
+
+    def test_manifest_written_on_save(self, local_csvs):
+        pds = PartitionedDataset(
+            path=str(local_csvs), dataset="pandas.CSVDataset", manifest=True
+        )
+        pds.save({"new/data": pd.DataFrame({"foo": [42]})})
+
+        manifest = json.loads((local_csvs / "_partitions.json").read_text())
+        entries = {entry["partition_id"]: entry for entry in manifest["partitions"]}
+        assert entries.keys() == pds.load().keys()
+        assert "new/data" in entries
+        assert entries["p2.csv"]["size"] == (local_csvs / "p2.csv").stat().st_size
+        assert entries["p2.csv"]["mtime"] is not None
+
+    def test_manifest_replaces_listing(
+        self, local_csvs, partitioned_data_pandas, mocker
+    ):
+        PartitionedDataset(
+            path=str(local_csvs), dataset="pandas.CSVDataset", manifest=True
+        ).save({})
+
+        pds = PartitionedDataset(
+            path=str(local_csvs), dataset="pandas.CSVDataset", manifest=True
+        )
+        mocked_find = mocker.patch.object(pds._filesystem, "find")
+        loaded_partitions = pds.load()
+
+        mocked_find.assert_not_called()
+        assert loaded_partitions.keys() == partitioned_data_pandas.keys()
+
+    def test_manifest_not_listed_as_partition(
+        self, local_csvs, partitioned_data_pandas
+    ):
+        """Test that the default manifest inside ``path`` is not a partition,
+        even for datasets without a manifest."""
+        PartitionedDataset(
+            path=str(local_csvs), dataset="pandas.CSVDataset", manifest=True
+        ).save({})
+        assert (local_csvs / "_partitions.json").exists()
+
+        pds = PartitionedDataset(path=str(local_csvs), dataset="pandas.CSVDataset")
+        assert pds.load().keys() == partitioned_data_pandas.keys()
+
+    def test_manifest_not_updated_on_failed_save(self, local_csvs, mocker):
+        pds = PartitionedDataset(
+            path=str(local_csvs), dataset="pandas.CSVDataset", manifest=True
+        )
+        pds.save({})
+        manifest = (local_csvs / "_partitions.json").read_text()
+        update_manifest = mocker.spy(pds, "_update_manifest")
+
+        failing_data = mocker.Mock(side_effect=OSError("disk full"))
+        with pytest.raises(DatasetError, match=r"disk full"):
+            pds.save({"new/data": failing_data})
+
+        update_manifest.assert_not_called()
+        assert (local_csvs / "_partitions.json").read_text() == manifest
+
+    def test_manifest_refreshed_on_save(self, local_csvs):
+        pds = PartitionedDataset(
+            path=str(local_csvs), dataset="pandas.CSVDataset", manifest=True
+        )
+        pds.load()
+        original_data = pd.DataFrame({"foo": 42, "bar": ["a", "b", None]})
+        pds.save({"new/data": original_data})
+
+        reloaded = PartitionedDataset(
+            path=str(local_csvs), dataset="pandas.CSVDataset", manifest=True
+        ).load()
+        assert "new/data" in reloaded
+        assert_frame_equal(reloaded["new/data"](), original_data)
+
+    def test_manifest_overwrite(self, local_csvs):
+        pds = PartitionedDataset(
+            path=str(local_csvs),
+            dataset="pandas.CSVDataset",
+            overwrite=True,
+            manifest={"filepath": str(local_csvs.parent / "manifest.json")},
+        )
+        pds.load()
+        pds.save({"new/data": pd.DataFrame({"foo": [42]})})
+
+        manifest = json.loads((local_csvs.parent / "manifest.json").read_text())
+        assert [entry["partition_id"] for entry in manifest["partitions"]] == [
+            "new/data"
+        ]
+
+    @pytest.mark.parametrize("reconcile,expected", [(False, False), (True, True)])
+    def test_manifest_reconcile(self, local_csvs, reconcile, expected):
+        manifest_config = {"reconcile": reconcile}
+        PartitionedDataset(
+            path=str(local_csvs), dataset="pandas.CSVDataset", manifest=manifest_config
+        ).save({})
+
+        # partition written by an external process
+        (local_csvs / "p9").mkdir()
+        pd.DataFrame({"foo": [42]}).to_csv(local_csvs / "p9" / "data.csv", index=False)
+
+        pds = PartitionedDataset(
+            path=str(local_csvs), dataset="pandas.CSVDataset", manifest=manifest_config
+        )
+        assert ("p9/data.csv" in pds.load()) is expected
+
+    def test_manifest_reconcile_deleted_prefix(self, local_csvs):
+        manifest_config = {"reconcile": True}
+        PartitionedDataset(
+            path=str(local_csvs), dataset="pandas.CSVDataset", manifest=manifest_config
+        ).save({})
+
+        # partitions removed by an external process
+        for path in (local_csvs / "p1").iterdir():
+            path.unlink()
+        (local_csvs / "p1").rmdir()
+
+        pds = PartitionedDataset(
+            path=str(local_csvs), dataset="pandas.CSVDataset", manifest=manifest_config
+        )
+        assert sorted(pds.load()) == ["_p4", "p2.csv", "p3"]
+
+    def test_manifest_no_partitions(self, tmp_path):
+        pds = PartitionedDataset(
+            path=str(tmp_path / "empty"), dataset="pandas.CSVDataset", manifest=True
+        )
+        assert not pds.exists()
+        assert not (tmp_path / "empty").exists()
+
+    @pytest.mark.parametrize("key", ["versioned", "version"])
+    def test_manifest_versioned(self, local_csvs, key):
+        pattern = rf"Please remove '{key}' key from the manifest definition"
+        with pytest.raises(DatasetError, match=pattern):
+            PartitionedDataset(
+                path=str(local_csvs),
+                dataset="pandas.CSVDataset",
+                manifest={key: True},
+            )
+
+    @pytest.mark.parametrize(
+        "filters,expected",
+        [
+            (
+                [("year", "=", 2024), ("month", ">=", 2)],
+                [
+                    "year=2024/month=02/region=eu/data.csv",
+                    "year=2024/month=02/region=us/data.csv",
+                    "year=2024/month=03/region=us/data.csv",
+                ],
+            ),
+            (
+                [[("year", "<", 2024)], [("month", "=", 1), ("region", "!=", "us")]],
+                [
+                    "year=2023/month=12/region=eu/data.csv",
+                    "year=2024/month=01/region=eu/data.csv",
+                ],
+            ),
+            (
+                [["region", "in", ["us"]], ["month", "not in", [2]]],
+                ["year=2024/month=03/region=us/data.csv"],
+            ),
+            ([("country", "=", "uk")], []),
+        ],
+    )
+    def test_filters(self, hive_csvs, filters, expected):
+        pds = PartitionedDataset(
+            path=str(hive_csvs), dataset="pandas.CSVDataset", filters=filters
+        )
+        assert sorted(pds._path_to_partition(p) for p in pds._list_partitions()) == (
+            expected
+        )
+
+    def test_filters_prune_listing(self, hive_csvs, mocker):
+        pds = PartitionedDataset(
+            path=str(hive_csvs),
+            dataset="pandas.CSVDataset",
+            filters=[("year", "=", 2024), ("month", "=", 3)],
+        )
+        spy_ls = mocker.spy(pds._filesystem, "ls")
+        assert list(pds.load()) == ["year=2024/month=03/region=us/data.csv"]
+
+        listed = [call.args[0] for call in spy_ls.call_args_list]
+        assert not any("year=2023" in path or "month=01" in path for path in listed)
+
+    def test_filters_non_hive_directories(self, hive_csvs):
+        (hive_csvs / "year=2024" / "extra").mkdir()
+        (hive_csvs / "year=2024" / "extra" / "data.csv").write_text("value\n1\n")
+        pds = PartitionedDataset(
+            path=str(hive_csvs),
+            dataset="pandas.CSVDataset",
+            filters=[("year", "=", 2024), ("month", "=", 3)],
+        )
+        assert list(pds.load()) == ["year=2024/month=03/region=us/data.csv"]
+
+    @pytest.mark.parametrize(
+        "maxdepth,expected",
+        [
+            (2, []),
+            (3, ["year=2024/extra/data.csv"]),
+            (
+                4,
+                [
+                    "year=2024/extra/data.csv",
+                    "year=2024/extra/nested/data.csv",
+                    "year=2024/month=01/region=eu/data.csv",
+                    "year=2024/month=02/region=eu/data.csv",
+                    "year=2024/month=02/region=us/data.csv",
+                    "year=2024/month=03/region=us/data.csv",
+                ],
+            ),
+        ],
+    )
+    def test_filters_maxdepth(self, hive_csvs, maxdepth, expected):
+        """Test that ``maxdepth`` limits the walk from the dataset path"""
+        (hive_csvs / "year=2024" / "extra").mkdir()
+        (hive_csvs / "year=2024" / "extra" / "data.csv").write_text("value\n1\n")
+        (hive_csvs / "year=2024" / "extra" / "nested").mkdir()
+        (hive_csvs / "year=2024" / "extra" / "nested" / "data.csv").write_text(
+            "value\n1\n"
+        )
+        pds = PartitionedDataset(
+            path=str(hive_csvs),
+            dataset="pandas.CSVDataset",
+            filters=[("year", "=", 2024)],
+            load_args={"maxdepth": maxdepth},
+        )
+        assert sorted(pds._path_to_partition(p) for p in pds._list_partitions()) == (
+            expected
+        )
+
+    def test_filters_with_manifest(self, hive_csvs):
+        pds = PartitionedDataset(
+            path=str(hive_csvs),
+            dataset="pandas.CSVDataset",
+            filters=[("region", "=", "us")],
+            manifest=True,
+        )
+        assert sorted(pds.load()) == [
+            "year=2024/month=02/region=us/data.csv",
+            "year=2024/month=03/region=us/data.csv",
+        ]
+
+    def test_add_partition_columns(self, hive_csvs):
+        pds = PartitionedDataset(
+            path=str(hive_csvs),
+            dataset="pandas.CSVDataset",
+            filters=[("year", "=", 2023)],
+            add_partition_columns=True,
+        )
+        loaded = pds.load_all()
+        assert_frame_equal(
+            loaded["year=2023/month=12/region=eu/data.csv"],
+            pd.DataFrame(
+                {"value": [12], "year": [2023], "month": [12], "region": "eu"}
+            ),
+        )
+
+    def test_add_partition_columns_unsupported(self, hive_csvs):
+        pds = PartitionedDataset(
+            path=str(hive_csvs),
+            dataset="text.TextDataset",
+            filters=[("year", "=", 2023)],
+            add_partition_columns=True,
+        )
+        pattern = r"Cannot add partition columns to data of type 'str'"
+        with pytest.raises(DatasetError, match=pattern):
+            pds.load_all()
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            [("year", "~", 2024)],
+            [("year", 2024)],
+            [[("year", "=")]],
+            [("year", "in", 2024)],
+            [("region", "not in", "us")],
+            [[]],
+            [[("year", "=", 2024)], []],
+        ],
+    )
+    def test_malformed_filters(self, hive_csvs, filters):
+        with pytest.raises(DatasetError, match=r"Malformed filter"):
+            PartitionedDataset(
+                path=str(hive_csvs), dataset="pandas.CSVDataset", filters=filters
+            )
+
+    def test_load_many_partitions(self, tmp_path, mocker):
+        """Test that listing 100k partitions does not instantiate or deep-copy
+        any dataset until a partition is loaded"""
+        num_partitions = 100_000
+        path = str(tmp_path / "many")
+        pds = PartitionedDataset(
+            path=path,
+            dataset={"type": "pandas.CSVDataset", "load_args": {"sep": ";"}},
+        )
+        partitions = [f"{path}/p{i:06d}.csv" for i in range(num_partitions)]
+        mocker.patch.object(pds._filesystem, "find", return_value=partitions)
+        mocked_ds = mocker.patch.object(pds, "_dataset_type")
+        mocked_ds.__name__ = "mocked"
+        deepcopy_spy = mocker.spy(partitioned_dataset, "deepcopy")
+
+        loaded_partitions = pds.load()
+
+        assert len(loaded_partitions) == num_partitions
+        mocked_ds.assert_not_called()
+        deepcopy_spy.assert_not_called()
+
+        loaded_partitions["p000042.csv"]()
+        mocked_ds.assert_called_once_with(
+            load_args={"sep": ";"}, filepath=f"{path}/p000042.csv"
+        )
+        deepcopy_spy.assert_called_once()
+
+    @pytest.mark.slow
+    def test_load_many_partitions_budget(self, tmp_path, mocker):
+        """Test that listing 100k partitions stays within a time and memory
+        budget, far below that of instantiating a dataset per partition"""
+        num_partitions = 100_000
+        path = str(tmp_path / "many")
+        pds = PartitionedDataset(
+            path=path,
+            dataset={"type": "pandas.CSVDataset", "load_args": {"sep": ";"}},
+        )
+        partitions = [f"{path}/p{i:06d}.csv" for i in range(num_partitions)]
+        mocker.patch.object(pds._filesystem, "find", return_value=partitions)
+
+        start = time.perf_counter()
+        pds.load()
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        try:
+            loaded_partitions = pds.load()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(loaded_partitions) == num_partitions
+        # about 0.2s and 170 bytes per partition, while each ``CSVDataset``
+        # instance takes about 1.8KB
+        assert elapsed < 5
+        assert peak < 512 * num_partitions
+
+    def test_partition_config_copied(self, local_csvs, partitioned_data_pandas, mocker):
+        """Test that partitions cannot modify the nested configuration shared
+        by all partitions"""
+        pds = PartitionedDataset(
+            path=str(local_csvs),
+            dataset={"type": "pandas.CSVDataset", "load_args": {"sep": ","}},
+        )
+        mocked_ds = mocker.patch.object(pds, "_dataset_type")
+        mocked_ds.__name__ = "mocked"
+        mocked_ds.side_effect = lambda load_args, filepath: load_args.update(sep=";")
+
+        for load_partition in pds.load().values():
+            assert load_partition.dataset is None
+        assert mocked_ds.call_count == len(partitioned_data_pandas)
+        assert pds._dataset_config["load_args"] == {"sep": ","}
+
     def test_save_invalidates_cache(self, local_csvs, mocker):
         """Test that save calls invalidate partition cache"""
         pds = PartitionedDataset(path=str(local_csvs), dataset="pandas.CSVDataset")
@@ -536,6 +1044,10 @@ class TestPartitionedDatasetS3:
         loaded_partitions = pds.load()
 
         assert loaded_partitions.keys() == partitioned_data_pandas.keys()
+        # partition datasets are only instantiated when they are loaded
+        mocked_ds.assert_not_called()
+        for load_func in loaded_partitions.values():
+            load_func()
         assert mocked_ds.call_count == len(loaded_partitions)
         expected = [
             mocker.call(filepath=f"{s3a_path}/{partition_id}")
@@ -604,6 +1116,27 @@ class TestPartitionedDatasetS3:
         load_after_release = pds.load()
         assert initial_load.keys() ^ load_after_release.keys() == {partition_to_remove}
 
+    def test_load_all(self, mocked_csvs_in_s3, partitioned_data_pandas):
+        pds = PartitionedDataset(path=mocked_csvs_in_s3, dataset="pandas.CSVDataset")
+        loaded = pds.load_all(max_workers=4)
+
+        assert loaded.keys() == partitioned_data_pandas.keys()
+        for partition_id, df in loaded.items():
+            assert_frame_equal(df, partitioned_data_pandas[partition_id])
+
+    def test_manifest(self, mocked_csvs_in_s3, partitioned_data_pandas):
+        pds = PartitionedDataset(
+            path=mocked_csvs_in_s3, dataset="pandas.CSVDataset", manifest=True
+        )
+        pds.save({})
+        assert pds.load().keys() == partitioned_data_pandas.keys()
+
+        s3 = s3fs.S3FileSystem()
+        with s3.open(f"{mocked_csvs_in_s3}/_partitions.json") as manifest_file:
+            manifest = json.load(manifest_file)
+        assert len(manifest["partitions"]) == len(partitioned_data_pandas)
+        assert all(entry["etag"] for entry in manifest["partitions"])
+
     @pytest.mark.parametrize("dataset", S3_DATASET_DEFINITION)
     def test_describe(self, dataset):
         path = f"s3://{BUCKET_NAME}/foo/bar"
@@ -0,0 +1,87 @@
+"""Compare the save and load times and file sizes of ``PickleDataset`` backends,
+compression and out-of-band buffers on representative objects.
+
+Run with ``python tests/pickle/benchmark_pickle_dataset.py [--repeat N]``.
+"""
+import argparse
+import importlib
+import tempfile
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from kedro_datasets.pickle import PickleDataset
+
+CONFIGURATIONS = {
+    "pickle": {"backend": "pickle", "save_args": {"protocol": 5}},
+    "joblib": {"backend": "joblib"},
+    "cloudpickle": {"backend": "cloudpickle"},
+    "compress_pickle (lz4)": {
+        "backend": "compress_pickle",
+        "load_args": {"compression": "lz4"},
+        "save_args": {"compression": "lz4"},
+    },
+    "joblib (lz4)": {"backend": "joblib", "save_args": {"compress": "lz4"}},
+    "pickle, lz4": {"compression": "lz4"},
+    "pickle, zstd": {"compression": "zstd"},
+    "pickle, out-of-band": {"out_of_band": True},
+    "pickle, out-of-band, lz4": {"out_of_band": True, "compression": "lz4"},
+    "pickle, out-of-band, zstd": {"out_of_band": True, "compression": "zstd"},
+    "cloudpickle, out-of-band": {"backend": "cloudpickle", "out_of_band": True},
+}
+
+
+def make_objects() -> dict:
+    rng = np.random.default_rng(42)
+    rows = 1_000_000
+    return {
+        "float array": rng.standard_normal((rows, 16)),
+        "dataframe": pd.DataFrame(
+            {
+                "id": np.arange(rows),
+                "value": rng.standard_normal(rows),
+                "category": pd.Categorical(rng.choice(list("abcdef"), rows)),
+                "label": rng.choice(["train", "test", "validation"], rows),
+            }
+        ),
+        "model weights": {
+            f"layer_{index}": rng.standard_normal((512, 512)).astype(np.float32)
+            for index in range(32)
+        },
+    }
+
+
+def run(repeat: int) -> None:
+    objects = make_objects()
+    print(f"{'object':<15}{'configuration':<28}{'save s':>9}{'load s':>9}{'MB':>9}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for object_name, data in objects.items():
+            for name, config in CONFIGURATIONS.items():
+                modules = [config.get("backend", "pickle")]
+                if config.get("compression") == "zstd":
+                    modules.append("zstandard")
+                try:
+                    for module in modules:
+                        importlib.import_module(module)
+                except ImportError:
+                    continue
+
+                filepath = Path(tmp_dir) / "benchmark.pkl"
+                dataset = PickleDataset(filepath=filepath.as_posix(), **config)
+                save = min(
+                    timeit.repeat(lambda: dataset.save(data), number=1, repeat=repeat)
+                )
+                load = min(timeit.repeat(dataset.load, number=1, repeat=repeat))
+                size = filepath.stat().st_size / 2**20
+                print(
+                    f"{object_name:<15}{name:<28}{save:>9.3f}{load:>9.3f}{size:>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    run(parser.parse_args().repeat)
@@ -1,6 +1,11 @@
+import importlib
+import mmap
 import pickle
 from pathlib import Path, PurePosixPath
 
+import fsspec
+import lz4.frame
+import numpy as np
 import pandas as pd
 import pytest
 from fsspec.implementations.http import HTTPFileSystem
@@ -165,6 +170,174 @@ class TestPickleDataset:
         assert pickle_dataset_copy._describe() == pickle_dataset._describe()
 
 
+@pytest.fixture
+def arrays():
+    return {"ints": np.arange(10_000), "floats": np.linspace(0, 1, 5_000)}
+
+
+def _memory_mapped(array):
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return isinstance(array.base, memoryview) and isinstance(array.base.obj, mmap.mmap)
+
+
+class TestPickleDatasetSerialisation:
+    @pytest.mark.parametrize(
+        "backend,compression,out_of_band",
+        [
+            ("pickle", "lz4", False),
+            ("pickle", None, True),
+            ("pickle", "lz4", True),
+            ("cloudpickle", None, True),
+            ("dill", "lz4", True),
+        ],
+    )
+    def test_save_and_load(
+        self, filepath_pickle, backend, compression, out_of_band, arrays
+    ):
+        """Test saving and reloading with compression and out-of-band buffers."""
+        data = {**arrays, "frame": pd.DataFrame(arrays["floats"])}
+        dataset = PickleDataset(
+            filepath=filepath_pickle,
+            backend=backend,
+            compression=compression,
+            out_of_band=out_of_band,
+        )
+        dataset.save(data)
+        reloaded = dataset.load()
+
+        np.testing.assert_array_equal(reloaded["ints"], arrays["ints"])
+        np.testing.assert_array_equal(reloaded["floats"], arrays["floats"])
+        assert_frame_equal(reloaded["frame"], data["frame"])
+
+    def test_zstd_compression(self, filepath_pickle, arrays):
+        zstandard = pytest.importorskip("zstandard")
+        dataset = PickleDataset(
+            filepath=filepath_pickle, compression="zstd", out_of_band=True
+        )
+        dataset.save(arrays)
+        reloaded = dataset.load()
+
+        np.testing.assert_array_equal(reloaded["ints"], arrays["ints"])
+        with open(filepath_pickle, "rb") as file:
+            assert file.read(4) == zstandard.FRAME_HEADER
+
+    def test_lz4_compression(self, filepath_pickle, arrays):
+        """Test that the file is a standard LZ4 frame, smaller than the data."""
+        dataset = PickleDataset(filepath=filepath_pickle, compression="lz4")
+        dataset.save(arrays)
+
+        compressed = Path(filepath_pickle).read_bytes()
+        assert len(compressed) < arrays["ints"].nbytes
+        reloaded = pickle.loads(lz4.frame.decompress(compressed))
+        np.testing.assert_array_equal(reloaded["ints"], arrays["ints"])
+
+    def test_out_of_band_memory_mapped(self, filepath_pickle, arrays):
+        """Test that local out-of-band buffers are memory-mapped, aligned and
+        copied on write only."""
+        dataset = PickleDataset(filepath=filepath_pickle, out_of_band=True)
+        dataset.save(arrays)
+        reloaded = dataset.load()
+
+        for name, array in reloaded.items():
+            assert _memory_mapped(array)
+            assert array.ctypes.data % 64 == 0
+            np.testing.assert_array_equal(array, arrays[name])
+
+        reloaded["ints"][:] = 0
+        np.testing.assert_array_equal(dataset.load()["ints"], arrays["ints"])
+
+    def test_out_of_band_remote(self, arrays):
+        """Test that out-of-band buffers are read from remote files as a stream."""
+        dataset = PickleDataset(filepath="memory://bucket/arrays.pkl", out_of_band=True)
+        try:
+            dataset.save(arrays)
+            reloaded = dataset.load()
+        finally:
+            fsspec.filesystem("memory").rm("/bucket/arrays.pkl")
+
+        assert not _memory_mapped(reloaded["ints"])
+        np.testing.assert_array_equal(reloaded["ints"], arrays["ints"])
+
+    def test_load_in_band_file_out_of_band(self, filepath_pickle, arrays):
+        PickleDataset(filepath=filepath_pickle).save(arrays)
+        pattern = r"'.+' was not saved with out-of-band buffers\."
+        with pytest.raises(DatasetError, match=pattern):
+            PickleDataset(filepath=filepath_pickle, out_of_band=True).load()
+
+    @pytest.mark.parametrize(
+        "filepath", ["{tmp_path}/arrays.pkl", "memory://bucket/arrays.pkl"]
+    )
+    @pytest.mark.parametrize("size", [0, 1000])
+    def test_truncated_file(self, tmp_path, filepath, size, arrays):
+        dataset = PickleDataset(
+            filepath=filepath.format(tmp_path=tmp_path.as_posix()), out_of_band=True
+        )
+        dataset.save(arrays)
+        load_path = str(dataset._filepath)
+        dataset._fs.pipe(load_path, dataset._fs.cat(load_path)[:size])
+
+        pattern = r"Unexpected end of out-of-band pickle file\."
+        try:
+            with pytest.raises(DatasetError, match=pattern):
+                dataset.load()
+        finally:
+            dataset._fs.rm(load_path)
+
+    def test_out_of_band_cached(self, tmp_path, arrays):
+        """Test that out-of-band buffers of cached remote files are memory-mapped."""
+        dataset = PickleDataset(
+            filepath="memory://bucket/arrays.pkl",
+            out_of_band=True,
+            fs_args={"cache": {"path": str(tmp_path)}},
+        )
+        try:
+            dataset.save(arrays)
+            reloaded = dataset.load()
+        finally:
+            fsspec.filesystem("memory").rm("/bucket/arrays.pkl")
+
+        assert _memory_mapped(reloaded["ints"])
+        np.testing.assert_array_equal(reloaded["ints"], arrays["ints"])
+
+    def test_invalid_compression(self):
+        pattern = r"Unsupported compression 'gzip', use one of \['lz4', 'zstd'\]\."
+        with pytest.raises(ValueError, match=pattern):
+            PickleDataset(filepath="test.pkl", compression="gzip")
+
+    def test_missing_compression_package(self, mocker):
+        import_module = importlib.import_module
+
+        def fake_import(name):
+            if name == "zstandard":
+                raise ImportError
+            return import_module(name)
+
+        mocker.patch(
+            "kedro_datasets.pickle.pickle_dataset.importlib.import_module",
+            side_effect=fake_import,
+        )
+        pattern = r"Selected compression 'zstd' requires the 'zstandard' package\."
+        with pytest.raises(ImportError, match=pattern):
+            PickleDataset(filepath="test.pkl", compression="zstd")
+
+    def test_backend_imported_once(self, pickle_dataset, dummy_dataframe, mocker):
+        """Test that the backend is not imported again on every load and save."""
+        import_module = mocker.spy(importlib, "import_module")
+        pickle_dataset.save(dummy_dataframe)
+        pickle_dataset.load()
+        import_module.assert_not_called()
+
+    def test_backend_imported_in_new_process(
+        self, pickle_dataset, dummy_dataframe, mocker
+    ):
+        """Test that the backend is imported when the dataset was created in
+        another process."""
+        mocker.patch.dict("kedro_datasets._compression.BACKENDS", {}, clear=True)
+        pickle_dataset.save(dummy_dataframe)
+        assert_frame_equal(pickle_dataset.load(), dummy_dataframe)
+
+
 class TestPickleDatasetVersioned:
     def test_version_str_repr(self, load_version, save_version):
         """Test that version is in string representation of the class instance
@@ -0,0 +1,17 @@
+import pytest
+from PIL.JpegImagePlugin import JpegImageFile
+
+
+@pytest.fixture
+def draft_spy(mocker):
+    """Record the scales which JPEG images are drafted to."""
+    draft = JpegImageFile.draft
+
+    def record(image, mode, size):
+        result = draft(image, mode, size)
+        record.returns.append(result)
+        return result
+
+    record.returns = []
+    mocker.patch.object(JpegImageFile, "draft", record)
+    return record
@@ -0,0 +1,162 @@
+import numpy as np
+import pytest
+from kedro.io.core import DatasetError
+from PIL import Image
+
+from kedro_datasets.pillow import ImageBatchDataset
+
+COLORS = ["red", "green", "blue", "yellow"]
+
+
+@pytest.fixture
+def images_dir(tmp_path):
+    images = tmp_path / "images"
+    images.mkdir()
+    for index, color in enumerate(COLORS):
+        Image.new("RGB", (8, 6), color).save(images / f"{index}.png")
+    (images / "labels.csv").write_text("label\n")
+    return images
+
+
+@pytest.fixture
+def expected_batch():
+    return np.stack([np.asarray(Image.new("RGB", (8, 6), color)) for color in COLORS])
+
+
+class TestImageBatchDataset:
+    def test_load_directory(self, images_dir, expected_batch):
+        """Test loading the images of a directory, skipping other files."""
+        batch = ImageBatchDataset(filepath=str(images_dir)).load()
+        assert batch.dtype == np.uint8
+        np.testing.assert_array_equal(batch, expected_batch)
+
+    def test_load_glob(self, images_dir, expected_batch):
+        batch = ImageBatchDataset(filepath=str(images_dir / "[12].png")).load()
+        np.testing.assert_array_equal(batch, expected_batch[1:3])
+
+    def test_load_directory_with_glob_characters(self, tmp_path, expected_batch):
+        images = tmp_path / "images[1]"
+        images.mkdir()
+        for index, color in enumerate(COLORS):
+            Image.new("RGB", (8, 6), color).save(images / f"{index}.png")
+        batch = ImageBatchDataset(filepath=str(images)).load()
+        np.testing.assert_array_equal(batch, expected_batch)
+
+    def test_load_nested_directory(self, images_dir, expected_batch):
+        nested = images_dir / "nested"
+        nested.mkdir()
+        Image.new("RGB", (8, 6), "red").save(nested / "image.png")
+
+        batch = ImageBatchDataset(filepath=str(images_dir)).load()
+        np.testing.assert_array_equal(batch[:-1], expected_batch)
+        np.testing.assert_array_equal(batch[-1], expected_batch[0])
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_resize_and_convert(self, images_dir, max_workers):
+        """Test converting and resizing images into a preallocated batch."""
+        Image.new("RGB", (16, 12), "white").save(images_dir / "4.png")
+        dataset = ImageBatchDataset(
+            filepath=str(images_dir),
+            load_args={
+                "max_workers": max_workers,
+                "mode": "L",
+                "size": [4, 3],
+                "resample": "nearest",
+            },
+        )
+        batch = dataset.load()
+        assert batch.shape == (5, 3, 4)
+        assert batch.dtype == np.uint8
+        np.testing.assert_array_equal(
+            batch[:, 0, 0],
+            [
+                Image.new("RGB", (1, 1), color).convert("L").getpixel((0, 0))
+                for color in [*COLORS, "white"]
+            ],
+        )
+
+    def test_resize(self, images_dir):
+        dataset = ImageBatchDataset(
+            filepath=str(images_dir), load_args={"size": (4, 3)}
+        )
+        assert dataset.load().shape == (4, 3, 4, 3)
+
+    def test_convert_to_float_mode(self, images_dir):
+        dataset = ImageBatchDataset(
+            filepath=str(images_dir), load_args={"mode": "F", "size": (8, 6)}
+        )
+        batch = dataset.load()
+        assert batch.shape == (4, 6, 8)
+        assert batch.dtype == np.float32
+
+    def test_resize_jpeg_draft(self, tmp_path, draft_spy):
+        """Test that JPEG images are decoded at a reduced scale before resizing."""
+        Image.new("RGB", (800, 600), "red").save(tmp_path / "photo.jpg")
+        dataset = ImageBatchDataset(
+            filepath=str(tmp_path / "*.jpg"),
+            load_args={"mode": "RGB", "size": (200, 150)},
+        )
+        assert dataset.load().shape == (1, 150, 200, 3)
+        assert draft_spy.returns[0][1] == (0, 0, 200, 150)
+
+    def test_different_sizes(self, images_dir):
+        Image.new("RGB", (16, 12), "white").save(images_dir / "4.png")
+        pattern = (
+            r"Images of different sizes or modes can't be stacked, "
+            r"found 2 combinations of them\."
+        )
+        with pytest.raises(DatasetError, match=pattern):
+            ImageBatchDataset(filepath=str(images_dir)).load()
+
+    def test_invalid_resample(self, images_dir):
+        pattern = r"Invalid resampling filter 'smooth', expected one of nearest, "
+        with pytest.raises(DatasetError, match=pattern):
+            ImageBatchDataset(
+                filepath=str(images_dir), load_args={"resample": "smooth"}
+            )
+
+    def test_no_images(self, tmp_path):
+        dataset = ImageBatchDataset(filepath=str(tmp_path / "*.png"))
+        assert not dataset.exists()
+        with pytest.raises(DatasetError, match=r"No images found in"):
+            dataset.load()
+
+    def test_missing_directory(self, tmp_path):
+        assert not ImageBatchDataset(filepath=str(tmp_path / "missing")).exists()
+
+    def test_exists(self, images_dir):
+        assert ImageBatchDataset(filepath=str(images_dir)).exists()
+
+    def test_save_not_supported(self, images_dir, expected_batch):
+        pattern = r"'save' is not supported on ImageBatchDataset"
+        with pytest.raises(DatasetError, match=pattern):
+            ImageBatchDataset(filepath=str(images_dir)).save(expected_batch)
+
+    def test_str_representation(self, images_dir):
+        dataset = ImageBatchDataset(
+            filepath=str(images_dir), load_args={"max_workers": 2}
+        )
+        assert "load_args={'max_workers': 2}" in str(dataset)
+        assert "protocol=file" in str(dataset)
+
+    def test_load_remote_cached(self, memory_fs, tmp_path, expected_batch, mocker):
+        """Test loading remote images through the local file cache."""
+        for index, color in enumerate(COLORS):
+            with memory_fs.open(f"/images/{index}.png", mode="wb") as fs_file:
+                Image.new("RGB", (8, 6), color).save(fs_file, format="png")
+        dataset = ImageBatchDataset(
+            filepath="memory:///images/*.png",
+            fs_args={"cache": {"path": str(tmp_path / "cache")}},
+        )
+        get_file = mocker.spy(memory_fs, "get_file")
+
+        for _ in range(2):
+            np.testing.assert_array_equal(dataset.load(), expected_batch)
+        assert get_file.call_count == len(COLORS)
+
+    def test_catalog_release(self, images_dir, mocker):
+        fs_mock = mocker.patch("fsspec.filesystem").return_value
+        fs_mock.protocol = "file"
+        dataset = ImageBatchDataset(filepath=str(images_dir))
+        dataset.release()
+        fs_mock.invalidate_cache.assert_called_once_with(str(images_dir))
@@ -1,3 +1,4 @@
+import gc
 from pathlib import Path, PurePosixPath
 from time import sleep
 
@@ -5,7 +6,8 @@ import pytest
 from fsspec.implementations.http import HTTPFileSystem
 from fsspec.implementations.local import LocalFileSystem
 from kedro.io.core import PROTOCOL_DELIMITER, DatasetError, Version, generate_timestamp
-from PIL import Image, ImageChops
+from PIL import Image, ImageChops, ImageSequence
+from PIL.JpegImagePlugin import JpegImageFile
 from s3fs.core import S3FileSystem
 
 from kedro_datasets.pillow import ImageDataset
@@ -125,6 +127,123 @@ class TestImageDataset:
         assert expected_extension == ext
 
 
+@pytest.fixture
+def filepath_jpg(tmp_path):
+    filepath = tmp_path / "photo.jpg"
+    Image.new("RGB", (1600, 1200), "red").save(filepath)
+    return filepath.as_posix()
+
+
+class TestImageDatasetLoadArgs:
+    def test_load_size(self, filepath_jpg, draft_spy):
+        """Test that JPEG images are decoded at a reduced scale to fit in size."""
+        dataset = ImageDataset(filepath=filepath_jpg, load_args={"size": [400, 400]})
+        image = dataset.load()
+
+        assert image.size == (400, 300)
+        assert image.getpixel((0, 0)) == pytest.approx((254, 0, 0), abs=2)
+        # Decoded at a quarter of the resolution, twice the requested size
+        assert draft_spy.returns[0][1] == (0, 0, 800, 600)
+
+    def test_load_size_reduce(self, filepath_png, mocker):
+        """Test that other images are reduced by an integer factor before resampling."""
+        Image.new("RGB", (400, 300), "red").save(filepath_png)
+        reduce = mocker.spy(Image.Image, "reduce")
+        dataset = ImageDataset(
+            filepath=filepath_png,
+            load_args={"size": (100, 100), "resample": "bilinear"},
+        )
+        assert dataset.load().size == (100, 75)
+        reduce.assert_called_once_with(mocker.ANY, (2, 2), mocker.ANY)
+
+    def test_load_small_image(self, image_dataset, image_object):
+        """Test that images which already fit in the size are not resized."""
+        image_dataset.save(image_object)
+        dataset = ImageDataset(
+            filepath=str(image_dataset._filepath),
+            load_args={"size": (4096, 4096)},
+        )
+        assert images_equal(image_object, dataset.load())
+
+    def test_load_lazy(self, filepath_jpg, mocker):
+        """Test that only the header of the image is read until pixels are accessed."""
+        dataset = ImageDataset(filepath=filepath_jpg, load_args={"lazy": True})
+        load = mocker.spy(JpegImageFile, "load")
+        image = dataset.load()
+
+        assert image.size == (1600, 1200)
+        assert image.mode == "RGB"
+        assert image.format == "JPEG"
+        load.assert_not_called()
+
+        assert image.getpixel((0, 0)) == pytest.approx((254, 0, 0), abs=2)
+        load.assert_called()
+        image.close()
+
+    def test_load_lazy_close(self, filepath_jpg):
+        """Test that closing a lazily loaded image closes its file."""
+        dataset = ImageDataset(filepath=filepath_jpg, load_args={"lazy": True})
+        image = dataset.load()
+        fs_file = image.fp
+        image.close()
+        assert fs_file.closed
+
+    def test_load_lazy_collected(self, filepath_jpg):
+        """Test that the file of a lazily loaded image is closed once the image
+        is garbage collected."""
+        dataset = ImageDataset(filepath=filepath_jpg, load_args={"lazy": True})
+        image = dataset.load()
+        fs_file = image.fp
+        image.load()
+        assert not fs_file.closed
+        del image
+        gc.collect()
+        assert fs_file.closed
+
+    def test_load_animated(self, tmp_path):
+        """Test that the first frame of animated images is loaded detached
+        from the closed file."""
+        filepath = tmp_path / "animation.gif"
+        frames = [Image.new("RGB", (8, 8), color) for color in ("red", "green", "blue")]
+        frames[0].save(filepath, save_all=True, append_images=frames[1:])
+
+        for load_args in [None, {"size": (4, 4)}]:
+            image = ImageDataset(filepath=str(filepath), load_args=load_args).load()
+            assert image.convert("RGB").getpixel((0, 0)) == (255, 0, 0)
+            assert getattr(image, "fp", None) is None
+
+    @pytest.mark.parametrize("load_args", [None, {"size": (4, 4)}])
+    def test_load_single_frame_gif(self, tmp_path, load_args):
+        """Test that single frame GIF images are loaded detached from the file."""
+        filepath = tmp_path / "image.gif"
+        Image.new("RGB", (8, 8), "red").save(filepath)
+
+        image = ImageDataset(filepath=str(filepath), load_args=load_args).load()
+        assert getattr(image, "fp", None) is None
+        assert len(list(ImageSequence.Iterator(image))) == 1
+
+    def test_lazy_with_size(self, filepath_jpg):
+        pattern = r"'lazy' can't be combined with 'size' in 'load_args'"
+        with pytest.raises(DatasetError, match=pattern):
+            ImageDataset(
+                filepath=filepath_jpg, load_args={"lazy": True, "size": (8, 8)}
+            )
+
+    def test_invalid_resample(self, filepath_jpg):
+        pattern = r"Invalid resampling filter 'smooth', expected one of nearest, "
+        with pytest.raises(DatasetError, match=pattern):
+            ImageDataset(filepath=filepath_jpg, load_args={"resample": "smooth"})
+
+    def test_load_args_in_str(self, filepath_jpg):
+        dataset = ImageDataset(filepath=filepath_jpg, load_args={"size": (8, 8)})
+        assert "load_args={'size': (8, 8)}" in str(dataset)
+
+    def test_load_keeps_format(self, image_dataset, image_object):
+        """Test that loaded images keep their format."""
+        image_dataset.save(image_object)
+        assert image_dataset.load().format == "PNG"
+
+
 class TestImageDatasetVersioned:
     def test_version_str_repr(self, load_version, save_version):
         """Test that version is in string representation of the class instance
@@ -246,6 +246,21 @@ class TestEagerIPCDatasetVersioned:
         reloaded_df = versioned_ipc_dataset.load()
         assert_frame_equal(dummy_dataframe, reloaded_df)
 
+    def test_load_memory_map(self, filepath_ipc, dummy_dataframe, mocker):
+        """Test that local IPC files are memory-mapped by path."""
+        dataset = EagerPolarsDataset(
+            filepath=filepath_ipc.as_posix(),
+            file_format="ipc",
+            load_args={"memory_map": True},
+        )
+        dataset.save(dummy_dataframe)
+        fs_open = mocker.spy(dataset._fs, "open")
+        read_ipc = mocker.spy(pl, "read_ipc")
+
+        assert_frame_equal(dummy_dataframe, dataset.load())
+        fs_open.assert_not_called()
+        read_ipc.assert_called_once_with(filepath_ipc.as_posix(), memory_map=True)
+
     def test_version_str_repr(self, filepath_ipc, load_version, save_version):
         """Test that version is in string representation of the class instance
         when applicable."""
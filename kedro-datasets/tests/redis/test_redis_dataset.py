@@ -2,6 +2,7 @@
 import importlib
 import pickle
 
+import lz4.frame
 import numpy as np
 import pandas as pd
 import pytest
@@ -10,6 +11,49 @@ from kedro.io.core import DatasetError
 from pandas.testing import assert_frame_equal
 
 from kedro_datasets.redis import PickleDataset
+from kedro_datasets.redis.redis_dataset import _CLIENTS
+
+
+@pytest.fixture(autouse=True)
+def cleanup_clients():
+    yield
+    _CLIENTS.clear()
+
+
+@pytest.fixture
+def redis_store(mocker):
+    """Execute transactions against a dictionary instead of a Redis server."""
+    store = {}
+
+    def execute(pipeline, raise_on_error=True):
+        results = []
+        for args, _ in pipeline.command_stack:
+            command, key, *values = args
+            if command == "GET":
+                results.append(store.get(key))
+            elif command == "HGETALL":
+                results.append(store.get(key, {}))
+            elif command == "SET":
+                store[key] = bytes(values[0])
+                results.append(True)
+            elif command == "HSET":
+                fields = {
+                    str(field).encode(): bytes(value)
+                    for field, value in zip(values[::2], values[1::2])
+                }
+                store.setdefault(key, {}).update(fields)
+                results.append(len(fields))
+            elif command == "DEL":
+                results.append(int(store.pop(key, None) is not None))
+            else:
+                results.append(True)
+        store.setdefault("commands", []).append(
+            [args for args, _ in pipeline.command_stack]
+        )
+        return results
+
+    mocker.patch("redis.client.Pipeline.execute", autospec=True, side_effect=execute)
+    return store
 
 
 @pytest.fixture(params=["pickle"])
@@ -72,31 +116,30 @@ class TestPickleDataset:
         self,
         pickle_dataset,
         mocker,
+        redis_store,
         dummy_object,
         serialised_dummy_object,
         key,
     ):
         """Test saving and reloading the data set."""
-        set_mocker = mocker.patch("redis.StrictRedis.set")
-        get_mocker = mocker.patch(
-            "redis.StrictRedis.get", return_value=serialised_dummy_object
-        )
         pickle_dataset.save(dummy_object)
-        mocker.patch("redis.StrictRedis.exists", return_value=True)
+        exists_mocker = mocker.patch("redis.StrictRedis.exists")
         loaded_dummy_object = pickle_dataset.load()
-        set_mocker.assert_called_once_with(
-            key,
-            serialised_dummy_object,
-        )
-        get_mocker.assert_called_once_with(key)
+        assert redis_store[key] == serialised_dummy_object
         assert_frame_equal(loaded_dummy_object, dummy_object)
 
-    def test_exists(self, mocker, pickle_dataset, dummy_object, key):
+        # the value is loaded in a single round trip, without checking that it exists
+        exists_mocker.assert_not_called()
+        assert redis_store["commands"][-1] == [
+            ("GET", key),
+            ("HGETALL", f"{{{key}}}:chunks"),
+        ]
+
+    def test_exists(self, mocker, pickle_dataset, redis_store, dummy_object, key):
         """Test `exists` method invocation for both existing and
         nonexistent data set."""
         mocker.patch("redis.StrictRedis.exists", return_value=False)
         assert not pickle_dataset.exists()
-        mocker.patch("redis.StrictRedis.set")
         pickle_dataset.save(dummy_object)
         exists_mocker = mocker.patch("redis.StrictRedis.exists", return_value=True)
         assert pickle_dataset.exists()
@@ -126,10 +169,9 @@ class TestPickleDataset:
         assert pickle_dataset._redis_from_url_args == redis_args["from_url_args"]
         assert pickle_dataset._redis_set_args == {}  # default unchanged
 
-    def test_load_missing_key(self, mocker, pickle_dataset):
+    def test_load_missing_key(self, pickle_dataset, redis_store):
         """Check the error when trying to load missing file."""
         pattern = r"The provided key "
-        mocker.patch("redis.StrictRedis.exists", return_value=False)
         with pytest.raises(DatasetError, match=pattern):
             pickle_dataset.load()
 
@@ -163,3 +205,178 @@ class TestPickleDataset:
         )
         with pytest.raises(ImportError, match=pattern):
             PickleDataset(key="key", backend="fake.backend.does.not.exist")
+
+
+class TestPickleDatasetChunks:
+    @pytest.fixture
+    def chunked_dataset(self, mocker, redis_args):
+        mocker.patch(
+            "redis.StrictRedis.from_url", return_value=redis.Redis.from_url("redis://")
+        )
+        return PickleDataset(key="key", chunk_size=100, redis_args=redis_args)
+
+    def test_save_and_load(self, chunked_dataset, redis_store, dummy_object):
+        """Test that large values are saved and loaded in chunks."""
+        serialised = pickle.dumps(dummy_object)
+        chunked_dataset.save(dummy_object)
+
+        chunks = redis_store["{key}:chunks"]
+        assert len(chunks) == -(-len(serialised) // 100)
+        assert (
+            redis_store["key"] == b"\x00kedro-chunked\x00" + str(len(chunks)).encode()
+        )
+        assert b"".join(chunks[str(i).encode()] for i in range(len(chunks))) == (
+            serialised
+        )
+        assert_frame_equal(chunked_dataset.load(), dummy_object)
+        assert len(redis_store["commands"]) == 2
+
+    def test_not_chunked_by_default(self, mocker, redis_store, dummy_object):
+        mocker.patch(
+            "redis.StrictRedis.from_url", return_value=redis.Redis.from_url("redis://")
+        )
+        dataset = PickleDataset(key="key")
+        dataset.save(dummy_object)
+        assert redis_store["key"] == pickle.dumps(dummy_object)
+        assert "{key}:chunks" not in redis_store
+
+    @pytest.mark.parametrize(
+        "key,chunks_key",
+        [
+            ("key", "{key}:chunks"),
+            ("{user1}:key", "{user1}:key:chunks"),
+            ("user:{1}:{2}", "user:{1}:{2}:chunks"),
+            ("{}:key", "{{}:key}:chunks"),
+            ("key}{", "{key}{}:chunks"),
+        ],
+    )
+    def test_chunks_key_hash_tag(self, mocker, key, chunks_key):
+        """Test that the chunks are kept in the same cluster slot as the key."""
+        mocker.patch("redis.StrictRedis.from_url")
+        assert PickleDataset(key=key)._chunks_key == chunks_key
+
+    def test_small_value_replaces_chunks(self, chunked_dataset, redis_store):
+        chunked_dataset.save(list(range(100)))
+        assert "{key}:chunks" in redis_store
+        chunked_dataset.save(1)
+        assert "{key}:chunks" not in redis_store
+        assert chunked_dataset.load() == 1
+
+    def test_chunks_expire(self, mocker, redis_store, dummy_object):
+        mocker.patch(
+            "redis.StrictRedis.from_url", return_value=redis.Redis.from_url("redis://")
+        )
+        dataset = PickleDataset(
+            key="key", chunk_size=100, redis_args={"set_args": {"ex": 10}}
+        )
+        dataset.save(dummy_object)
+        commands = redis_store["commands"][-1]
+        assert ("EXPIRE", "{key}:chunks", 10) in commands
+        assert ("SET", "key", redis_store["key"], "EX", 10) in commands
+
+    def test_missing_chunks(self, chunked_dataset, redis_store, dummy_object):
+        chunked_dataset.save(dummy_object)
+        chunk_count = len(redis_store["{key}:chunks"])
+        redis_store["{key}:chunks"].pop(b"0")
+
+        pattern = rf"Found {chunk_count - 1} of the {chunk_count} chunks of key key\."
+        with pytest.raises(DatasetError, match=pattern):
+            chunked_dataset.load()
+
+    def test_conditional_set_args(self, mocker, dummy_object):
+        mocker.patch(
+            "redis.StrictRedis.from_url", return_value=redis.Redis.from_url("redis://")
+        )
+        set_mocker = mocker.patch("redis.StrictRedis.set")
+        dataset = PickleDataset(key="key", redis_args={"set_args": {"nx": True}})
+        dataset.save(dummy_object)
+        set_mocker.assert_called_once_with("key", pickle.dumps(dummy_object), nx=True)
+
+        dataset = PickleDataset(
+            key="key", chunk_size=100, redis_args={"set_args": {"nx": True}}
+        )
+        pattern = (
+            r"Cannot save chunks of key key with any of the \['nx', .*\] set_args\."
+        )
+        with pytest.raises(DatasetError, match=pattern):
+            dataset.save(dummy_object)
+
+
+class TestPickleDatasetCompression:
+    @pytest.mark.parametrize("chunk_size", [None, 100])
+    def test_lz4(self, mocker, redis_store, dummy_object, chunk_size):
+        mocker.patch(
+            "redis.StrictRedis.from_url", return_value=redis.Redis.from_url("redis://")
+        )
+        dataset = PickleDataset(key="key", compression="lz4", chunk_size=chunk_size)
+        dataset.save(dummy_object)
+        if chunk_size is None:
+            assert_frame_equal(
+                pickle.loads(lz4.frame.decompress(redis_store["key"])), dummy_object
+            )
+        assert_frame_equal(dataset.load(), dummy_object)
+
+    def test_zstd(self, mocker, redis_store, dummy_object):
+        zstandard = pytest.importorskip("zstandard")
+        mocker.patch(
+            "redis.StrictRedis.from_url", return_value=redis.Redis.from_url("redis://")
+        )
+        dataset = PickleDataset(key="key", compression="zstd")
+        dataset.save(dummy_object)
+        assert redis_store["key"].startswith(zstandard.FRAME_HEADER)
+        assert_frame_equal(dataset.load(), dummy_object)
+
+    def test_invalid_compression(self):
+        pattern = r"Unsupported compression 'gzip', use one of \['lz4', 'zstd'\]\."
+        with pytest.raises(ValueError, match=pattern):
+            PickleDataset(key="key", compression="gzip")
+
+    def test_missing_compression_package(self, mocker):
+        import_module = importlib.import_module
+
+        def fake_import(name):
+            if name == "zstandard":
+                raise ImportError
+            return import_module(name)
+
+        mocker.patch(
+            "kedro_datasets.redis.redis_dataset.importlib.import_module",
+            side_effect=fake_import,
+        )
+        pattern = r"Selected compression 'zstd' requires the 'zstandard' package\."
+        with pytest.raises(ImportError, match=pattern):
+            PickleDataset(key="key", compression="zstd")
+
+
+class TestPickleDatasetClients:
+    def test_shared_client(self, mocker):
+        """Test that datasets using the same server share a client and its pool."""
+        from_url = mocker.patch(
+            "redis.Redis.from_url", side_effect=lambda **_: mocker.Mock()
+        )
+        first = PickleDataset(key="first")
+        second = PickleDataset(key="second")
+        other = PickleDataset(
+            key="other", redis_args={"from_url_args": {"url": "redis://other:6379"}}
+        )
+
+        assert first._redis_db is second._redis_db
+        assert other._redis_db is not first._redis_db
+        assert from_url.call_count == 2
+
+    def test_credentials_not_shared(self, mocker):
+        mocker.patch("redis.Redis.from_url", side_effect=lambda **_: mocker.Mock())
+        first = PickleDataset(key="key", credentials={"password": "first"})
+        second = PickleDataset(key="key", credentials={"password": "second"})
+        assert first._redis_db is not second._redis_db
+
+    def test_backend_imported_in_new_process(self, mocker, redis_store, dummy_object):
+        """Test that the backend is imported when the dataset was created in
+        another process."""
+        mocker.patch(
+            "redis.StrictRedis.from_url", return_value=redis.Redis.from_url("redis://")
+        )
+        dataset = PickleDataset(key="key")
+        mocker.patch.dict("kedro_datasets._compression.BACKENDS", {}, clear=True)
+        dataset.save(dummy_object)
+        assert_frame_equal(dataset.load(), dummy_object)
@@ -0,0 +1,95 @@
+import fsspec
+import pandas as pd
+import pytest
+from kedro.io.core import DatasetError
+from pandas.testing import assert_frame_equal
+
+from kedro_datasets._io import atomic_save, is_glob
+from kedro_datasets.pandas import CSVDataset, ParquetDataset
+
+
+class TestAtomicSave:
+    def test_save(self, memory_fs):
+        with atomic_save(memory_fs, "/bucket/data.csv") as fs_file:
+            fs_file.write(b"col1\n1\n")
+        assert memory_fs.cat("/bucket/data.csv") == b"col1\n1\n"
+        assert memory_fs.ls("/bucket", detail=False) == ["/bucket/data.csv"]
+
+    def test_save_local(self, tmp_path):
+        filepath = tmp_path / "data.csv"
+        with atomic_save(fsspec.filesystem("file"), str(filepath)) as fs_file:
+            fs_file.write(b"col1\n1\n")
+        assert filepath.read_bytes() == b"col1\n1\n"
+        assert list(tmp_path.iterdir()) == [filepath]
+
+    def test_failed_save_keeps_existing_file(self, tmp_path):
+        filepath = tmp_path / "data.csv"
+        filepath.write_bytes(b"col1\n1\n")
+        with pytest.raises(ValueError, match="boom"):
+            with atomic_save(fsspec.filesystem("file"), str(filepath)) as fs_file:
+                fs_file.write(b"col1\n")
+                raise ValueError("boom")
+        assert filepath.read_bytes() == b"col1\n1\n"
+        assert list(tmp_path.iterdir()) == [filepath]
+
+    def test_save_object_store(self, mocker):
+        """Test that files on object stores are written to directly, as they
+        are only uploaded once closed."""
+        fs = mocker.Mock(protocol=("s3", "s3a"))
+        with atomic_save(fs, "bucket/data.csv") as fs_file:
+            fs_file.write(b"col1\n1\n")
+        fs.open.assert_called_once_with("bucket/data.csv", mode="wb")
+        fs_file.close.assert_called_once_with()
+        fs_file.discard.assert_not_called()
+
+    def test_failed_save_discards_object_store_file(self, mocker):
+        """Test that files on object stores are discarded instead of uploaded
+        when the save fails."""
+        fs = mocker.Mock(protocol="gcs")
+        with pytest.raises(ValueError, match="boom"):
+            with atomic_save(fs, "bucket/data.csv") as fs_file:
+                raise ValueError("boom")
+        fs_file.discard.assert_called_once_with()
+        fs_file.close.assert_not_called()
+
+    def test_failed_save_removes_temporary_file(self, tmp_path):
+        with pytest.raises(ValueError, match="boom"):
+            with atomic_save(fsspec.filesystem("file"), str(tmp_path / "data.csv")):
+                raise ValueError("boom")
+        assert not list(tmp_path.iterdir())
+
+    @pytest.mark.parametrize(
+        "dataset_class,method",
+        [(CSVDataset, "to_csv"), (ParquetDataset, "to_parquet")],
+    )
+    def test_failed_resave_keeps_last_good_file(
+        self, tmp_path, mocker, dataset_class, method
+    ):
+        """Test that a dataset which fails to overwrite its file can still
+        load the data saved before."""
+        data = pd.DataFrame({"col1": [1, 2]})
+        dataset = dataset_class(filepath=(tmp_path / "data").as_posix())
+        dataset.save(data)
+
+        mocker.patch.object(pd.DataFrame, method, side_effect=ValueError("boom"))
+        with pytest.raises(DatasetError, match="boom"):
+            dataset.save(pd.DataFrame({"col1": [3]}))
+        mocker.stopall()
+
+        assert_frame_equal(dataset.load(), data)
+        assert [path.name for path in tmp_path.iterdir()] == ["data"]
+
+
+class TestIsGlob:
+    @pytest.mark.parametrize(
+        "protocol,path,expected",
+        [
+            ("file", "/data/export_*.csv", True),
+            ("s3", "bucket/d[1].csv", True),
+            ("file", "/data/export.csv", False),
+            ("https", "example.com/export.csv?raw=true", False),
+            ("http", "example.com/export_*.csv", False),
+        ],
+    )
+    def test_is_glob(self, protocol, path, expected):
+        assert is_glob(protocol, path) is expected
@@ -0,0 +1,201 @@
+import copy
+import os
+import pickle
+import stat
+import time
+
+import pandas as pd
+import pytest
+from fsspec.implementations.local import LocalFileSystem
+from kedro.io.core import DatasetError
+from pandas.testing import assert_frame_equal
+
+from kedro_datasets._local_cache import (
+    CachedFileSystem,
+    cached_filesystem,
+    user_cache_dir,
+)
+from kedro_datasets.pandas import CSVDataset, JSONDataset, ParquetDataset
+from kedro_datasets.pickle import PickleDataset
+
+
+def pickle_roundtrip(obj):
+    return pickle.loads(pickle.dumps(obj))
+
+
+@pytest.fixture
+def cached_fs(memory_fs, tmp_path):
+    return CachedFileSystem(memory_fs, path=tmp_path / "cache")
+
+
+class TestCachedFileSystem:
+    def test_read_from_cache(self, cached_fs, memory_fs, mocker):
+        """Test that files are only downloaded on their first read."""
+        memory_fs.pipe("/bucket/data.csv", b"col1\n1\n")
+        get_file = mocker.spy(memory_fs, "get_file")
+
+        for _ in range(3):
+            with cached_fs.open("/bucket/data.csv", mode="rb") as cached_file:
+                assert cached_file.read() == b"col1\n1\n"
+
+        get_file.assert_called_once()
+        assert cached_fs.fetch("/bucket/data.csv").endswith(".csv")
+
+    def test_modified_file_downloaded_again(self, cached_fs, memory_fs):
+        """Test that a file is downloaded again after it is modified."""
+        memory_fs.pipe("/bucket/data.txt", b"old")
+        assert cached_fs.cat("/bucket/data.txt") == b"old"
+        with cached_fs.open("/bucket/data.txt", mode="r") as cached_file:
+            assert cached_file.read() == "old"
+
+        time.sleep(0.01)
+        with cached_fs.open("/bucket/data.txt", mode="wb") as fs_file:
+            fs_file.write(b"new")
+
+        with cached_fs.open("/bucket/data.txt", mode="r") as cached_file:
+            assert cached_file.read() == "new"
+
+    def test_lru_eviction(self, memory_fs, tmp_path):
+        """Test that the least recently used files are evicted beyond max_size."""
+        cached_fs = CachedFileSystem(memory_fs, path=tmp_path, max_size=25)
+        for name in "abc":
+            memory_fs.pipe(f"/bucket/{name}.bin", b"x" * 10)
+
+        first = cached_fs.fetch("/bucket/a.bin")
+        second = cached_fs.fetch("/bucket/b.bin")
+        # make the first file the most recently used one
+        os.utime(second, (time.time() - 60, time.time() - 60))
+        cached_fs.fetch("/bucket/a.bin")
+        third = cached_fs.fetch("/bucket/c.bin")
+
+        assert sorted(os.listdir(tmp_path)) == sorted(
+            os.path.basename(entry) for entry in [first, third]
+        )
+
+    def test_failed_download(self, cached_fs, memory_fs, mocker, tmp_path):
+        """Test that partially downloaded files are not left in the cache."""
+        memory_fs.pipe("/bucket/data.bin", b"data")
+        mocker.patch.object(memory_fs, "get_file", side_effect=OSError("lost"))
+
+        with pytest.raises(OSError, match="lost"):
+            cached_fs.fetch("/bucket/data.bin")
+        assert not os.listdir(tmp_path / "cache")
+
+    def test_open_args(self, cached_fs, memory_fs):
+        """Test that arguments of ``open`` such as the encoding are passed on."""
+        memory_fs.pipe("/bucket/data.txt", "café".encode("latin-1"))
+        with cached_fs.open("/bucket/data.txt", mode="r", encoding="latin-1") as f:
+            assert f.read() == "café"
+
+    def test_default_path(self, memory_fs, tmp_path, monkeypatch):
+        """Test that files are cached in a directory only accessible to the
+        current user by default."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setattr(
+            "kedro_datasets._local_cache.DEFAULT_CACHE_DIR", user_cache_dir("fs")
+        )
+        memory_fs.pipe("/bucket/data.bin", b"data")
+
+        entry = CachedFileSystem(memory_fs).fetch("/bucket/data.bin")
+        cache_dir = tmp_path / "kedro-datasets" / "fs"
+        assert os.path.dirname(entry) == str(cache_dir)
+        assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+
+    def test_path_owned_by_other_user(self, cached_fs, memory_fs, mocker):
+        memory_fs.pipe("/bucket/data.bin", b"data")
+        mocker.patch("os.getuid", return_value=os.getuid() + 1)
+        pattern = r"Refusing to use cache directory '.+', as it is not owned by"
+        with pytest.raises(DatasetError, match=pattern):
+            cached_fs.fetch("/bucket/data.bin")
+
+    def test_local_filesystem_not_cached(self):
+        fs = LocalFileSystem()
+        assert cached_filesystem(fs, {"max_size": 10}) is fs
+
+    @pytest.mark.parametrize("cache", [None, False, {}])
+    def test_cache_disabled(self, memory_fs, cache):
+        assert cached_filesystem(memory_fs, cache) is memory_fs
+
+    def test_cache_enabled(self, memory_fs, tmp_path):
+        cached_fs = cached_filesystem(memory_fs, {"path": str(tmp_path)})
+        assert isinstance(cached_fs, CachedFileSystem)
+        assert cached_fs.fs is memory_fs
+        assert isinstance(cached_filesystem(memory_fs, True), CachedFileSystem)
+
+    @pytest.mark.parametrize("copy_func", [copy.deepcopy, pickle_roundtrip])
+    def test_copy(self, cached_fs, memory_fs, copy_func):
+        """Test that the cached filesystem can be copied and pickled."""
+        memory_fs.pipe("/bucket/data.csv", b"col1\n1\n")
+        copied = copy_func(cached_fs)
+        assert isinstance(copied, CachedFileSystem)
+        assert copied._path == cached_fs._path
+        assert copied.cat("/bucket/data.csv") == b"col1\n1\n"
+
+
+class TestDatasetCache:
+    @pytest.mark.parametrize("copy_func", [copy.deepcopy, pickle_roundtrip])
+    def test_copy_dataset(self, memory_fs, tmp_path, copy_func):
+        """Test that datasets caching remote files can be copied and pickled,
+        e.g. by ``ParallelRunner``."""
+        data = pd.DataFrame({"col1": [1, 2], "col2": [4, 5]})
+        dataset = CSVDataset(
+            filepath="memory://bucket/data.csv",
+            fs_args={"cache": {"path": str(tmp_path)}},
+        )
+        dataset.save(data)
+        assert_frame_equal(copy_func(dataset).load(), data)
+
+    def test_csv_dataset(self, memory_fs, tmp_path, mocker):
+        """Test that remote CSV files are read from the local cache."""
+        data = pd.DataFrame({"col1": [1, 2], "col2": [4, 5]})
+        dataset = CSVDataset(
+            filepath="memory://bucket/data.csv",
+            fs_args={"cache": {"path": str(tmp_path)}},
+        )
+        dataset.save(data)
+        get_file = mocker.spy(memory_fs, "get_file")
+
+        for _ in range(2):
+            assert_frame_equal(dataset.load(), data)
+        get_file.assert_called_once()
+
+    def test_json_dataset(self, memory_fs, tmp_path, mocker):
+        """Test that remote JSON files are read from the local cache."""
+        data = pd.DataFrame({"col1": [1, 2], "col2": [4, 5]})
+        dataset = JSONDataset(
+            filepath="memory://bucket/data.json",
+            fs_args={"cache": {"path": str(tmp_path)}},
+        )
+        dataset.save(data)
+        get_file = mocker.spy(memory_fs, "get_file")
+
+        for _ in range(2):
+            assert_frame_equal(dataset.load(), data)
+        get_file.assert_called_once()
+
+    def test_parquet_dataset(self, memory_fs, tmp_path, mocker):
+        """Test that remote Parquet files are read from the local cache."""
+        data = pd.DataFrame({"col1": [1, 2], "col2": [4, 5]})
+        dataset = ParquetDataset(
+            filepath="memory://bucket/data.parquet",
+            fs_args={"cache": {"path": str(tmp_path)}},
+        )
+        dataset.save(data)
+        get_file = mocker.spy(memory_fs, "get_file")
+
+        for _ in range(2):
+            assert_frame_equal(dataset.load(), data)
+        get_file.assert_called_once()
+
+    def test_pickle_dataset(self, memory_fs, tmp_path, mocker):
+        """Test that remote pickle files are read from the local cache."""
+        dataset = PickleDataset(
+            filepath="memory://bucket/data.pkl",
+            fs_args={"cache": {"path": str(tmp_path)}},
+        )
+        dataset.save({"a": 1})
+        get_file = mocker.spy(memory_fs, "get_file")
+
+        for _ in range(2):
+            assert dataset.load() == {"a": 1}
+        get_file.assert_called_once()
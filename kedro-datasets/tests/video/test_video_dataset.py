@@ -1,4 +1,10 @@
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
 import boto3
+import numpy as np
 import pytest
 from kedro.io.core import DatasetError
 from moto import mock_s3
@@ -6,6 +12,7 @@ from utils import TEST_FPS, assert_videos_equal
 
 from kedro_datasets.video import VideoDataset
 from kedro_datasets.video.video_dataset import (
+    SIGNED_URL_EXPIRATION,
     FileVideo,
     SequenceVideo,
 )
@@ -36,6 +43,20 @@ def empty_dataset_avi(tmp_filepath_avi):
     return VideoDataset(filepath=tmp_filepath_avi)
 
 
+@pytest.fixture
+def http_server(filepath_mp4):
+    """Serve the directory of the test videos over http."""
+    handler = partial(
+        SimpleHTTPRequestHandler, directory=str(Path(filepath_mp4).parent)
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
 @pytest.fixture
 def mocked_s3_bucket():
     """Create a bucket for testing using moto."""
@@ -57,6 +78,17 @@ class TestVideoDataset:
         loaded_video = ds.load()
         assert_videos_equal(loaded_video, mp4_object)
 
+    def test_load_args(self, filepath_mp4, mp4_object):
+        """Test that the load arguments are passed to the loaded FileVideo"""
+        ds = VideoDataset(
+            filepath=filepath_mp4, load_args={"cache_size": 8, "prefetch": 4}
+        )
+        loaded_video = ds.load()
+        assert loaded_video._cache_size == 8
+        assert loaded_video._prefetch == 4
+        assert_videos_equal(loaded_video, mp4_object)
+        assert "load_args={'cache_size': 8, 'prefetch': 4}" in str(ds)
+
     def test_save_and_load_mp4(self, empty_dataset_mp4, mp4_object):
         """Test saving and reloading the data set."""
         empty_dataset_mp4.save(mp4_object)
@@ -107,6 +139,109 @@ class TestVideoDataset:
         reloaded_video = empty_dataset_mp4.load()
         assert_videos_equal(color_video, reloaded_video)
 
+    def test_save_array_video(self, color_video, empty_dataset_mp4):
+        """Test save (and load) a SequenceVideo of BGR arrays"""
+        frames = [np.asarray(frame)[:, :, ::-1] for frame in color_video]
+        empty_dataset_mp4.save(SequenceVideo(frames, fps=TEST_FPS, channel_order="BGR"))
+        reloaded_video = empty_dataset_mp4.load()
+        assert_videos_equal(color_video, reloaded_video)
+
+    def test_save_sliced_video(self, color_video, empty_dataset_mp4):
+        empty_dataset_mp4.save(color_video[1:4])
+        reloaded_video = empty_dataset_mp4.load()
+        assert_videos_equal(color_video[1:4], reloaded_video)
+
+    def test_save_remote(self, color_video, memory_fs, mocker):
+        """Test that a video is uploaded to a remote filesystem from a local file"""
+        put_file = mocker.spy(memory_fs, "put_file")
+        dataset = VideoDataset(filepath="memory://bucket/video.mp4")
+        dataset.save(color_video)
+
+        put_file.assert_called_once_with(mocker.ANY, str(dataset._filepath))
+        assert_videos_equal(color_video, dataset.load())
+
+    def test_load_local_in_place(self, filepath_mp4):
+        """Test that local videos are read without being copied"""
+        loaded_video = VideoDataset(filepath=filepath_mp4).load()
+        assert loaded_video._filepath == filepath_mp4
+
+    def test_load_remote_cached(self, color_video, memory_fs, tmp_path, mocker):
+        """Test that remote videos are downloaded to the configured cache once"""
+        dataset = VideoDataset(
+            filepath="memory://bucket/video.mp4",
+            fs_args={"cache": {"path": str(tmp_path / "cache")}},
+        )
+        dataset.save(color_video)
+        get_file = mocker.spy(memory_fs, "get_file")
+
+        for _ in range(2):
+            loaded_video = dataset.load()
+            assert_videos_equal(color_video, loaded_video)
+        get_file.assert_called_once()
+        assert loaded_video._filepath.startswith(str(tmp_path / "cache"))
+
+    def test_load_http(self, http_server, filepath_mp4, mp4_object):
+        """Test that http(s) videos are downloaded from their URL"""
+        dataset = VideoDataset(filepath=f"{http_server}/{Path(filepath_mp4).name}")
+        assert dataset.exists()
+        assert_videos_equal(dataset.load(), mp4_object)
+
+    def test_load_http_cached(self, http_server, filepath_mp4, mp4_object, tmp_path):
+        dataset = VideoDataset(
+            filepath=f"{http_server}/{Path(filepath_mp4).name}",
+            fs_args={"cache": {"path": str(tmp_path / "cache")}},
+        )
+        loaded_video = dataset.load()
+        assert_videos_equal(loaded_video, mp4_object)
+        assert loaded_video._filepath.startswith(str(tmp_path / "cache"))
+
+    def test_load_remote_not_cached(self, color_video, memory_fs, tmp_path, mocker):
+        """Test that remote videos are not cached unless configured"""
+        mocker.patch("kedro_datasets._local_cache.DEFAULT_CACHE_DIR", tmp_path)
+        dataset = VideoDataset(filepath="memory://bucket/video.mp4")
+        dataset.save(color_video)
+        assert_videos_equal(color_video, dataset.load())
+        assert not list(tmp_path.iterdir())
+
+    def test_range_read_http(self, mocker):
+        """Test that http(s) videos are read from their URL with range reads"""
+        mock_video = mocker.patch("kedro_datasets.video.video_dataset.FileVideo")
+        dataset = VideoDataset(
+            filepath="https://example.com/video.mp4",
+            load_args={"range_read": True, "prefetch": 4},
+        )
+        assert dataset.load() is mock_video.return_value
+        mock_video.assert_called_once_with("https://example.com/video.mp4", prefetch=4)
+
+    def test_range_read_signed_url(self, memory_fs, mocker):
+        """Test that videos on object stores are read from a signed URL"""
+        mock_video = mocker.patch("kedro_datasets.video.video_dataset.FileVideo")
+        sign = mocker.patch.object(
+            memory_fs, "sign", return_value="https://bucket.example.com/video.mp4?sig"
+        )
+        dataset = VideoDataset(
+            filepath="memory://bucket/video.mp4", load_args={"range_read": True}
+        )
+        dataset.load()
+        sign.assert_called_once_with(
+            str(dataset._filepath), expiration=SIGNED_URL_EXPIRATION
+        )
+        mock_video.assert_called_once_with("https://bucket.example.com/video.mp4?sig")
+
+    def test_range_read_not_supported(self):
+        dataset = VideoDataset(
+            filepath="memory://bucket/video.mp4", load_args={"range_read": True}
+        )
+        pattern = r"Range reads are not supported for protocol 'memory'"
+        with pytest.raises(DatasetError, match=pattern):
+            dataset.load()
+
+    def test_range_read_local(self, filepath_mp4, mp4_object):
+        """Test that local videos are read in place with range reads"""
+        dataset = VideoDataset(filepath=filepath_mp4, load_args={"range_read": True})
+        assert_videos_equal(dataset.load(), mp4_object)
+        assert "range_read" not in str(dataset)
+
     def test_exists(self, empty_dataset_mp4, mp4_object):
         """Test `exists` method invocation for both existing and
         nonexistent data set."""
@@ -1,3 +1,4 @@
+import cv2
 import numpy as np
 import pytest
 from utils import (
@@ -71,6 +72,44 @@ class TestSequenceVideo:
         )
         assert color_video_new.fourcc == fourcc_new
 
+    def test_sequence_video_of_arrays(self, color_video):
+        """Test that array frames are used as given, without copies"""
+        frames = [np.asarray(frame)[:, :, ::-1].copy() for frame in color_video]
+        video = SequenceVideo(frames, fps=TEST_FPS, channel_order="BGR")
+        assert video.size == (TEST_WIDTH, TEST_HEIGHT)
+        assert video.channel_order == "BGR"
+        assert video[0] is frames[0]
+        assert all(
+            array is frame for array, frame in zip(video.iter_arrays("BGR"), frames)
+        )
+        for array, frame in zip(video.iter_arrays(), color_video):
+            np.testing.assert_array_equal(array, np.asarray(frame))
+
+    @pytest.mark.parametrize("channel_order", ["RGB", "BGR"])
+    def test_sequence_video_iter_arrays(self, color_video, channel_order):
+        """Test converting PIL frames to arrays with either channel order"""
+        arrays = list(color_video.iter_arrays(channel_order))
+        assert len(arrays) == TEST_NUM_COLOR_FRAMES
+        for array, frame in zip(arrays, color_video):
+            expected = np.asarray(frame)
+            if channel_order == "BGR":
+                expected = expected[:, :, ::-1]
+            assert array.dtype == np.uint8
+            assert array.flags.c_contiguous
+            np.testing.assert_array_equal(array, expected)
+
+    def test_iter_arrays_of_other_modes(self, red_frame):
+        video = SequenceVideo([red_frame.convert("RGBA")], fps=TEST_FPS)
+        (array,) = video.iter_arrays("BGR")
+        np.testing.assert_array_equal(array[0, 0], [0, 0, 255])
+
+    def test_invalid_channel_order(self, color_video):
+        pattern = r"Invalid channel order 'RGBA', expected one of RGB, BGR\."
+        with pytest.raises(ValueError, match=pattern):
+            SequenceVideo(color_video._frames, fps=TEST_FPS, channel_order="RGBA")
+        with pytest.raises(ValueError, match=pattern):
+            color_video.iter_arrays("RGBA")
+
 
 class TestGeneratorVideo:
     def test_generator_video_iterable(self, color_video_generator, color_video):
@@ -116,6 +155,12 @@ class TestGeneratorVideo:
         )
         assert color_video_new.fourcc == fourcc_new
 
+    def test_generator_video_of_arrays(self, color_video):
+        frames = [np.asarray(frame) for frame in color_video]
+        video = GeneratorVideo(iter(frames), length=len(frames), fps=TEST_FPS)
+        assert video.size == (TEST_WIDTH, TEST_HEIGHT)
+        assert all(array is frame for array, frame in zip(video.iter_arrays(), frames))
+
 
 class TestFileVideo:
     @pytest.mark.skip(reason="Can't deal with videos with missing time info")
@@ -146,6 +191,10 @@ class TestFileVideo:
     def test_file_index_last(self, color_video_object, purple_frame):
         assert_images_equal(color_video_object[-1], purple_frame)
 
+    def test_file_video_missing_file(self, tmp_path):
+        with pytest.raises(ValueError, match="Failed to open video"):
+            FileVideo(str(tmp_path / "missing.mp4"))
+
     def test_file_video_failed_capture(self, mocker):
         """Validate good behavior on failed decode
 
@@ -156,11 +205,135 @@ class TestFileVideo:
         mock_cv2 = mocker.patch("kedro_datasets.video.video_dataset.cv2")
         mock_cap = mock_cv2.VideoCapture.return_value = mocker.Mock()
         mock_cap.get.return_value = 2  # Set the length of the video
+        mock_cv2.cvtColor.side_effect = lambda frame, code: frame
         ds = FileVideo("/a/b/c")
 
-        mock_cap.read.return_value = True, np.zeros((1, 1))
+        mock_cap.read.return_value = True, np.zeros((1, 1, 3), dtype=np.uint8)
         assert ds[0]
 
         mock_cap.read.return_value = False, None
         with pytest.raises(IndexError):
             ds[1]
+
+    def test_file_video_iter_arrays_failed_capture(self, mocker):
+        """Test that iterating stops at the first frame which can't be decoded"""
+        mock_cv2 = mocker.patch("kedro_datasets.video.video_dataset.cv2")
+        mock_cap = mock_cv2.VideoCapture.return_value = mocker.Mock()
+        mock_cap.get.return_value = 2  # Set the length of the video
+        mock_cap.read.side_effect = [(True, np.zeros((1, 1, 3))), (False, None)]
+
+        assert len(list(FileVideo("/a/b/c").iter_arrays("BGR"))) == 1
+        mock_cap.release.assert_called_once()
+
+
+class TestFileVideoBatches:
+    @pytest.fixture
+    def mp4_frames(self, filepath_mp4):
+        """All frames of the video, decoded in order"""
+        return np.stack([np.asarray(frame) for frame in FileVideo(filepath_mp4)])
+
+    def test_get_frames(self, mp4_object, mp4_frames):
+        """Test getting frames out of order, repeated and counted from the end"""
+        indices = [50, 3, 3, 100, 4, -1, 0]
+        frames = mp4_object.get_frames(indices)
+        assert frames.dtype == np.uint8
+        assert frames.shape == (len(indices), MP4_SIZE[1], MP4_SIZE[0], 3)
+        np.testing.assert_array_equal(frames, mp4_frames[indices])
+
+    def test_get_no_frames(self, mp4_object):
+        assert mp4_object.get_frames([]).shape == (0, MP4_SIZE[1], MP4_SIZE[0], 3)
+
+    @pytest.mark.parametrize("index", [MP4_LEN, -MP4_LEN - 1])
+    def test_get_frames_out_of_range(self, mp4_object, index):
+        with pytest.raises(IndexError):
+            mp4_object.get_frames([0, index])
+
+    def test_get_frames_seeks(self, mp4_object, mp4_frames, mocker):
+        """Test that frames a short distance ahead are decoded without seeking"""
+        cap = mp4_object._cap = mocker.Mock(wraps=mp4_object._cap)
+        indices = [2, 10, 20, 90]
+        np.testing.assert_array_equal(
+            mp4_object.get_frames(indices), mp4_frames[indices]
+        )
+        assert cap.set.call_count == 1  # Only for the last frame
+        assert cap.read.call_count == len(indices)
+
+    def test_get_frames_failed_skip(self, mp4_object, mp4_frames, mocker):
+        """Test that the frame after a failed grab is seeked to"""
+        cap = mp4_object._cap = mocker.Mock(wraps=mp4_object._cap)
+        cap.grab.side_effect = [True, False]
+        with pytest.raises(IndexError):
+            mp4_object.get_frames([5])
+
+        cap.grab.side_effect = None
+        np.testing.assert_array_equal(mp4_object.get_frames([6]), mp4_frames[[6]])
+        cap.set.assert_called_once_with(cv2.CAP_PROP_POS_FRAMES, 6)
+
+    def test_get_frames_failed_read(self, mp4_object, mp4_frames, mocker):
+        """Test that the frame after a failed read is seeked to"""
+        cap = mp4_object._cap = mocker.Mock(wraps=mp4_object._cap)
+        cap.read.side_effect = [(False, None)]
+        with pytest.raises(IndexError):
+            mp4_object.get_frames([0])
+
+        cap.read.side_effect = None
+        np.testing.assert_array_equal(mp4_object.get_frames([1]), mp4_frames[[1]])
+        cap.set.assert_called_once_with(cv2.CAP_PROP_POS_FRAMES, 1)
+
+    def test_sliced_get_frames(self, mp4_object, mp4_frames):
+        sliced_video = mp4_object[10::5]
+        np.testing.assert_array_equal(
+            sliced_video.get_frames([0, 2, -1]), mp4_frames[[10, 20, 105]]
+        )
+
+    def test_sequence_get_frames(self, color_video, red_frame, purple_frame):
+        frames = color_video.get_frames([-1, 0])
+        np.testing.assert_array_equal(frames[0], np.asarray(purple_frame))
+        np.testing.assert_array_equal(frames[1], np.asarray(red_frame))
+
+    def test_frame_cache(self, filepath_mp4, mp4_frames, mocker):
+        """Test that the most recently used frames are not decoded again"""
+        video = FileVideo(filepath_mp4, cache_size=2)
+        cap = video._cap = mocker.Mock(wraps=video._cap)
+        for index in [0, 60, 0, 30, 0, 60]:
+            np.testing.assert_array_equal(np.asarray(video[index]), mp4_frames[index])
+        # Frame 60 was evicted when frame 30 was decoded
+        assert cap.read.call_count == 4
+
+    def test_prefetch(self, filepath_mp4, mp4_frames):
+        video = FileVideo(filepath_mp4, prefetch=4)
+        frames = np.stack([np.asarray(frame) for frame in video])
+        np.testing.assert_array_equal(frames, mp4_frames)
+
+    def test_prefetch_stopped(self, filepath_mp4, mp4_frames):
+        """Test that the decoding thread stops when the iteration is interrupted"""
+        video = FileVideo(filepath_mp4, prefetch=2)
+        frames = iter(video)
+        np.testing.assert_array_equal(np.asarray(next(frames)), mp4_frames[0])
+        # Indexing the video while iterating does not move the prefetching decoder
+        np.testing.assert_array_equal(np.asarray(video[50]), mp4_frames[50])
+        np.testing.assert_array_equal(np.asarray(next(frames)), mp4_frames[1])
+        frames.close()
+
+    @pytest.mark.parametrize("prefetch", [0, 2])
+    def test_iter_arrays(self, filepath_mp4, mp4_frames, prefetch):
+        video = FileVideo(filepath_mp4, prefetch=prefetch)
+        np.testing.assert_array_equal(np.stack(list(video.iter_arrays())), mp4_frames)
+        np.testing.assert_array_equal(
+            np.stack(list(video.iter_arrays("BGR"))), mp4_frames[..., ::-1]
+        )
+
+    def test_sliced_iter_arrays(self, mp4_object, mp4_frames):
+        """Test that only the frames of the slice are iterated over"""
+        arrays = list(mp4_object[10:40:10].iter_arrays("BGR"))
+        np.testing.assert_array_equal(
+            np.stack(arrays), mp4_frames[10:40:10, :, :, ::-1]
+        )
+
+    def test_prefetch_failed_decode(self, filepath_mp4, mocker):
+        mocker.patch(
+            "kedro_datasets.video.video_dataset.cv2.cvtColor",
+            side_effect=ValueError("decode failed"),
+        )
+        with pytest.raises(ValueError, match="decode failed"):
+            list(FileVideo(filepath_mp4, prefetch=2))